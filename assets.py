@@ -0,0 +1,83 @@
+# ------------------- IMPORTS ------------------- #
+import pygame                # Fonts
+from sprite_cache import RocketSpriteCache  # Pre-rendered rocket sprites
+from effects import explosion_atlas         # Pre-rendered explosion frames
+from starfield import Starfield             # NumPy parallax starfield
+
+# Font sizes used by the game screens (initials, round HUD, game over)
+FONT_SIZES = (100, 55, 50, 26)
+# Flame lengths the rockets breathe through: 20 ± 10 (see space_game.draw_frame)
+FLAME_LENGTHS = range(10, 31)
+
+
+# ------------------- ASSETS ------------------- #
+class Assets:
+    """Fonts, rocket sprites, explosion frames and stars, made once for the whole game.
+
+    Everything is created on first use, so an Assets works without a warm-up;
+    `warm_up` just creates it all up front (behind a loading bar), so the
+    first round and the first explosion don't stutter.
+    """
+
+    font_sizes = FONT_SIZES
+
+    def __init__(self, width, height, **star_options):
+        self.width = width
+        self.height = height
+        self.star_options = star_options   # Passed on to Starfield (speeds, stars_per_layer, ...)
+        self.fonts = {}
+        self.rockets = RocketSpriteCache()
+        self.explosions = explosion_atlas()   # The atlas every Explosion plays from
+        self._stars = None
+
+    def font(self, size):
+        """The default font at this size (looked up once, then shared)."""
+        font = self.fonts.get(size)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.SysFont(None, size)
+            self.fonts[size] = font
+        return font
+
+    def stars(self, seed=None):
+        """The starfield. With a seed, scattered as a new Starfield(seed) would be;
+        without one, the stars stay where they are.
+
+        There is only one: each round reseeds it instead of allocating a new one.
+        """
+        if self._stars is None:
+            self._stars = Starfield(self.width, self.height, seed=seed, **self.star_options)
+        elif seed is not None:
+            self._stars.reseed(seed)
+        return self._stars
+
+    def steps(self):
+        """What `warm_up` does, as (name, function) pairs."""
+        steps = [(f"font {size}", lambda size=size: self.font(size)) for size in self.font_sizes]
+        steps.append(("rockets", lambda: self.rockets.build(FLAME_LENGTHS)))
+        steps += [(f"explosion {variant}", lambda variant=variant: self.explosions.frames(variant))
+                  for variant in range(self.explosions.variant_count)]
+        steps.append(("stars", self.stars))
+        return steps
+
+    def warm_up(self, progress=None):
+        """Create every asset now. progress(done, total, name) is called after each step."""
+        steps = self.steps()
+        for done, (name, step) in enumerate(steps, 1):
+            step()
+            if progress is not None:
+                progress(done, len(steps), name)
+        return self
+
+
+def draw_loading_bar(screen, done, total, color=(255, 255, 0)):
+    """A thin progress bar across the middle of the window (use as warm_up progress)."""
+    width, height = screen.get_size()
+    outline = pygame.Rect(width // 4, height // 2 - 10, width // 2, 20)
+    bar = outline.inflate(-6, -6)
+    bar.width = bar.width * done // total
+    pygame.draw.rect(screen, color, outline, 2)
+    pygame.draw.rect(screen, color, bar)
+    pygame.display.update(outline)
+    pygame.event.pump()          # Keep the window responsive while loading
@@ -0,0 +1,71 @@
+# ------------------- IMPORTS ------------------- #
+import os                    # Reading the opt-in environment variable
+import numpy as np           # Picks targets among hundreds of ships in one pass
+from simulation import Controls, IDLE
+
+# Set SPACE_GAME_AUTOPILOT=1 to let the bot play in the game window.
+AUTOPILOT_ENV = "SPACE_GAME_AUTOPILOT"
+
+# ------------------- POLICIES ------------------- #
+# A policy (or "pilot") is anything callable as  policy(world) -> Controls.
+# It is asked once per tick, before world.step, and may read anything on the
+# World (ships, lasers, player_y, rules) but should not change it.
+#
+#   simulation.play_round(seed, policy)      headless
+#   space_game.run_game(screen, pilot=policy) in the game window
+#
+# Policies with their own randomness must seed it, so rounds stay replayable.
+
+
+class NearestThreatBot:
+    """Flies to the ship that will get past first and shoots everything in line.
+
+    Each tick, for all ships at once:
+      - the target is the ship with the fewest ticks left before it reaches
+        the left edge (x / speed) that the bot can still get in line with
+        in time, and the bot moves towards its height;
+      - it fires when there are more ships in its lane (within hit range of
+        its height, already on screen) than lasers flying down that lane.
+
+    Cost per tick is a few array operations, whatever the number of ships.
+    """
+
+    def __init__(self, max_shots=1):
+        self.max_shots = max_shots   # Shots per tick at most
+
+    def __call__(self, world):
+        ships = world.ships
+        if len(ships) == 0:
+            return IDLE
+        r = world.rules
+        half = r.hit_half_size
+        py = world.player_y
+        x, y = ships.x, ships.y
+
+        # --- Move towards the most urgent ship we can still get to --- #
+        step = world.player_speed
+        ticks_left = x / np.maximum(-ships.speed, 1e-9)
+        reachable = np.abs(y - py) / step < ticks_left
+        urgency = np.where(reachable, ticks_left, np.inf) if reachable.any() else ticks_left
+        target_y = float(y[int(np.argmin(urgency))])
+        up = target_y < py - step / 2 and py - step >= 0
+        down = target_y > py + step / 2 and py + step <= r.height
+
+        # --- Fire while the lane has more ships than lasers --- #
+        in_lane = (np.abs(y - py) < half) & (x > r.laser_start_x) & (x < r.width)
+        ships_in_lane = int(np.count_nonzero(in_lane))
+        if ships_in_lane == 0:
+            return Controls(up, down, 0)
+        lasers = world.lasers
+        slots = lasers.live_slots()
+        ahead = (np.abs(lasers.y[slots] - py) < half) & (lasers.x[slots] < x[in_lane].max())
+        lasers_in_lane = int(np.count_nonzero(ahead))
+        shots = min(self.max_shots, max(0, ships_in_lane - lasers_in_lane))
+        return Controls(up, down, shots)
+
+
+def pilot_from_env():
+    """A NearestThreatBot if SPACE_GAME_AUTOPILOT is set, else None (keyboard)."""
+    if os.environ.get(AUTOPILOT_ENV, "") in ("", "0"):
+        return None
+    return NearestThreatBot()
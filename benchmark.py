@@ -0,0 +1,196 @@
+# ------------------- IMPORTS ------------------- #
+import argparse              # Command line options
+import json                  # Machine-readable results
+import os                    # Dummy video driver, output paths
+import platform              # Machine info in the results
+import random                # Positions of the pre-placed objects
+import subprocess            # Git commit of the code being measured
+import sys                   # Exit code on regressions
+import time                  # Date + total time
+from dataclasses import replace
+
+# No window needed: SDL draws into memory (must be set before pygame starts)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np           # Percentiles
+import pygame
+
+import space_game            # The real per-tick update and frame drawing
+from effects import Explosions
+from sprite_cache import RocketSpriteCache
+from starfield import Starfield
+from simulation import World, Controls, IDLE
+from profiler import FrameProfiler, FRAME_PHASES, PERCENTILES
+from dirty_render import DirtyRenderer
+
+# name → what is on screen. Every scenario runs the same frame as the game:
+# one tick (world, stars, explosions), then the full draw and a display update.
+SCENARIOS = {
+    "enemies_10":     {"enemies": 10},
+    "enemies_200":    {"enemies": 200},
+    "enemies_2000":   {"enemies": 2000},
+    "laser_fire":     {"enemies": 200, "fire": 2},
+    "explosions_500": {"enemies": 10, "explosions": 500},
+    "stars_10k":      {"enemies": 10, "stars": 10000},
+}
+
+
+# ------------------- SCENARIO SETUP ------------------- #
+def build_world(enemies, seed):
+    """A world with `enemies` ships spread over the screen (not just off the edge)."""
+    rules = replace(space_game.game_rules(), start_ships=enemies, max_ships=enemies)
+    world = World(rules, seed)
+    rng = np.random.default_rng(seed)
+    world.ships.x[:] = rng.uniform(rules.width * 0.3, rules.width, len(world.ships))
+    return world
+
+
+def keep_ships_on_screen(world):
+    """Ships about to reach the player go back to the right, so the round never ends."""
+    xs = world.ships.x
+    xs[xs < 150] += world.rules.width - 150
+
+
+def pilot(fire):
+    """Sweeps up and down the screen, firing `fire` shots every tick."""
+    def controls(tick):
+        going_up = (tick // 60) % 2 == 0
+        return Controls(going_up, not going_up, fire) if fire else IDLE
+    return controls
+
+
+# ------------------- RUNNING ------------------- #
+def run_scenario(screen, enemies=10, fire=0, explosions=0, stars=None,
+                 frames=600, warmup=60, seed=0, dirty_rects=False):
+    """Play `warmup` + `frames` uncapped frames. Returns the timings as a dict."""
+    world = build_world(enemies, seed)
+    per_layer = (stars or 0) // len(space_game.STAR_LAYERS) or space_game.STARS_PER_LAYER
+    starfield = Starfield(space_game.WIDTH, space_game.HEIGHT, speeds=space_game.STAR_LAYERS,
+                          stars_per_layer=per_layer, seed=seed)
+    rockets = RocketSpriteCache()
+    font = pygame.font.SysFont(None, 55)
+    profile_font = pygame.font.SysFont(None, 26)
+    view = DirtyRenderer(screen, enabled=dirty_rects)
+    controls = pilot(fire)
+
+    rng = random.Random(seed)
+    fx = Explosions()
+    for n in range(explosions):
+        i = fx.spawn(rng.randrange(space_game.WIDTH), rng.randrange(space_game.HEIGHT))
+        fx.store.age[i] = n % fx.atlas.frame_count   # Staggered, like a real fight
+
+    profiler = FrameProfiler(FRAME_PHASES, window=frames)
+    world.profiler = profiler
+    start = None
+    for n in range(warmup + frames):
+        if n == warmup:
+            profiler.frames = 0
+            start = time.perf_counter()
+        profiler.begin_frame()
+        pygame.event.pump()
+        profiler.mark("events")
+
+        space_game.advance_world(world, controls(world.tick), starfield, fx, profiler)
+        keep_ships_on_screen(world)
+        while len(fx) < explosions:   # Keep the same number on screen
+            fx.spawn(rng.randrange(space_game.WIDTH), rng.randrange(space_game.HEIGHT))
+
+        space_game.draw_frame(screen, view, world, starfield, rockets, fx, 1.0,
+                              font, profile_font, profiler)
+        view.present()
+        profiler.mark("flip")
+        profiler.end_frame()
+    elapsed = time.perf_counter() - start
+
+    frame_ms = profiler.history()[:, -1] * 1000.0
+    return {
+        "frames": frames,
+        "fps": round(frames / elapsed, 1),
+        "frame_ms": {
+            "mean": round(float(frame_ms.mean()), 3),
+            **{f"p{p}": round(float(v), 3) for p, v in zip(PERCENTILES, np.percentile(frame_ms, PERCENTILES))},
+        },
+        "phases_ms": {name: values for name, values in profiler.percentiles().items() if name != "frame"},
+        "kills": world.score,
+    }
+
+
+def machine_info():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "machine": platform.platform(),
+        "video_driver": pygame.display.get_driver(),
+        "percentiles": list(PERCENTILES),
+    }
+
+
+def compare(results, baseline, max_drop):
+    """Print fps against a baseline run. Returns the scenarios that got slower than allowed."""
+    slower = []
+    for name, result in results["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if old is None:
+            continue
+        change = result["fps"] / old["fps"] - 1.0
+        flag = ""
+        if change < -max_drop:
+            slower.append(name)
+            flag = "  << REGRESSION"
+        print(f"{name:<16}{old['fps']:>9.1f} → {result['fps']:>9.1f} fps ({change:+.1%}){flag}", file=sys.stderr)
+    return slower
+
+
+# ------------------- COMMAND LINE ------------------- #
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the game loop (no window, no frame cap).")
+    parser.add_argument("scenarios", nargs="*", default=list(SCENARIOS), help="default: all")
+    parser.add_argument("--frames", type=int, default=600, help="measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=60, help="unmeasured frames first")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dirty-rects", action="store_true", help="use the dirty-rect renderer")
+    parser.add_argument("--output", "-o", help="write JSON here (default: print it)")
+    parser.add_argument("--baseline", help="JSON of an earlier run to compare fps against")
+    parser.add_argument("--max-drop", type=float, default=0.10,
+                        help="fail if fps dropped by more than this fraction (with --baseline)")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)} (known: {', '.join(SCENARIOS)})")
+
+    pygame.init()
+    screen = pygame.display.set_mode((space_game.WIDTH, space_game.HEIGHT))
+    results = {"machine": machine_info(), "scenarios": {}}
+    for name in args.scenarios:
+        result = run_scenario(screen, frames=args.frames, warmup=args.warmup, seed=args.seed,
+                              dirty_rects=args.dirty_rects, **SCENARIOS[name])
+        results["scenarios"][name] = result
+        print(f"{name:<16}{result['fps']:>9.1f} fps   p50 {result['frame_ms']['p50']:.2f} ms"
+              f"   p99 {result['frame_ms']['p99']:.2f} ms", file=sys.stderr)
+    pygame.quit()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.max_drop):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# ------------------- IMPORTS ------------------- #
+import numpy as np           # Batched box-vs-box hit tests
+
+# Below this many pairs, testing all of them at once is cheapest; above it,
+# enemies go into a y-band grid and each laser only sees its own bands.
+BROADCAST_MAX_PAIRS = 4096
+
+
+# ------------------- SPATIAL HASH ------------------- #
+class SpatialHash:
+    """Uniform grid of horizontal bands, keyed on y.
+
+    Every box is filed under band = top // band_height. A query only looks at
+    the few bands that can reach the given y range, so a laser is tested
+    against the ships at its height instead of against every ship on screen.
+
+    The grid is built in one pass from arrays of top/bottom edges, and boxes
+    are kept sorted by band (ties in insertion order), so each band is one
+    contiguous slice. Queries return indices into the arrays that were filed,
+    in insertion order, so "first hit wins" loops keep their old answer.
+    """
+
+    def __init__(self, top, bottom, band_height=None):
+        top = np.asarray(top, dtype=np.float64)
+        bottom = np.asarray(bottom, dtype=np.float64)
+        # A box can start up to `tallest` above the range it reaches into
+        self.tallest = float((bottom - top).max()) if len(top) else 0.0
+        if band_height is None:
+            band_height = max(self.tallest / 4, 1.0)   # Thin bands → few extra candidates
+        self.band_height = band_height
+        bands = np.floor(top / band_height).astype(np.int64)
+        self.order = np.argsort(bands, kind="stable")
+        self.bands = bands[self.order]
+
+    def __len__(self):
+        return len(self.order)
+
+    def _slices(self, top, bottom):
+        """First and last+1 position in `order` of the boxes each range can reach."""
+        first = np.floor((top - self.tallest) / self.band_height).astype(np.int64)
+        last = np.floor(bottom / self.band_height).astype(np.int64)
+        lo = np.searchsorted(self.bands, first, side="left")
+        hi = np.searchsorted(self.bands, last, side="right")
+        return lo, hi
+
+    def query(self, top, bottom):
+        """Indices of every box that could overlap rows top..bottom, in insertion order.
+
+        This is only the broad phase: callers still run their exact test.
+        """
+        lo, hi = self._slices(np.float64(top), np.float64(bottom))
+        return np.sort(self.order[lo:hi])
+
+    def pairs(self, top, bottom):
+        """Candidate (range index, box index) pairs for many ranges at once.
+
+        Same boxes as calling `query` for every range, grouped by range; within
+        a range they come band by band (sort them if the order matters).
+        """
+        lo, hi = self._slices(np.asarray(top, dtype=np.float64),
+                              np.asarray(bottom, dtype=np.float64))
+        counts = np.maximum(hi - lo, 0)
+        total = int(counts.sum())
+        if total == 0:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+        ai = np.repeat(np.arange(len(lo)), counts)
+        first = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        bi = self.order[first + np.arange(total)]
+        return ai, bi
+
+
+# ------------------- BATCHED HIT TEST ------------------- #
+def box_hits(a_left, a_top, a_right, a_bottom, b_left, b_top, b_right, b_bottom,
+             one_per_a=True):
+    """Find which boxes of group A (lasers) hit which boxes of group B (enemies).
+
+    Boxes are given as arrays of edges. Two boxes hit when they overlap
+    (strictly, like pygame.Rect.colliderect); a box with no width/height is a
+    point, so e.g. a laser tip can be tested against ship boxes.
+
+    Returns (a_index, b_index) arrays of the hits that count, in the order a
+    loop "for each a, for each b" would find them:
+      - every B is hit at most once (the first A that reaches it wins);
+      - with one_per_a, an A stops at its first B (a laser is used up),
+        otherwise it takes every B it overlaps that is still there.
+
+    Candidates come from broadcasting (few pairs) or from a SpatialHash of
+    the B boxes (many pairs); only the actual overlaps are looked at one by one.
+    """
+    na, nb = len(a_left), len(b_left)
+    if na == 0 or nb == 0:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+
+    a_left, a_top, a_right, a_bottom = (np.asarray(v, dtype=np.float64) for v in
+                                        (a_left, a_top, a_right, a_bottom))
+    b_left, b_top, b_right, b_bottom = (np.asarray(v, dtype=np.float64) for v in
+                                        (b_left, b_top, b_right, b_bottom))
+    if na * nb <= BROADCAST_MAX_PAIRS:
+        overlap = ((a_left[:, None] < b_right[None, :]) & (b_left[None, :] < a_right[:, None])
+                   & (a_top[:, None] < b_bottom[None, :]) & (b_top[None, :] < a_bottom[:, None]))
+        ai, bi = np.nonzero(overlap)   # Already ordered by a, then b
+    else:
+        ai, bi = SpatialHash(b_top, b_bottom).pairs(a_top, a_bottom)
+        hit = ((a_left[ai] < b_right[bi]) & (b_left[bi] < a_right[ai])
+               & (a_top[ai] < b_bottom[bi]) & (b_top[bi] < a_bottom[ai]))
+        by_a_then_b = np.lexsort((bi[hit], ai[hit]))
+        ai, bi = ai[hit][by_a_then_b], bi[hit][by_a_then_b]
+    if len(ai) <= 1:
+        return ai, bi   # Nothing to resolve (the common case: no hit at all)
+
+    # Resolve in loop order: only real overlaps get here, usually a handful
+    keep = np.zeros(len(ai), dtype=bool)
+    b_taken = set()
+    a_done = set()
+    for n, (a, b) in enumerate(zip(ai.tolist(), bi.tolist())):
+        if b in b_taken or a in a_done:
+            continue
+        keep[n] = True
+        b_taken.add(b)
+        if one_per_a:
+            a_done.add(a)
+    return ai[keep], bi[keep]
+
@@ -0,0 +1,171 @@
+# ------------------- IMPORTS ------------------- #
+import argparse              # Command line: the grid to sweep
+import itertools             # Every combination of the grid values
+import json                  # --json output
+import os                    # Number of cores
+import sys                   # Progress + throughput on stderr
+import time                  # Measuring rounds per second
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import fields, replace
+import numpy as np           # Score / survival distributions
+from simulation import Rules, IDLE, play_round, random_pilot
+from autopilot import NearestThreatBot
+
+TICKS_PER_SECOND = 60        # One game tick = one frame of space_game.py
+PERCENTILES = (10, 50, 90)
+CHUNK_ROUNDS = 20            # Rounds per job: enough work to hide the trip to the worker
+
+
+# ------------------- PILOTS ------------------- #
+def idle_pilot(seed=None):
+    """Pilot that never moves or fires (how long do the ships take to get through?)."""
+    def pilot(world):
+        return IDLE
+    return pilot
+
+
+# name → factory(seed) → pilot(world). Workers build pilots by name, since
+# closures can't be sent to another process.
+PILOTS = {
+    "random": random_pilot,
+    "idle": idle_pilot,
+    "nearest": lambda seed: NearestThreatBot(),
+}
+
+
+# ------------------- GRID ------------------- #
+def parse_grid(specs):
+    """['ship_speed=4,5,6', ...] → {'ship_speed': [4, 5, 6], ...} (Rules fields only)."""
+    types = {f.name: f.type for f in fields(Rules)}
+    grid = {}
+    for spec in specs:
+        name, sep, values = spec.partition("=")
+        if not sep or name not in types:
+            raise ValueError(f"expected <rule>=<v1,v2,...> with a Rules field, got {spec!r}")
+        cast = types[name] if callable(types[name]) else int
+        grid[name] = [cast(v) for v in values.split(",") if v]
+    return grid
+
+
+def grid_points(grid):
+    """Every combination of the grid values, as dicts of Rules overrides."""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+
+# ------------------- WORKERS ------------------- #
+def play_chunk(overrides, pilot, seeds, max_ticks):
+    """Play one round per seed (runs in a worker process).
+
+    Returns an array with a row per round: score, ticks survived, and 1 if
+    the round ended (0 if it was still going at max_ticks).
+    """
+    rules = replace(Rules(), **overrides)
+    make_pilot = PILOTS[pilot]
+    out = np.zeros((len(seeds), 3), dtype=np.int64)
+    for n, seed in enumerate(seeds):
+        world = play_round(seed, make_pilot(seed), rules, max_ticks)
+        out[n] = world.score, world.tick, world.over
+    return out
+
+
+def describe(values):
+    return {
+        "mean": round(float(values.mean()), 2),
+        **{f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))},
+        "max": round(float(values.max()), 2),
+    }
+
+
+def summarize(rounds):
+    """Score and survival-time distributions of one grid point."""
+    scores, ticks, over = rounds.T
+    return {
+        "rounds": len(rounds),
+        "still_alive": int(len(rounds) - over.sum()),   # Hit max_ticks
+        "score": describe(scores),
+        "survival_s": describe(ticks / TICKS_PER_SECOND),
+    }
+
+
+def sweep(grid, rounds=100, pilot="nearest", seed=0, max_ticks=20_000, workers=None,
+          chunk_rounds=CHUNK_ROUNDS, progress=None):
+    """Play `rounds` seeded rounds at every grid point, spread over all cores.
+
+    Round n uses seed `seed + n` at every grid point, so the points are
+    compared on the same rounds, and the results do not depend on how many
+    workers there are. Returns [(overrides, summary)] in grid order.
+    """
+    points = grid_points(grid)
+    seeds = list(range(seed, seed + rounds))
+    chunks = [seeds[i:i + chunk_rounds] for i in range(0, rounds, chunk_rounds)]
+    results = [[None] * len(chunks) for _ in points]
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        jobs = {pool.submit(play_chunk, overrides, pilot, chunk, max_ticks): (p, c)
+                for p, overrides in enumerate(points) for c, chunk in enumerate(chunks)}
+        for done, job in enumerate(as_completed(jobs), 1):
+            p, c = jobs[job]
+            results[p][c] = job.result()
+            if progress is not None:
+                progress(done, len(jobs))
+    return [(overrides, summarize(np.concatenate(parts))) for overrides, parts in zip(points, results)]
+
+
+# ------------------- OUTPUT ------------------- #
+def format_table(results):
+    names = list(results[0][0]) if results else []
+    widths = [max(6, len(n)) for n in names]
+    lines = ["  ".join(f"{n:>{w}}" for n, w in zip(names, widths))
+             + "   score mean/p10/p50/p90    survival s mean/p10/p50/p90   alive"]
+    for overrides, s in results:
+        score, surv = s["score"], s["survival_s"]
+        lines.append("  ".join(f"{overrides[n]:>{w}}" for n, w in zip(names, widths))
+                     + f"   {score['mean']:>6.1f} {score['p10']:>5.0f} {score['p50']:>5.0f} {score['p90']:>5.0f}"
+                     + f"      {surv['mean']:>7.1f} {surv['p10']:>6.1f} {surv['p50']:>6.1f} {surv['p90']:>6.1f}"
+                     + f"   {s['still_alive']:>5}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Play many seeded rounds headless for every combination of difficulty rules, "
+                    "on all cores, and compare score / survival distributions.")
+    parser.add_argument("grid", nargs="*", metavar="RULE=V1,V2,...",
+                        help="Rules fields to sweep, e.g. enemy_speed_up_every=2,3,4 "
+                             "(none: just the default rules)")
+    parser.add_argument("--rounds", type=int, default=100, help="rounds per grid point")
+    parser.add_argument("--pilot", choices=sorted(PILOTS), default="nearest")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first round")
+    parser.add_argument("--max-ticks", type=int, default=20_000, help="stop a round after N ticks")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: every core)")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args()
+
+    try:
+        grid = parse_grid(args.grid)
+    except ValueError as e:
+        parser.error(str(e))
+
+    def progress(done, total):
+        print(f"\r{done}/{total} jobs", end="", file=sys.stderr, flush=True)
+
+    workers = args.workers or os.cpu_count()
+    start = time.perf_counter()
+    results = sweep(grid, args.rounds, args.pilot, args.seed, args.max_ticks, workers,
+                    progress=progress if sys.stderr.isatty() else None)
+    elapsed = time.perf_counter() - start
+    played = sum(s["rounds"] for _, s in results)
+    print(f"\r{played} rounds on {workers} workers in {elapsed:.2f}s "
+          f"({played / elapsed:.0f} rounds/s)", file=sys.stderr)
+
+    if args.json:
+        json.dump({"pilot": args.pilot, "max_ticks": args.max_ticks, "grid": grid,
+                   "points": [{"rules": o, **s} for o, s in results]}, sys.stdout, indent=2)
+        print()
+    else:
+        print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# ------------------- IMPORTS ------------------- #
+import os                    # Reading the opt-in environment variable
+import pygame                # Rects + display updates
+
+# Set SPACE_GAME_DIRTY_RECTS=1 to only push changed areas to the display.
+DIRTY_RECTS_ENV = "SPACE_GAME_DIRTY_RECTS"
+
+# Events after which a static screen must be drawn again (window uncovered etc.)
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED,
+                 pygame.WINDOWSIZECHANGED)
+
+
+def dirty_rects_enabled():
+    """True if the dirty-rect path was switched on through the environment."""
+    return os.environ.get(DIRTY_RECTS_ENV, "") not in ("", "0")
+
+
+# ------------------- DIRTY RENDERER ------------------- #
+class DirtyRenderer:
+    """Draws like a Surface, but remembers every rectangle it touched.
+
+    Each frame:
+        begin()   → erase what was drawn last frame (not the whole screen)
+        blit / blits / track(rect) while drawing
+        present() → push last frame's + this frame's rects to the display
+
+    With enabled=False it behaves like the classic fill + flip loop, so the
+    game loop can use one code path for both.
+
+    If one frame touches more than `max_rects` rectangles, a full flip is
+    cheaper than many small updates: the renderer stops collecting rects,
+    present() flips, and the next begin() clears the screen in one fill.
+    present() also flips when last frame's and this frame's rects together
+    go over `max_rects`. At the game's own limits (200 ships and ~210 stars,
+    each leaving an old and a new rect) that happens every frame, on purpose:
+    that many small updates cost about as much as one flip.
+
+    Call invalidate() when the window was exposed, restored or resized
+    (REDRAW_EVENTS): the next frame is then cleared and flipped whole.
+    """
+
+    def __init__(self, surface, background=(0, 0, 0), enabled=True, max_rects=600):
+        self.surface = surface
+        self.background = background
+        self.enabled = enabled
+        self.max_rects = max_rects
+        self.bounds = surface.get_rect()
+        self.previous = []       # Rects drawn last frame (must be erased)
+        self.current = []        # Rects drawn this frame
+        self.full_redraw = True  # First frame clears + pushes everything
+        self.overflow = False    # This frame went over max_rects
+
+    # ---- Frame ---- #
+    def begin(self):
+        """Start a frame by erasing last frame's drawing."""
+        if not self.enabled or self.full_redraw:
+            self.surface.fill(self.background)
+            return
+        fill = self.surface.fill
+        for rect in self.previous:
+            fill(self.background, rect)
+
+    def present(self):
+        """Push only what changed. Returns the number of rects pushed."""
+        if not self.enabled or self.full_redraw or self.overflow:
+            pygame.display.flip()
+            # After an overflow it is unknown what to erase: clear it all next frame
+            self.full_redraw = self.overflow
+            self.overflow = False
+            self.previous, self.current = self.current, []
+            return 1
+        rects = self.previous + self.current
+        if len(rects) > self.max_rects:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+        self.previous, self.current = self.current, []
+        return len(rects)
+
+    def invalidate(self):
+        """Force a full clear + flip next frame (e.g. after the window was exposed)."""
+        self.bounds = self.surface.get_rect()   # The window may have been resized
+        self.full_redraw = True
+
+    # ---- Drawing ---- #
+    def collecting(self):
+        """True while this frame's rects are still being remembered."""
+        return self.enabled and not self.overflow
+
+    def track(self, rect):
+        """Remember an area that was drawn directly on `self.surface`."""
+        if self.collecting():
+            self.current.append(self.bounds.clip(rect))
+            if len(self.current) > self.max_rects:
+                self._overflow()
+        return rect
+
+    def track_many(self, rects):
+        if self.collecting():
+            clip = self.bounds.clip
+            self.current.extend(clip(rect) for rect in rects)
+            if len(self.current) > self.max_rects:
+                self._overflow()
+
+    def _overflow(self):
+        """Too many rects for partial updates: drop them, this frame is flipped."""
+        self.overflow = True
+        self.current = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        return self.track(self.surface.blit(source, dest, area, special_flags))
+
+    def blits(self, blit_sequence, doreturn=True):
+        if not self.collecting():
+            return self.surface.blits(blit_sequence, doreturn=doreturn)
+        rects = self.surface.blits(blit_sequence, doreturn=True)
+        self.track_many(rects)
+        return rects if doreturn else None
@@ -0,0 +1,164 @@
+# ------------------- IMPORTS ------------------- #
+import math                  # Spike directions
+import random                # Spike layouts (seeded, so the atlas is always the same)
+import pygame                # Surfaces + drawing primitives
+from entity_store import EntityStore   # Live explosions as NumPy arrays
+from sprite_cache import new_alpha_surface
+
+# ------------------- EXPLOSION LOOK ------------------- #
+# Same numbers the per-frame explosion used to draw with.
+START_RADIUS = 10
+GROWTH = 12                  # Radius gained per tick
+FADE = 10                    # Alpha lost per tick
+MAX_RADIUS = 120             # Past this radius the explosion is gone
+SPIKES = 20
+SPIKE_LENGTH = (30, 80)
+CORE_COLOR = (255, 180, 0)
+
+
+def explosion_frame_count():
+    """Number of animation frames until the radius passes MAX_RADIUS."""
+    return (MAX_RADIUS - START_RADIUS) // GROWTH + 1
+
+
+def render_explosion_frame(spikes, radius, alpha, rng):
+    """Draw one explosion frame. Returns (surface, dx, dy) cropped to its pixels."""
+    size = MAX_RADIUS * 2
+    surf = new_alpha_surface((size, size))
+    center = (MAX_RADIUS, MAX_RADIUS)
+
+    # Core explosion circle
+    pygame.draw.circle(surf, (*CORE_COLOR, alpha), center, radius)
+
+    # Spiky rays (each ray gets its own flicker color, baked into the frame)
+    for angle, length in spikes:
+        end_x = MAX_RADIUS + int(math.cos(angle) * (radius + length))
+        end_y = MAX_RADIUS + int(math.sin(angle) * (radius + length))
+        color = (255, rng.randint(100, 255), 0, alpha)
+        pygame.draw.line(surf, color, center, (end_x, end_y), width=3)
+
+    # Only keep the part that has pixels → smaller blits for young explosions
+    box = surf.get_bounding_rect()
+    return surf.subsurface(box).copy(), box.x - MAX_RADIUS, box.y - MAX_RADIUS
+
+
+# ------------------- ATLAS ------------------- #
+class ExplosionAtlas:
+    """Every frame of every explosion style, rendered once.
+
+    A style is one random spike layout. Each style can also be shown mirrored
+    horizontally and/or vertically, so `variant_count` = styles × 4 different
+    looking explosions cost only `styles` worth of drawing.
+    """
+
+    def __init__(self, styles=6, seed=1234):
+        self.styles = styles
+        self.seed = seed
+        self.frame_count = explosion_frame_count()
+        self.variant_count = styles * 4
+        self._frames = {}    # variant -> list of (surface, dx, dy)
+
+    def build(self):
+        """Render every variant now (instead of on first use)."""
+        for variant in range(self.variant_count):
+            self.frames(variant)
+        return self
+
+    def _render_style(self, style):
+        rng = random.Random(self.seed * 1000 + style)
+        spikes = [(rng.uniform(0, 2 * math.pi), rng.randint(*SPIKE_LENGTH))
+                  for _ in range(SPIKES)]
+        frames = []
+        for k in range(self.frame_count):
+            radius = START_RADIUS + GROWTH * k
+            alpha = max(0, 255 - FADE * k)
+            frames.append(render_explosion_frame(spikes, radius, alpha, rng))
+        return frames
+
+    def frames(self, variant):
+        """All frames of one variant as (surface, dx, dy) around the center."""
+        cached = self._frames.get(variant)
+        if cached is not None:
+            return cached
+
+        style, flips = divmod(variant, 4)
+        flip_x, flip_y = bool(flips & 1), bool(flips & 2)
+        if not (flip_x or flip_y):
+            cached = self._render_style(style)
+        else:
+            cached = []
+            for surf, dx, dy in self.frames(style * 4):
+                w, h = surf.get_size()
+                cached.append((pygame.transform.flip(surf, flip_x, flip_y),
+                               -dx - w if flip_x else dx,
+                               -dy - h if flip_y else dy))
+        self._frames[variant] = cached
+        return cached
+
+    def frame(self, variant, k):
+        """One frame of one variant as (surface, dx, dy)."""
+        return self.frames(variant)[k]
+
+
+_atlas = None
+
+
+def explosion_atlas():
+    """The shared atlas (created on first use)."""
+    global _atlas
+    if _atlas is None:
+        _atlas = ExplosionAtlas()
+    return _atlas
+
+
+def draw_explosions(screen, explosions):
+    """Blit every live explosion in one batched `blits` call."""
+    batch = []
+    for exp in explosions:
+        if not exp.done:
+            surf, dx, dy = exp.atlas.frame(exp.variant, exp.frame)
+            batch.append((surf, (exp.x + dx, exp.y + dy)))
+    screen.blits(batch, doreturn=False)
+
+
+# ------------------- LIVE EXPLOSIONS ------------------- #
+class Explosions:
+    """Every live explosion, held in one EntityStore.
+
+    An explosion is a position, its atlas variant (`kind`) and its frame
+    (`age`). `update` ages them all at once and swap-removes the finished
+    ones; `draw` is one batched `blits` call. Same look and timing as a list
+    of game_objects.Explosion.
+    """
+
+    def __init__(self, atlas=None, capacity=64):
+        self.atlas = atlas if atlas is not None else explosion_atlas()
+        self.store = EntityStore(capacity)
+
+    def __len__(self):
+        return len(self.store)
+
+    def spawn(self, x, y):
+        """Start a new explosion (random variant) centered on (x, y)."""
+        return self.store.add(x, y, 0, kind=random.randrange(self.atlas.variant_count))
+
+    def update(self):
+        """Advance every explosion one frame and drop the finished ones."""
+        store = self.store
+        store.move()
+        store.alive[store.age >= self.atlas.frame_count] = False
+        store.sweep()
+
+    def clear(self):
+        self.store.clear()
+
+    def draw(self, screen):
+        """Blit every live explosion in one batched `blits` call."""
+        store = self.store
+        frames = self.atlas.frames
+        batch = []
+        for x, y, variant, k in zip(store.x.tolist(), store.y.tolist(),
+                                    store.kind.tolist(), store.age.tolist()):
+            surf, dx, dy = frames(variant)[k]
+            batch.append((surf, (int(x) + dx, int(y) + dy)))
+        screen.blits(batch, doreturn=False)
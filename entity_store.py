@@ -0,0 +1,151 @@
+# ------------------- IMPORTS ------------------- #
+import numpy as np           # All entity data lives in flat arrays
+
+
+# ------------------- ENTITY STORE ------------------- #
+class EntityStore:
+    """Struct-of-arrays storage for many simple moving entities.
+
+    Entity i lives at x[i], y[i], moves by speed[i] pixels per frame along x
+    (negative = left), has a small integer `kind` (e.g. a ship or explosion
+    variant) and an `age` in frames. Only the first `count` slots are in use;
+    the arrays grow when full.
+
+    Entities are killed by clearing their `alive` flag. `compact()` then drops
+    all dead ones in one vectorized pass (keeping order), while `sweep()`
+    swap-removes them (order not kept, only the dead slots are written) and
+    `remove(i)` swap-removes a single entity in O(1).
+    """
+
+    FIELDS = ("x", "y", "speed", "kind", "age", "alive")
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.x_all = np.zeros(capacity, dtype=np.float64)
+        self.y_all = np.zeros(capacity, dtype=np.float64)
+        self.speed_all = np.zeros(capacity, dtype=np.float64)
+        self.kind_all = np.zeros(capacity, dtype=np.int16)
+        self.age_all = np.zeros(capacity, dtype=np.int32)
+        self.alive_all = np.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        return self.count
+
+    # ---- Views on the slots in use (writes go straight to the arrays) ---- #
+    @property
+    def x(self):
+        return self.x_all[:self.count]
+
+    @property
+    def y(self):
+        return self.y_all[:self.count]
+
+    @property
+    def speed(self):
+        return self.speed_all[:self.count]
+
+    @property
+    def kind(self):
+        return self.kind_all[:self.count]
+
+    @property
+    def age(self):
+        return self.age_all[:self.count]
+
+    @property
+    def alive(self):
+        return self.alive_all[:self.count]
+
+    # ---- Adding / removing ---- #
+    def _grow(self):
+        new_capacity = max(1, len(self.x_all)) * 2
+        for name in self.FIELDS:
+            old = getattr(self, name + "_all")
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name + "_all", new)
+
+    def add(self, x, y, speed, kind=0):
+        """Append one entity and return its index."""
+        if self.count == len(self.x_all):
+            self._grow()
+        i = self.count
+        self.x_all[i] = x
+        self.y_all[i] = y
+        self.speed_all[i] = speed
+        self.kind_all[i] = kind
+        self.age_all[i] = 0
+        self.alive_all[i] = True
+        self.count += 1
+        return i
+
+    def remove(self, i):
+        """Swap-remove entity i: the last entity takes its slot."""
+        last = self.count - 1
+        if i != last:
+            for name in self.FIELDS:
+                arr = getattr(self, name + "_all")
+                arr[i] = arr[last]
+        self.count = last
+
+    def sweep(self):
+        """Swap-remove every dead entity at once. Returns how many went.
+
+        Live entities past the new end fill the dead slots below it, so only
+        as many slots are written as there are dead entities.
+        """
+        alive = self.alive
+        kept = int(np.count_nonzero(alive))
+        removed = self.count - kept
+        if removed:
+            holes = np.flatnonzero(~alive[:kept])
+            movers = kept + np.flatnonzero(alive[kept:])
+            for name in self.FIELDS:
+                arr = getattr(self, name + "_all")
+                arr[holes] = arr[movers]
+            self.count = kept
+        return removed
+
+    def compact(self):
+        """Drop every entity whose alive flag is False. Returns how many went."""
+        keep = self.alive
+        kept = int(np.count_nonzero(keep))
+        removed = self.count - kept
+        if removed:
+            for name in self.FIELDS:
+                arr = getattr(self, name + "_all")
+                arr[:kept] = arr[:self.count][keep]
+            self.count = kept
+        return removed
+
+    def clear(self):
+        """Remove every entity (keeps the allocated arrays)."""
+        self.count = 0
+
+    # ---- Batched updates ---- #
+    def move(self, steps=1):
+        """Advance every entity along x by its speed, and age it."""
+        self.x[:] += self.speed * steps
+        self.age[:] += steps
+
+    def kill_outside(self, left=-np.inf, right=np.inf):
+        """Mark entities with x < left or x >= right as dead. Returns the mask."""
+        x = self.x
+        outside = (x < left) | (x >= right)
+        self.alive[outside] = False
+        return outside
+
+    def any_left_of(self, limit):
+        """True if any live entity has moved past x < limit."""
+        return bool(np.any((self.x < limit) & self.alive))
+
+    def positions(self, alpha=1.0):
+        """List of integer (x, y) pairs, handy for drawing.
+
+        alpha < 1 blends back toward where each entity was one tick earlier
+        (0.0 = previous tick, 1.0 = now), for interpolated rendering.
+        """
+        x = self.x
+        if alpha != 1.0:
+            x = x - self.speed * (1.0 - alpha)
+        return list(zip(x.astype(np.int64).tolist(), self.y.astype(np.int64).tolist()))
@@ -1,6 +1,9 @@
 import pygame
 import random
-import numpy as np
+from effects import explosion_atlas   # Pre-rendered explosion frames
+
+WIDTH = 1900     # Must match space_game.WIDTH
+HEIGHT = 1000    # Must match space_game.HEIGHT
 
 class Ship:
     def __init__(self, ship_pos=None, speed=5):
@@ -70,55 +73,28 @@ class Explosion:
             })
 
 class Explosion:
-    def __init__(self, x, y):
+    """One explosion played back from the pre-rendered atlas (see effects.py).
+
+    Nothing is drawn per frame: `draw` is a single blit of the current frame.
+    Each explosion picks a random atlas variant (spike layout + mirroring).
+    """
+
+    def __init__(self, x, y, atlas=None):
         self.x = x
         self.y = y
-        self.radius = 10
-        self.alpha = 255
-        self.growth = 12     # how fast the circle grows
-        self.fade = 10       # how fast it fades
-        self.max_radius = 120
-
-        # pre-generate spike directions
-        self.spikes = []
-        for i in range(20):   # number of spikes
-            angle = random.uniform(0, 2*np.pi)
-            length = random.randint(30, 80)
-            self.spikes.append((angle, length))
+        self.atlas = atlas if atlas is not None else explosion_atlas()
+        self.variant = random.randrange(self.atlas.variant_count)
+        self.frame = 0
 
     def update(self):
-        self.radius += self.growth
-        self.alpha -= self.fade
-        if self.radius > self.max_radius:
-            self.alpha = 0
+        self.frame += 1
 
     def draw(self, screen):
-        if self.alpha <= 0:
+        if self.done:
             return
-
-        surf = pygame.Surface((self.max_radius*2, self.max_radius*2), pygame.SRCALPHA)
-
-        # core explosion circle
-        color = (255, 180, 0, max(0, self.alpha))
-        pygame.draw.circle(
-            surf, color, (self.max_radius, self.max_radius), self.radius
-        )
-
-        # spiky rays
-        r, g, b, a = color
-        for angle, length in self.spikes:
-            end_x = self.max_radius + int(np.cos(angle) * (self.radius + length))
-            end_y = self.max_radius + int(np.sin(angle) * (self.radius + length))
-            pygame.draw.line(
-                surf,
-                (255, random.randint(100, 255), 0, max(0, self.alpha)),
-                (self.max_radius, self.max_radius),
-                (end_x, end_y),
-                width=3
-            )
-
-        screen.blit(surf, (self.x - self.max_radius, self.y - self.max_radius))
+        surf, dx, dy = self.atlas.frame(self.variant, self.frame)
+        screen.blit(surf, (self.x + dx, self.y + dy))
 
     @property
     def done(self):
-        return self.alpha <= 0
+        return self.frame >= self.atlas.frame_count
@@ -0,0 +1,116 @@
+# ------------------- IMPORTS ------------------- #
+import numpy as np           # Laser positions live in preallocated arrays
+
+
+# ------------------- LASER POOL ------------------- #
+class LaserPool:
+    """Fixed-capacity ring buffer of lasers that all fly right at one speed.
+
+    Nothing is allocated after construction: `fire` writes into the next free
+    slot and slots are handed back by moving the head forward. Because lasers
+    are fired in order and fly at the same speed, the oldest laser is always
+    the furthest right, so the ones leaving the screen sit at the head of the
+    ring and are dropped with a pointer move, not a list removal.
+
+    A laser that hits something is only flagged dead (`kill`); its slot comes
+    back once every older laser is gone too. `move` and `cull` are single
+    array operations over the occupied slots.
+
+    When all slots are taken, `fire` drops the shot (see `dropped`).
+    """
+
+    def __init__(self, capacity=256, speed=50):
+        self.capacity = capacity
+        self.speed = speed
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.head = 0        # Slot of the oldest laser
+        self.used = 0        # Occupied slots from head on (live or dead)
+        self.live = 0        # Lasers still flying
+        self.dropped = 0     # Shots lost because the pool was full
+
+    def __len__(self):
+        return self.live
+
+    # ---- Slots ---- #
+    def slots(self):
+        """Occupied slot indices, oldest first (includes dead ones)."""
+        end = self.head + self.used
+        if end <= self.capacity:
+            return np.arange(self.head, end)
+        return np.concatenate((np.arange(self.head, self.capacity),
+                               np.arange(end - self.capacity)))
+
+    def live_slots(self):
+        """Slot indices of the lasers still flying, oldest first."""
+        slots = self.slots()
+        if self.live == self.used:
+            return slots
+        return slots[self.alive[slots]]
+
+    def _reclaim(self):
+        """Hand back the dead slots at the head of the ring."""
+        if self.used == 0:
+            return
+        alive = self.alive[self.slots()]
+        first_alive = int(np.argmax(alive)) if alive.any() else self.used
+        self.head = (self.head + first_alive) % self.capacity
+        self.used -= first_alive
+
+    # ---- Adding / removing ---- #
+    def fire(self, x, y):
+        """Add a laser at (x, y). Returns its slot, or None if the pool is full."""
+        if self.used == self.capacity:
+            self._reclaim()
+            if self.used == self.capacity:
+                self.dropped += 1
+                return None
+        i = (self.head + self.used) % self.capacity
+        self.x[i] = x
+        self.y[i] = y
+        self.alive[i] = True
+        self.used += 1
+        self.live += 1
+        return i
+
+    def kill(self, i):
+        """Remove the laser in slot i (e.g. it hit something)."""
+        if self.alive[i]:
+            self.alive[i] = False
+            self.live -= 1
+
+    def clear(self):
+        self.alive[:] = False
+        self.head = self.used = self.live = 0
+
+    # ---- Batched updates ---- #
+    def move(self, steps=1):
+        """Move every laser right by its speed."""
+        slots = self.slots()
+        self.x[slots] += self.speed * steps
+
+    def cull(self, right):
+        """Remove lasers at x >= right. Returns the removed slots.
+
+        The removed slots still hold their last position until the next
+        `fire`, so the caller can read x[slots], y[slots] (e.g. for effects).
+        """
+        slots = self.slots()
+        gone = slots[self.alive[slots] & (self.x[slots] >= right)]
+        if len(gone):
+            self.alive[gone] = False
+            self.live -= len(gone)
+        self._reclaim()
+        return gone
+
+    def positions(self, alpha=1.0):
+        """List of integer (x, y) pairs of the live lasers, oldest first.
+
+        alpha < 1 blends back toward where each laser was one tick earlier.
+        """
+        slots = self.live_slots()
+        x = self.x[slots]
+        if alpha != 1.0:
+            x = x - self.speed * (1.0 - alpha)
+        return list(zip(x.astype(np.int64).tolist(), self.y[slots].astype(np.int64).tolist()))
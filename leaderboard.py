@@ -0,0 +1,146 @@
+# ------------------- IMPORTS ------------------- #
+import bisect                # Keeps the top-K list sorted as scores come in
+import json                  # The index is a small JSON file next to the score log
+import os                    # File sizes, atomic replace
+
+TOP_K = 10                   # How many best scores the index remembers
+
+
+def parse_score_line(line):
+    """'13,JPH' → (13, 'JPH'). Returns None for lines that are not a score."""
+    try:
+        s, initials = line.strip().split(",", 1)
+        return int(s), initials
+    except ValueError:
+        return None
+
+
+# ------------------- LEADERBOARD ------------------- #
+class Leaderboard:
+    """Top-K scores of an append-only score log, kept in a persisted index.
+
+    The log (e.g. scores.txt, one "score,initials" line per run) is never
+    re-read as a whole. The index file (<log>.top) remembers the K best
+    entries and how many bytes of the log they cover, so:
+
+      - saving a score appends one line and only reads that new line back;
+      - lines appended by someone else are picked up by reading just the
+        tail past the indexed size;
+      - only a missing/corrupt index or a log that got shorter causes a full
+        rebuild, which streams the log line by line (memory stays at K).
+
+    Ties keep log order (earlier runs first), like sorting the whole file did.
+    """
+
+    def __init__(self, path, k=TOP_K):
+        self.path = path
+        self.index_path = path + ".top"
+        self.k = k
+        self.entries = []     # Sorted (-score, line_no, initials), at most k
+        self.size = 0         # Bytes of the log covered by `entries`
+        self.lines = 0        # Lines of the log covered by `entries`
+        self.loaded = False
+
+    # ---- Index file ---- #
+    def _load_index(self):
+        self.loaded = True
+        try:
+            with open(self.index_path, "r") as f:
+                data = json.load(f)
+            if data.get("k") != self.k:
+                raise ValueError("index was built for a different K")
+            self.entries = [(-s, n, ini) for s, n, ini in data["top"]]
+            self.entries.sort()
+            self.size = int(data["size"])
+            self.lines = int(data["lines"])
+        except (OSError, ValueError, KeyError, TypeError):
+            self._reset()
+
+    def _save_index(self):
+        data = {
+            "k": self.k,
+            "size": self.size,
+            "lines": self.lines,
+            "top": [[-neg, n, ini] for neg, n, ini in self.entries],
+        }
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, self.index_path)   # Readers never see a half-written index
+
+    def _reset(self):
+        self.entries = []
+        self.size = 0
+        self.lines = 0
+
+    # ---- Reading the log ---- #
+    def _scan(self, entries, k, offset, line_no):
+        """Stream the log from `offset`, merging scores into `entries` (max k).
+
+        Returns (bytes_read_up_to, lines_seen). A last line without a newline
+        (a write still in progress) is left for the next scan.
+        """
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                offset += len(raw)
+                line_no += 1
+                parsed = parse_score_line(raw.decode("utf-8", errors="replace"))
+                if parsed is None:
+                    continue
+                entry = (-parsed[0], line_no, parsed[1])
+                if len(entries) < k or entry < entries[-1]:
+                    bisect.insort(entries, entry)
+                    if len(entries) > k:
+                        entries.pop()
+        return offset, line_no
+
+    def refresh(self):
+        """Bring the index up to date with the log (reads only what is new)."""
+        if not self.loaded:
+            self._load_index()
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            size = 0
+
+        if size == self.size:
+            return
+        if size < self.size:
+            # The log was truncated or replaced → rebuild from the start
+            self._reset()
+        if size > 0:
+            self.size, self.lines = self._scan(self.entries, self.k, self.size, self.lines)
+        self._save_index()
+
+    def rebuild(self):
+        """Forget the index and stream the whole log again."""
+        self.loaded = True
+        self._reset()
+        self.refresh()
+
+    # ---- Public API ---- #
+    def add(self, score, initials, **run_info):
+        """Append one run to the log and fold it into the index.
+
+        Extra run info (seed, ticks) has no place in the text format and is
+        ignored; it is accepted so every score backend can be called alike.
+        """
+        with open(self.path, "a") as f:
+            f.write(f"{score},{initials}\n")
+        self.refresh()
+
+    def top(self, limit=3):
+        """Best `limit` scores as a list of (score, initials)."""
+        if not os.path.exists(self.path):
+            return []
+        if limit > self.k:
+            # More than the index keeps → one streaming pass, not persisted
+            entries = []
+            self._scan(entries, limit, 0, 0)
+        else:
+            self.refresh()
+            entries = self.entries
+        return [(-neg, initials) for neg, _, initials in entries[:limit]]
@@ -0,0 +1,153 @@
+# ------------------- IMPORTS ------------------- #
+import atexit                # Dump the numbers when the game exits (any way it exits)
+import csv                   # Per-frame dump
+import json                  # Summary dump
+import os                    # Reading the opt-in environment variable
+import time                  # High resolution timer
+import numpy as np           # Ring buffer + percentiles
+
+# Set this to a file name (profile.csv / profile.json) to turn profiling on,
+# e.g.  SPACE_GAME_PROFILE=profile.json python space_game.py
+PROFILE_ENV = "SPACE_GAME_PROFILE"
+PERCENTILES = (50, 95, 99)
+
+# The phases both game loops report (in roughly the order they happen).
+FRAME_PHASES = ("events", "stars", "spawn", "ships", "lasers",
+                "collisions", "explosions", "hud", "flip")
+
+
+# ------------------- FRAME PROFILER ------------------- #
+class FrameProfiler:
+    """Times every phase of every frame and keeps the last `window` frames.
+
+    Usage per frame:
+        begin_frame() → mark("events") → ... → mark("flip") → end_frame()
+
+    `mark(phase)` charges the time since the previous mark to `phase`, so a
+    phase that is visited several times in one frame (e.g. several simulation
+    ticks) simply adds up.
+    """
+
+    enabled = True
+
+    def __init__(self, phases, window=600, dump_path=None):
+        self.phases = list(phases)
+        self.slot = {name: i for i, name in enumerate(self.phases)}
+        self.window = window
+        self.dump_path = dump_path
+        # One row per frame: every phase, then the whole frame (seconds)
+        self.samples = np.zeros((window, len(self.phases) + 1))
+        self.frames = 0
+        self.current = [0.0] * len(self.phases)
+        self.frame_start = self.last = time.perf_counter()
+        self._overlay = []
+
+    # ---- Timing ---- #
+    def begin_frame(self):
+        self.frame_start = self.last = time.perf_counter()
+        self.current = [0.0] * len(self.phases)
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.current[self.slot[phase]] += now - self.last
+        self.last = now
+
+    def end_frame(self):
+        row = self.samples[self.frames % self.window]
+        row[:-1] = self.current
+        row[-1] = time.perf_counter() - self.frame_start
+        self.frames += 1
+
+    # ---- Results ---- #
+    def history(self):
+        """Recorded frames, oldest first (seconds)."""
+        if self.frames <= self.window:
+            return self.samples[:self.frames]
+        start = self.frames % self.window
+        return np.roll(self.samples, -start, axis=0)
+
+    def percentiles(self):
+        """{phase: [p50, p95, p99] in milliseconds}, plus 'frame' for the total."""
+        data = self.history()
+        if len(data) == 0:
+            return {}
+        values = np.percentile(data, PERCENTILES, axis=0) * 1000.0
+        names = self.phases + ["frame"]
+        return {name: [round(float(v), 3) for v in values[:, i]] for i, name in enumerate(names)}
+
+    def summary_lines(self, top=4):
+        """A few short lines for the on-screen overlay."""
+        stats = self.percentiles()
+        if not stats:
+            return []
+        frame = stats.pop("frame")
+        lines = [f"frame {frame[0]:.1f} / {frame[1]:.1f} / {frame[2]:.1f} ms"]
+        slowest = sorted(stats.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        for name, (p50, p95, _) in slowest:
+            lines.append(f"{name} {p50:.2f} / {p95:.2f}")
+        return lines
+
+    def draw_overlay(self, screen, font, topright, every=30, color=(120, 255, 120)):
+        """Draw the summary; the text is only re-rendered every `every` frames."""
+        if self.frames % every == 0 or not self._overlay:
+            self._overlay = [font.render(line, True, color) for line in self.summary_lines()]
+        x, y = topright
+        for surf in self._overlay:
+            screen.blit(surf, (x - surf.get_width(), y))
+            y += surf.get_height()
+
+    def dump(self, path=None):
+        """Write per-frame rows (.csv) or percentiles + rows (.json)."""
+        path = path or self.dump_path
+        if not path or self.frames == 0:
+            return
+        data = self.history() * 1000.0
+        names = self.phases + ["frame"]
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(names)
+                writer.writerows(np.round(data, 4).tolist())
+        else:
+            with open(path, "w") as f:
+                json.dump({
+                    "frames": self.frames,
+                    "percentiles": list(PERCENTILES),
+                    "phases_ms": self.percentiles(),
+                    "samples_ms": {"columns": names, "rows": np.round(data, 4).tolist()},
+                }, f, indent=1)
+
+
+class NullProfiler:
+    """Does nothing. Used when profiling is off, so the game loop needs no ifs."""
+
+    enabled = False
+
+    def begin_frame(self):
+        pass
+
+    def mark(self, phase):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def draw_overlay(self, screen, font, topright, every=30, color=None):
+        pass
+
+    def dump(self, path=None):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def profiler_from_env(phases=FRAME_PHASES, window=600):
+    """FrameProfiler if SPACE_GAME_PROFILE is set (dumped on exit), else a no-op."""
+    value = os.environ.get(PROFILE_ENV, "")
+    if not value or value == "0":
+        return NULL_PROFILER
+    path = value if value.endswith((".csv", ".json")) else "profile.json"
+    profiler = FrameProfiler(phases, window=window, dump_path=path)
+    atexit.register(profiler.dump)
+    return profiler
@@ -0,0 +1,193 @@
+# ------------------- IMPORTS ------------------- #
+import argparse              # Command line: check or watch a recording
+import json                  # Rules are stored as a small JSON blob in the header
+import os                    # Recording directory from the environment
+import struct                # File header
+import time                  # File names, measuring replay speed
+from dataclasses import asdict
+from simulation import World, Rules, Controls
+
+RECORD_ENV = "SPACE_GAME_RECORD"   # Set to a directory to record every round
+
+# ------------------- FILE FORMAT ------------------- #
+# header: magic, seed, ticks, final score, length of the rules JSON
+# then:   the rules JSON
+# then:   runs of identical inputs, each as two varints:
+#         (how many ticks in a row, input state)
+#         input state = up | down << 1 | shots << 2
+# Holding a key for a second is one run (a couple of bytes), not 60 records.
+MAGIC = b"SPCREPL1"
+HEADER = struct.Struct("<8sqIiI")
+
+
+def write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def encode_controls(controls):
+    return int(bool(controls.up)) | int(bool(controls.down)) << 1 | int(controls.fire) << 2
+
+
+def decode_controls(state):
+    return Controls(bool(state & 1), bool(state & 2), state >> 2)
+
+
+# ------------------- RECORDING ------------------- #
+class InputRecorder:
+    """Collects the Controls of every tick of one round (run-length encoded).
+
+    Together with the seed and the rules this is all that is needed to play
+    the round again exactly: the World has no other source of randomness.
+    """
+
+    def __init__(self, seed, rules, directory=None):
+        self.seed = seed
+        self.rules = rules
+        self.directory = directory   # Where save_round puts the file
+        self.runs = []               # [count, state] pairs
+        self.ticks = 0
+
+    def record(self, controls):
+        """Call once per tick with the Controls given to world.step."""
+        state = encode_controls(controls)
+        if self.runs and self.runs[-1][1] == state:
+            self.runs[-1][0] += 1
+        else:
+            self.runs.append([1, state])
+        self.ticks += 1
+
+    def to_bytes(self, score):
+        rules = json.dumps(asdict(self.rules), separators=(",", ":")).encode("utf-8")
+        out = bytearray(HEADER.pack(MAGIC, self.seed, self.ticks, score, len(rules)))
+        out += rules
+        for count, state in self.runs:
+            write_varint(out, count)
+            write_varint(out, state)
+        return bytes(out)
+
+    def save(self, path, score):
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self.to_bytes(score))
+        os.replace(tmp, path)
+        return path
+
+    def save_round(self, initials, score):
+        """Save into `directory` as <date>-<time>-<initials>-<score>.rpl."""
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{initials or 'anon'}-{score}.rpl"
+        return self.save(os.path.join(self.directory, name), score)
+
+
+def recorder_from_env(seed, rules):
+    """An InputRecorder when SPACE_GAME_RECORD names a directory, else None."""
+    directory = os.environ.get(RECORD_ENV)
+    if not directory:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    return InputRecorder(seed, rules, directory)
+
+
+# ------------------- REPLAY ------------------- #
+class Replay:
+    """A recorded round: seed, rules, per-tick inputs and the final score."""
+
+    def __init__(self, seed, rules, ticks, score, runs):
+        self.seed = seed
+        self.rules = rules
+        self.ticks = ticks
+        self.score = score
+        self.runs = runs
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, seed, ticks, score, rules_len = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        pos = HEADER.size
+        rules = Rules(**json.loads(data[pos:pos + rules_len].decode("utf-8")))
+        pos += rules_len
+        runs = []
+        while pos < len(data):
+            count, pos = read_varint(data, pos)
+            state, pos = read_varint(data, pos)
+            runs.append((count, state))
+        return cls(seed, rules, ticks, score, runs)
+
+    def world(self):
+        """A fresh World in the same starting state as the recorded one."""
+        return World(self.rules, self.seed)
+
+    def controls(self):
+        """Yield the recorded Controls, one per tick."""
+        for count, state in self.runs:
+            controls = decode_controls(state)
+            for _ in range(count):
+                yield controls
+
+    def play(self):
+        """Replay without drawing, as fast as possible. Returns the World."""
+        world = self.world()
+        for controls in self.controls():
+            if world.over:
+                break
+            world.step(controls)
+        return world
+
+    def matches(self, world):
+        """True if a replayed World ended exactly like the recording."""
+        return world.tick == self.ticks and world.score == self.score
+
+
+# ------------------- COMMAND LINE ------------------- #
+def watch(replay, path):
+    """Play the recording back in the game window (real speed)."""
+    import pygame
+    import space_game
+    from profiler import profiler_from_env
+
+    pygame.init()
+    screen = pygame.display.set_mode((replay.rules.width, replay.rules.height))
+    pygame.display.set_caption(f"Replay: {os.path.basename(path)}")
+    world = replay.world()
+    space_game.run_game(screen, profiler=profiler_from_env(), world=world,
+                        inputs=replay.controls())
+    pygame.quit()
+    return world
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check or watch a recorded round.")
+    parser.add_argument("replay", help=".rpl file (see SPACE_GAME_RECORD)")
+    parser.add_argument("--render", action="store_true", help="watch it in the game window")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.replay)
+    start = time.perf_counter()
+    world = watch(replay, args.replay) if args.render else replay.play()
+    elapsed = time.perf_counter() - start
+
+    print(f"seed: {replay.seed}  recorded: {replay.score} points in {replay.ticks} ticks")
+    print(f"replayed: {world.score} points in {world.tick} ticks ({elapsed:.2f}s)")
+    print("MATCH" if replay.matches(world) else "MISMATCH")
+    if not replay.matches(world):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
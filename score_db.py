@@ -0,0 +1,185 @@
+# ------------------- IMPORTS ------------------- #
+import argparse              # Command line: import / top / best
+import os                    # Environment variable for picking the backend
+import sqlite3               # Standard library database, one file on disk
+import time                  # Timestamps
+from datetime import datetime
+from leaderboard import Leaderboard        # Default (text file) backend
+from score_log import parse_legacy_row     # Reads both old scores.txt row styles
+
+SCORE_DB_ENV = "SPACE_GAME_SCORE_DB"   # Set to a .sqlite path to use the database
+UNKNOWN_INITIALS = "???"               # Shown for old runs that were saved without initials
+BUSY_TIMEOUT = 10.0                    # Seconds a writer waits for another process
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id        INTEGER PRIMARY KEY,
+    score     INTEGER NOT NULL,
+    initials  TEXT    NOT NULL,
+    played_at INTEGER,            -- Unix seconds (NULL = unknown, e.g. imported runs)
+    day       TEXT,               -- Local date 'YYYY-MM-DD' for daily boards (NULL = unknown)
+    seed      INTEGER,
+    ticks     INTEGER
+);
+CREATE INDEX IF NOT EXISTS scores_by_score    ON scores (score DESC, id);
+CREATE INDEX IF NOT EXISTS scores_by_initials ON scores (initials, score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_day      ON scores (day, score DESC, id);
+"""
+
+# Constant SQL with ? parameters: sqlite3 prepares each one once per connection
+INSERT = "INSERT INTO scores (score, initials, played_at, day, seed, ticks) VALUES (?, ?, ?, ?, ?, ?)"
+TOP = "SELECT score, initials FROM scores ORDER BY score DESC, id LIMIT ?"
+TOP_OF_DAY = "SELECT score, initials FROM scores WHERE day = ? ORDER BY score DESC, id LIMIT ?"
+BEST_OF = "SELECT MAX(score) FROM scores WHERE initials = ?"
+COUNT_BELOW = "SELECT COUNT(*) FROM scores WHERE score < ?"
+COUNT_ALL = "SELECT COUNT(*) FROM scores"
+
+
+# ------------------- SCORE DATABASE ------------------- #
+class ScoreDatabase:
+    """Scores in SQLite, with the same add/top interface as Leaderboard.
+
+    The database runs in WAL mode, so readers never block the writer and
+    several game processes on one host can save scores into the same file
+    (each insert is its own short transaction; a busy writer is waited for).
+    Per-player bests, daily boards and percentile ranks are index lookups.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = None
+
+    def connect(self):
+        if self.conn is None:
+            # isolation_level=None: we open transactions ourselves (see add)
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")   # Safe with WAL, far fewer fsyncs
+            conn.executescript(SCHEMA)
+            self.conn = conn
+        return self.conn
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    # ---- Writing ---- #
+    def add(self, score, initials, seed=None, ticks=None, played_at=None):
+        """Insert one run."""
+        self.add_many([(score, initials, played_at, seed, ticks)])
+
+    def add_many(self, rows, unknown_time=False):
+        """Insert (score, initials, played_at, seed, ticks) rows in one transaction.
+
+        A played_at of None means now, or with unknown_time, that the time is
+        not known: it is stored as NULL and the run is on no daily board.
+        """
+        conn = self.connect()
+        now = None if unknown_time else int(time.time())
+        params = []
+        for score, initials, played_at, seed, ticks in rows:
+            when = now if played_at is None else int(played_at)
+            day = None if when is None else datetime.fromtimestamp(when).strftime("%Y-%m-%d")
+            params.append((int(score), initials, when, day, seed, ticks))
+        # BEGIN IMMEDIATE takes the write lock up front, so two processes
+        # never both start a transaction and then fight over upgrading it
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(INSERT, params)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    # ---- Queries ---- #
+    def top(self, limit=3):
+        """Best `limit` scores as a list of (score, initials)."""
+        return self.connect().execute(TOP, (limit,)).fetchall()
+
+    def top_of_day(self, day=None, limit=10):
+        """Best scores of one local day ('YYYY-MM-DD', default today)."""
+        day = day or datetime.now().strftime("%Y-%m-%d")
+        return self.connect().execute(TOP_OF_DAY, (day, limit)).fetchall()
+
+    def best_of(self, initials):
+        """Best score ever played with these initials, or None."""
+        return self.connect().execute(BEST_OF, (initials,)).fetchone()[0]
+
+    def percentile(self, score):
+        """Percentage of saved runs that scored lower than `score` (0–100)."""
+        conn = self.connect()
+        total = conn.execute(COUNT_ALL).fetchone()[0]
+        if total == 0:
+            return None
+        below = conn.execute(COUNT_BELOW, (score,)).fetchone()[0]
+        return 100.0 * below / total
+
+
+def score_store(text_path):
+    """Score backend for the game: SQLite if SPACE_GAME_SCORE_DB is set, else the text file."""
+    db_path = os.environ.get(SCORE_DB_ENV)
+    if db_path:
+        return ScoreDatabase(db_path)
+    return Leaderboard(text_path)
+
+
+def import_text(db, text_path):
+    """Copy an old scores.txt into the database. Returns (imported, skipped).
+
+    Rows without a time ('9,JPH') keep an unknown time, so they never show up
+    on a daily board; rows without initials ('13,2025-08-30 21:03') get
+    UNKNOWN_INITIALS.
+    """
+    rows = []
+    skipped = 0
+    with open(text_path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            parsed = parse_legacy_row(line)
+            if parsed is None:
+                skipped += 1 if line.strip() else 0
+                continue
+            score, initials, timestamp, _ = parsed
+            rows.append((score, initials or UNKNOWN_INITIALS, timestamp or None, None, None))
+    db.add_many(rows, unknown_time=True)
+    return len(rows), skipped
+
+
+# ------------------- COMMAND LINE ------------------- #
+def main():
+    parser = argparse.ArgumentParser(description="SQLite score database tools.")
+    parser.add_argument("db", help="database file, e.g. scores.sqlite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    i = sub.add_parser("import", help="copy an old scores.txt into the database")
+    i.add_argument("text", nargs="?", default="scores.txt")
+
+    t = sub.add_parser("top", help="best scores overall or of one day")
+    t.add_argument("--limit", type=int, default=10)
+    t.add_argument("--day", help="YYYY-MM-DD (or 'today')")
+
+    b = sub.add_parser("best", help="best score of one player")
+    b.add_argument("initials")
+
+    args = parser.parse_args()
+    db = ScoreDatabase(args.db)
+    if args.command == "import":
+        imported, skipped = import_text(db, args.text)
+        print(f"imported {imported} runs ({skipped} unreadable lines skipped)")
+    elif args.command == "top":
+        if args.day:
+            day = None if args.day == "today" else args.day
+            rows = db.top_of_day(day, args.limit)
+        else:
+            rows = db.top(args.limit)
+        for n, (score, initials) in enumerate(rows, start=1):
+            print(f"{n:>3}. {score:>6}  {initials}")
+    elif args.command == "best":
+        best = db.best_of(args.initials.upper())
+        print("no runs" if best is None else best)
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
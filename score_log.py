@@ -0,0 +1,225 @@
+# ------------------- IMPORTS ------------------- #
+import argparse              # Command line: migrate / summary
+import mmap                  # Reading the log without copying it into memory
+import os                    # Creating the file exactly once
+import struct                # File header
+import time                  # Timestamps
+from collections import Counter
+from datetime import datetime
+import numpy as np           # Records are a NumPy structured dtype
+
+# ------------------- FILE FORMAT ------------------- #
+# header: 8 byte magic, u32 format version, u32 record size
+# then:   fixed-width little-endian records, one per run, appended forever
+MAGIC = b"SPCSCORE"
+VERSION = 1
+HEADER = struct.Struct("<8sII")
+
+RECORD = np.dtype([
+    ("timestamp", "<i8"),    # Unix seconds, 0 = unknown
+    ("seed", "<i8"),         # Round seed, -1 = unknown
+    ("score", "<i4"),
+    ("ticks", "<u4"),        # Round length in simulation ticks, 0 = unknown
+    ("initials", "S4"),      # ASCII, zero padded ('' = unknown)
+    ("flags", "<u2"),
+    ("reserved", "<u2"),
+])                           # 32 bytes per run
+
+FLAG_MIGRATED = 1            # Record came from the old scores.txt
+FLAG_TIMESTAMP_ROW = 2       # Old row had a date where the initials are now
+
+LEGACY_TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+
+# ------------------- SCORE LOG ------------------- #
+class ScoreLog:
+    """Append-only binary log of runs.
+
+    Appending is one write of one 32 byte record. Reading maps the file into
+    memory and views it as a NumPy structured array, so analytics over
+    millions of runs are plain array operations (no text parsing).
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def _ensure_header(self):
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.itemsize))
+
+    def append(self, score, initials="", timestamp=None, seed=None, ticks=0, flags=0):
+        """Add one run (a single write)."""
+        self._ensure_header()
+        record = make_records([(score, initials, timestamp, seed, ticks, flags)])
+        with open(self.path, "ab") as f:
+            f.write(record.tobytes())
+
+    def extend(self, records):
+        """Append many ready-made RECORD rows at once."""
+        self._ensure_header()
+        with open(self.path, "ab") as f:
+            f.write(np.ascontiguousarray(records, dtype=RECORD).tobytes())
+
+    def read(self):
+        """All runs as a read-only structured array backed by mmap."""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return np.zeros(0, dtype=RECORD)
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                return np.zeros(0, dtype=RECORD)
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.itemsize:
+            mm.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} score log")
+        # A record still being written (partial tail) is simply not counted
+        count = (size - HEADER.size) // RECORD.itemsize
+        return np.frombuffer(mm, dtype=RECORD, count=count, offset=HEADER.size)
+
+    def __len__(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return 0
+        return max(0, size - HEADER.size) // RECORD.itemsize
+
+
+def make_records(rows):
+    """(score, initials, timestamp, seed, ticks, flags) tuples → RECORD array."""
+    now = int(time.time())
+    records = np.zeros(len(rows), dtype=RECORD)
+    for i, (score, initials, timestamp, seed, ticks, flags) in enumerate(rows):
+        records[i] = (now if timestamp is None else int(timestamp),
+                      -1 if seed is None else int(seed),
+                      int(score), int(ticks),
+                      initials.encode("ascii", errors="replace")[:4],
+                      flags, 0)
+    return records
+
+
+# ------------------- ANALYTICS ------------------- #
+def top_runs(records, k=3):
+    """The k best records, best first (ties: earlier run first)."""
+    if len(records) <= k:
+        order = np.argsort(-records["score"], kind="stable")
+        return records[order]
+    best = np.argpartition(-records["score"], k - 1)[:k]
+    # argpartition does not care about ties, so re-pick the k-th score's ties in order
+    cutoff = records["score"][best].min()
+    candidates = np.flatnonzero(records["score"] >= cutoff)
+    order = candidates[np.argsort(-records["score"][candidates], kind="stable")][:k]
+    return records[order]
+
+
+def percentile(records, score):
+    """Percentage of records that scored lower than `score` (None if empty)."""
+    if len(records) == 0:
+        return None
+    return 100.0 * np.count_nonzero(records["score"] < score) / len(records)
+
+
+def best_per_initials(records):
+    """{initials: best score} for records that have initials."""
+    named = records[records["initials"] != b""]
+    if len(named) == 0:
+        return {}
+    names, inverse = np.unique(named["initials"], return_inverse=True)
+    best = np.full(len(names), np.iinfo(np.int32).min, dtype=np.int64)
+    np.maximum.at(best, inverse, named["score"])
+    return {n.decode("ascii", errors="replace"): int(b) for n, b in zip(names, best)}
+
+
+# ------------------- MIGRATION ------------------- #
+def parse_legacy_row(line):
+    """One scores.txt line → (score, initials, timestamp, flags), or None.
+
+    Handles both row styles found in old files:
+        '9,JPH'               → initials, no time
+        '13,2025-08-30 21:03' → no initials, local time of the run
+    """
+    try:
+        s, rest = line.strip().split(",", 1)
+        score = int(s)
+    except ValueError:
+        return None
+    try:
+        when = datetime.strptime(rest.strip(), LEGACY_TIME_FORMAT)
+        return score, "", int(when.timestamp()), FLAG_MIGRATED | FLAG_TIMESTAMP_ROW
+    except ValueError:
+        return score, rest, 0, FLAG_MIGRATED
+
+
+def migrate(text_path, log_path):
+    """Copy the runs of an old scores.txt into a binary log.
+
+    Runs the log already has (same score and initials, e.g. rounds the game
+    logged itself, which are in scores.txt too) are not added again, so
+    migrating twice changes nothing. Returns (converted, already_logged, skipped).
+    """
+    log = ScoreLog(log_path)
+    records = log.read()
+    logged = Counter(zip(records["score"].tolist(), records["initials"].tolist()))
+    rows = []
+    already = skipped = 0
+    with open(text_path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            parsed = parse_legacy_row(line)
+            if parsed is None:
+                skipped += 1 if line.strip() else 0
+                continue
+            score, initials, timestamp, flags = parsed
+            key = (score, initials.encode("ascii", errors="replace")[:4])
+            if logged[key]:
+                logged[key] -= 1
+                already += 1
+                continue
+            rows.append((score, initials, timestamp, None, 0, flags))
+    if rows:
+        log.extend(make_records(rows))
+    return len(rows), already, skipped
+
+
+# ------------------- COMMAND LINE ------------------- #
+def main():
+    parser = argparse.ArgumentParser(description="Binary score log tools.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    m = sub.add_parser("migrate", help="copy the runs of scores.txt into a binary log")
+    m.add_argument("text", nargs="?", default="scores.txt")
+    m.add_argument("log", nargs="?", default="scores.bin")
+
+    s = sub.add_parser("summary", help="print runs, top scores and best per player")
+    s.add_argument("log", nargs="?", default="scores.bin")
+    s.add_argument("--top", type=int, default=10)
+
+    args = parser.parse_args()
+    if args.command == "migrate":
+        converted, already, skipped = migrate(args.text, args.log)
+        print(f"migrated {converted} runs into {args.log} ({already} already logged, "
+              f"{skipped} unreadable lines skipped)")
+        return
+
+    start = time.perf_counter()
+    records = ScoreLog(args.log).read()
+    best = top_runs(records, args.top)
+    per_player = best_per_initials(records)
+    elapsed = (time.perf_counter() - start) * 1000.0
+
+    print(f"runs: {len(records)}  (read + analysed in {elapsed:.1f} ms)")
+    for i, r in enumerate(best, start=1):
+        who = r["initials"].decode("ascii", errors="replace") or "-"
+        when = datetime.fromtimestamp(int(r["timestamp"])).strftime(LEGACY_TIME_FORMAT) if r["timestamp"] else "-"
+        print(f"{i:>3}. {int(r['score']):>6}  {who:<4} {when}")
+    if per_player:
+        print("best per player: " + ", ".join(f"{k} {v}" for k, v in sorted(per_player.items())))
+
+
+if __name__ == "__main__":
+    main()
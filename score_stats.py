@@ -0,0 +1,187 @@
+# ------------------- IMPORTS ------------------- #
+import argparse              # Command line options
+import json                  # --json output
+import sys                   # Output stream
+from collections import Counter, defaultdict
+from datetime import datetime
+import numpy as np           # Binary run logs are read as record arrays
+from score_log import MAGIC, HEADER, RECORD, parse_legacy_row
+
+CHUNK_SIZE = 1 << 20         # Bytes read from the log at a time
+UNKNOWN = "-"                # Initials of rows that never had any (timestamp rows)
+
+
+# ------------------- READING ------------------- #
+def iter_text_runs(path, chunk_size=CHUNK_SIZE):
+    """Yield (score, initials, timestamp) from a scores.txt, chunk by chunk.
+
+    Only one chunk (plus a partial line) is in memory at a time. Both row
+    styles are understood ('9,JPH' and '13,2025-08-30 21:03'); other lines
+    are skipped. timestamp is 0 when the row has none.
+    """
+    rest = b""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            lines = (rest + chunk).split(b"\n")
+            rest = lines.pop()   # Unfinished line, completed by the next chunk
+            for raw in lines:
+                parsed = parse_legacy_row(raw.decode("utf-8", errors="replace"))
+                if parsed is not None:
+                    yield parsed[:3]
+    if rest.strip():
+        parsed = parse_legacy_row(rest.decode("utf-8", errors="replace"))
+        if parsed is not None:
+            yield parsed[:3]
+
+
+def iter_log_runs(path, chunk_size=CHUNK_SIZE):
+    """Same as iter_text_runs, for a binary run log (scores.bin)."""
+    per_chunk = max(1, chunk_size // RECORD.itemsize)
+    with open(path, "rb") as f:
+        f.seek(HEADER.size)
+        while True:
+            records = np.fromfile(f, dtype=RECORD, count=per_chunk)
+            if len(records) == 0:
+                break
+            for score, initials, timestamp in zip(records["score"].tolist(),
+                                                  records["initials"].tolist(),
+                                                  records["timestamp"].tolist()):
+                yield score, initials.decode("ascii", errors="replace"), timestamp
+
+
+def iter_runs(path, chunk_size=CHUNK_SIZE):
+    """Runs of either log format (picked from the file's first bytes)."""
+    with open(path, "rb") as f:
+        binary = f.read(len(MAGIC)) == MAGIC
+    if binary:
+        return iter_log_runs(path, chunk_size)
+    return iter_text_runs(path, chunk_size)
+
+
+# ------------------- AGGREGATION ------------------- #
+def median_of_counts(counts):
+    """Median of a {value: how_often} Counter without expanding it."""
+    total = sum(counts.values())
+    if total == 0:
+        return None
+    lower, upper = (total - 1) // 2, total // 2   # Middle positions (0-based)
+    seen = 0
+    low_value = None
+    for value in sorted(counts):
+        seen += counts[value]
+        if low_value is None and seen > lower:
+            low_value = value
+        if seen > upper:
+            return (low_value + value) / 2
+    return None
+
+
+class ScoreStats:
+    """Single-pass aggregates over any number of runs.
+
+    Scores are kept as {score: count} per player, so memory grows with the
+    number of different players, scores and days, never with the number of
+    runs. Means, medians and the histogram are exact.
+    """
+
+    def __init__(self):
+        self.runs = 0
+        self.per_player = defaultdict(Counter)   # initials → {score: runs}
+        self.per_day = Counter()                 # 'YYYY-MM-DD' → runs
+        self.undated = 0
+
+    def add(self, score, initials, timestamp=0):
+        self.runs += 1
+        self.per_player[initials or UNKNOWN][score] += 1
+        if timestamp:
+            self.per_day[datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")] += 1
+        else:
+            self.undated += 1
+
+    def consume(self, runs):
+        for score, initials, timestamp in runs:
+            self.add(score, initials, timestamp)
+        return self
+
+    def all_scores(self):
+        total = Counter()
+        for counts in self.per_player.values():
+            total.update(counts)
+        return total
+
+    def players(self):
+        """{initials: {runs, mean, median, max}}, best max first."""
+        rows = {}
+        for initials, counts in self.per_player.items():
+            runs = sum(counts.values())
+            rows[initials] = {
+                "runs": runs,
+                "mean": sum(s * n for s, n in counts.items()) / runs,
+                "median": median_of_counts(counts),
+                "max": max(counts),
+            }
+        return dict(sorted(rows.items(), key=lambda item: (-item[1]["max"], item[0])))
+
+    def histogram(self, bin_width=5):
+        """[(low, high, runs)] for every non-empty bin of `bin_width` scores."""
+        bins = Counter()
+        for score, n in self.all_scores().items():
+            bins[score // bin_width] += n
+        return [(b * bin_width, b * bin_width + bin_width - 1, bins[b]) for b in sorted(bins)]
+
+    def as_dict(self, bin_width=5):
+        return {
+            "runs": self.runs,
+            "players": self.players(),
+            "histogram": [{"low": lo, "high": hi, "runs": n} for lo, hi, n in self.histogram(bin_width)],
+            "runs_per_day": dict(sorted(self.per_day.items())),
+            "undated_runs": self.undated,
+        }
+
+
+# ------------------- OUTPUT ------------------- #
+def format_table(stats, bin_width=5, bar_width=40):
+    lines = [f"runs: {stats.runs}", "", f"{'player':<8}{'runs':>8}{'mean':>9}{'median':>9}{'max':>7}"]
+    for initials, row in stats.players().items():
+        lines.append(f"{initials:<8}{row['runs']:>8}{row['mean']:>9.2f}{row['median']:>9.1f}{row['max']:>7}")
+
+    histogram = stats.histogram(bin_width)
+    if histogram:
+        lines += ["", "score histogram"]
+        most = max(n for _, _, n in histogram)
+        for lo, hi, n in histogram:
+            bar = "#" * max(1, round(bar_width * n / most))
+            lines.append(f"{lo:>5}-{hi:<5}{n:>8}  {bar}")
+
+    lines += ["", "runs per day"]
+    for day, n in sorted(stats.per_day.items()):
+        lines.append(f"{day}{n:>8}")
+    if stats.undated:
+        lines.append(f"{'(no date)':<10}{stats.undated:>8}")
+    return "\n".join(lines)
+
+
+# ------------------- COMMAND LINE ------------------- #
+def main():
+    parser = argparse.ArgumentParser(description="Statistics over a score log (scores.txt or scores.bin).")
+    parser.add_argument("log", nargs="?", default="scores.txt")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    parser.add_argument("--bin-width", type=int, default=5, help="scores per histogram bar")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="bytes read at a time")
+    args = parser.parse_args()
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    stats = ScoreStats().consume(iter_runs(args.log, args.chunk_size))
+    if args.json:
+        json.dump(stats.as_dict(args.bin_width), sys.stdout, indent=2)
+        print()
+    else:
+        print(format_table(stats, args.bin_width))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# ------------------- IMPORTS ------------------- #
+import atexit                # Pending saves are finished before the program ends
+from concurrent.futures import ThreadPoolExecutor   # A thread + job queue
+
+
+# ------------------- SCORE WORKER ------------------- #
+class ScoreWorker:
+    """Runs score saving/loading on one background thread.
+
+    Jobs run one at a time in the order they were submitted, so a save is
+    always finished before a later leaderboard load sees the file. `submit`
+    returns a Future right away; the screen polls `future.done()` each frame
+    instead of waiting on the disk.
+
+    `close` (also called at exit) waits until every submitted job is done,
+    so a clean quit never loses a score.
+    """
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scores")
+        self.closed = False
+        atexit.register(self.close)
+
+    def submit(self, fn, *args, **kwargs):
+        """Queue fn(*args, **kwargs); returns a concurrent.futures.Future."""
+        return self.executor.submit(fn, *args, **kwargs)
+
+    def flush(self):
+        """Block until every job submitted so far has finished."""
+        self.executor.submit(lambda: None).result()
+
+    def close(self):
+        """Finish all pending jobs, then stop the thread."""
+        if not self.closed:
+            self.closed = True
+            self.executor.shutdown(wait=True)
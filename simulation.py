@@ -0,0 +1,229 @@
+# ------------------- IMPORTS ------------------- #
+import argparse              # Command line options for the headless runner
+import random                # Seeded RNG → every round is reproducible
+import time                  # Measuring rounds per second
+from collections import namedtuple
+from dataclasses import dataclass
+
+from broadphase import box_hits         # Batched laser/ship hit test
+from entity_store import EntityStore    # Ships as NumPy arrays
+from laser_pool import LaserPool        # Lasers in a fixed ring buffer
+from profiler import NULL_PROFILER      # Optional per-phase timing
+
+# ------------------- INPUTS ------------------- #
+# What the player does during one tick: hold up/down, and how many shots fired.
+Controls = namedtuple("Controls", ["up", "down", "fire"])
+IDLE = Controls(False, False, 0)
+
+# Up to this many laser×ship pairs a plain loop beats the batched hit test.
+LOOP_MAX_PAIRS = 32
+
+
+# ------------------- RULES ------------------- #
+@dataclass
+class Rules:
+    """All numbers that define a round. Defaults match space_game.py."""
+    width: int = 1900
+    height: int = 1000
+    start_ships: int = 2
+    ship_speed: int = 5             # Enemy speed at the start (px per tick)
+    max_ships: int = 200
+    player_speed: int = 10          # Player vertical speed at the start
+    laser_speed: int = 50
+    laser_start_x: int = 100
+    max_lasers: int = 256           # Lasers in flight at once (more shots are dropped)
+    hit_half_size: int = 40         # Laser hits a ship inside this box
+    enemy_speed_up_every: int = 3   # Kills between enemy speed-ups
+    player_speed_up_every: int = 5  # Kills between player speed-ups
+    enemy_count_up_every: int = 10  # Kills between max_ships increases
+
+
+# ------------------- WORLD ------------------- #
+class World:
+    """The complete state of one round, with no drawing and no clock.
+
+    Call `step(controls)` once per tick. All randomness comes from `self.rng`,
+    so the same seed and the same inputs always give the same round.
+    """
+
+    def __init__(self, rules=None, seed=None):
+        self.rules = rules if rules is not None else Rules()
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.profiler = NULL_PROFILER   # Swap in a FrameProfiler to time each phase
+        r = self.rules
+
+        self.tick = 0
+        self.score = 0
+        self.over = False
+        self.player_y = r.height // 2
+        self.prev_player_y = self.player_y   # Where the player was one tick ago
+        self.player_speed = r.player_speed
+        self.ship_speed = r.ship_speed
+        self.max_ships = r.max_ships
+        self.spawn_new_ship = False
+        self.hits = []      # (x, y) of every kill in the last tick
+
+        # Difficulty scaling flags
+        self.last_enemy_speed_up = 0
+        self.last_player_speed_up = 0
+        self.last_enemy_count_up = 0
+
+        self.ships = EntityStore(capacity=r.max_ships)
+        self.lasers = LaserPool(capacity=r.max_lasers, speed=r.laser_speed)
+        for _ in range(r.start_ships):
+            self.spawn_ship()
+
+    def spawn_ship(self):
+        """Add one enemy just past the right edge at a random height."""
+        r = self.rules
+        spawn_y = self.rng.randint(100, r.height - 100)
+        self.ships.add(r.width + self.rng.randint(50, 300), spawn_y, -self.ship_speed)
+
+    def step(self, controls=IDLE):
+        """Advance the round by one tick. Returns the kills of this tick."""
+        r = self.rules
+        prof = self.profiler
+        self.tick += 1
+        self.hits = []
+        self.prev_player_y = self.player_y
+
+        # --------- Player input --------- #
+        for _ in range(int(controls.fire)):
+            self.lasers.fire(r.laser_start_x, self.player_y)
+        if controls.up:
+            self.player_y -= self.player_speed
+        if controls.down:
+            self.player_y += self.player_speed
+        prof.mark("events")
+
+        # --------- Spawn new ship if needed --------- #
+        if self.spawn_new_ship and len(self.ships) < self.max_ships:
+            self.spawn_ship()
+            self.spawn_new_ship = False
+        prof.mark("spawn")
+
+        # --------- Ships --------- #
+        self.ships.move()
+        if self.ships.any_left_of(0):
+            self.over = True
+        prof.mark("ships")
+
+        # --------- Lasers + collisions --------- #
+        if len(self.lasers):
+            self.lasers.move()
+            self.lasers.cull(right=r.width)
+            prof.mark("lasers")
+            self._collide()
+
+        # --------- Difficulty Scaling --------- #
+        if self.score >= self.last_enemy_speed_up + r.enemy_speed_up_every:
+            self.ship_speed += 1
+            self.last_enemy_speed_up = self.score
+        if self.score >= self.last_player_speed_up + r.player_speed_up_every:
+            self.player_speed += 1
+            self.last_player_speed_up = self.score
+        if self.score >= self.last_enemy_count_up + r.enemy_count_up_every:
+            self.max_ships += 1
+            self.last_enemy_count_up = self.score
+        prof.mark("collisions")
+
+        return self.hits
+
+    def player_y_at(self, alpha=1.0):
+        """Player height blended between the previous tick (0.0) and now (1.0)."""
+        return self.prev_player_y + (self.player_y - self.prev_player_y) * alpha
+
+    def _collide(self):
+        """Every laser destroys all ships inside its box, then is used up."""
+        lasers = self.lasers
+        ships = self.ships
+        live = lasers.live_slots()
+        if len(live) == 0 or len(ships) == 0:
+            return
+
+        # The laser tip is a point; a ship is hit when the tip is inside its box
+        half = self.rules.hit_half_size
+        lx, ly = lasers.x[live], lasers.y[live]
+        sx, sy = ships.x, ships.y
+        if len(live) * len(ships) <= LOOP_MAX_PAIRS:
+            laser_i, ship_i = self._few_hits(lx.tolist(), ly.tolist(), sx.tolist(), sy.tolist())
+        else:
+            laser_i, ship_i = box_hits(lx, ly, lx, ly, sx - half, sy - half, sx + half, sy + half,
+                                       one_per_a=False)
+        if len(ship_i) == 0:
+            return
+
+        self.hits = list(zip(lx[laser_i].tolist(), ly[laser_i].tolist()))
+        self.score += len(ship_i)
+        self.spawn_new_ship = True
+        ships.alive[ship_i] = False
+        for j in live[laser_i].tolist():
+            lasers.kill(j)
+        ships.compact()
+
+    def _few_hits(self, lx, ly, sx, sy):
+        """Same answer as box_hits(..., one_per_a=False), as a plain loop."""
+        half = self.rules.hit_half_size
+        ship_alive = [True] * len(sx)
+        laser_i, ship_i = [], []
+        for j, (x, y) in enumerate(zip(lx, ly)):
+            for i, (ship_x, ship_y) in enumerate(zip(sx, sy)):
+                if ship_alive[i] and abs(x - ship_x) < half and abs(y - ship_y) < half:
+                    ship_alive[i] = False
+                    laser_i.append(j)
+                    ship_i.append(i)
+        return laser_i, ship_i
+
+
+# ------------------- HEADLESS RUNS ------------------- #
+def scripted(controls_list):
+    """Pilot that replays a list of Controls, then stays idle."""
+    def pilot(world):
+        i = world.tick
+        return controls_list[i] if i < len(controls_list) else IDLE
+    return pilot
+
+
+def random_pilot(seed=None, fire_chance=0.3):
+    """Pilot that wiggles and fires at random (its own RNG, so rounds stay seeded)."""
+    rng = random.Random(seed)
+
+    def pilot(world):
+        move = rng.random()
+        return Controls(move < 0.3, move > 0.7, int(rng.random() < fire_chance))
+    return pilot
+
+
+def play_round(seed=None, pilot=None, rules=None, max_ticks=None):
+    """Play one round without a window as fast as possible. Returns the World."""
+    world = World(rules, seed)
+    while not world.over and (max_ticks is None or world.tick < max_ticks):
+        world.step(pilot(world) if pilot is not None else IDLE)
+    return world
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run rounds headless (no window, no frame cap).")
+    parser.add_argument("--rounds", type=int, default=100, help="number of rounds to play")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first round")
+    parser.add_argument("--max-ticks", type=int, default=None, help="stop a round after N ticks")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    scores = []
+    ticks = 0
+    for n in range(args.rounds):
+        seed = args.seed + n
+        world = play_round(seed, random_pilot(seed), max_ticks=args.max_ticks)
+        scores.append(world.score)
+        ticks += world.tick
+    elapsed = time.perf_counter() - start
+
+    print(f"rounds: {args.rounds}  ticks: {ticks}  time: {elapsed:.2f}s")
+    print(f"rounds/s: {args.rounds / elapsed:.0f}  ticks/s: {ticks / elapsed:.0f}")
+    print(f"score  mean: {sum(scores) / len(scores):.2f}  max: {max(scores)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+# ------------------- IMPORTS ------------------- #
+import argparse              # Command line options
+import csv                   # --csv: every report as a row
+import gc                    # Live object count (keeps growing = a leak)
+import os                    # Page size for the memory reading
+import sys                   # Exit code, platform
+import time                  # Wall clock duration + tick rate
+import tracemalloc           # --tracemalloc: Python memory in use
+from dataclasses import replace
+from simulation import World, Rules
+from autopilot import NearestThreatBot
+
+# The difficulty ramp is switched off: after hours of kills the ships would
+# be faster than the screen is wide, and that is not what a soak tests.
+NO_RAMP = 10 ** 9
+
+
+def rss_mb():
+    """Memory of this process in MB (current on Linux, peak elsewhere)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:          # Windows
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (2 ** 20 if sys.platform == "darwin" else 2 ** 10)
+
+
+# ------------------- WORLD UPKEEP ------------------- #
+def soak_rules(ships):
+    return replace(Rules(), start_ships=ships, max_ships=ships, enemy_speed_up_every=NO_RAMP,
+                   player_speed_up_every=NO_RAMP, enemy_count_up_every=NO_RAMP)
+
+
+def keep_busy(world, ships):
+    """Refill to `ships` ships and send the ones about to get past back right.
+
+    So the round never ends and the entity count stays high.
+    """
+    while len(world.ships) < ships:
+        world.spawn_ship()
+    xs = world.ships.x
+    xs[xs < 150] += world.rules.width
+
+
+# ------------------- SOAK ------------------- #
+class SoakRun:
+    """Plays one never-ending round with a policy and samples speed + memory."""
+
+    def __init__(self, ships=300, seed=0, pilot=None, render=False):
+        self.ships = ships
+        self.world = World(soak_rules(ships), seed)
+        self.pilot = pilot if pilot is not None else NearestThreatBot()
+        self.frame = self._renderer(seed) if render else None
+        self.samples = []
+
+    def _renderer(self, seed):
+        """Draw every tick like the game does, into an invisible window."""
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        import pygame
+        import space_game
+        from dirty_render import DirtyRenderer
+        from effects import Explosions
+        from profiler import NULL_PROFILER
+
+        pygame.init()
+        screen = pygame.display.set_mode((space_game.WIDTH, space_game.HEIGHT))
+        assets = space_game.new_assets().warm_up()
+        stars = assets.stars(seed)
+        rockets = assets.rockets
+        font = assets.font(55)
+        view = DirtyRenderer(screen, enabled=False)
+        explosions = Explosions(assets.explosions)
+
+        def frame(world, controls):
+            pygame.event.pump()
+            space_game.advance_world(world, controls, stars, explosions, NULL_PROFILER)
+            space_game.draw_frame(screen, view, world, stars, rockets, explosions, 1.0,
+                                  font, font, NULL_PROFILER)
+            view.present()
+        return frame
+
+    def run(self, seconds, every=60.0, report=None):
+        """Play for `seconds`, sampling every `every` seconds. Returns the samples."""
+        world = self.world
+        start = last = time.perf_counter()
+        last_tick = 0
+        while True:
+            keep_busy(world, self.ships)
+            controls = self.pilot(world)
+            if self.frame is not None:
+                self.frame(world, controls)
+            else:
+                world.step(controls)
+
+            if world.tick % 256 == 0:
+                now = time.perf_counter()
+                if now - last >= every or now - start >= seconds:
+                    sample = self.sample(now - start, (world.tick - last_tick) / (now - last))
+                    self.samples.append(sample)
+                    if report is not None:
+                        report(sample)
+                    last, last_tick = now, world.tick
+                    if now - start >= seconds:
+                        return self.samples
+
+    def sample(self, elapsed, tick_rate):
+        world = self.world
+        return {
+            "elapsed_s": round(elapsed, 1),
+            "ticks": world.tick,
+            "ticks_per_s": round(tick_rate, 1),
+            "ships": len(world.ships),
+            "lasers": len(world.lasers),
+            "score": world.score,
+            "rss_mb": round(rss_mb(), 1),
+            "py_mb": round(tracemalloc.get_traced_memory()[0] / 2 ** 20, 2) if tracemalloc.is_tracing() else None,
+            "objects": len(gc.get_objects()),
+        }
+
+
+def verdict(samples, max_slowdown, max_growth_mb):
+    """Compare the last sample with the first. Returns a list of problems (empty = fine)."""
+    if len(samples) < 2:
+        return []
+    first, last = samples[0], samples[-1]
+    problems = []
+    drop = 1.0 - last["ticks_per_s"] / first["ticks_per_s"]
+    if drop > max_slowdown:
+        problems.append(f"slowdown: {first['ticks_per_s']:.0f} → {last['ticks_per_s']:.0f} ticks/s ({drop:.0%})")
+    growth = last["rss_mb"] - first["rss_mb"]
+    if growth > max_growth_mb:
+        problems.append(f"memory grew by {growth:.1f} MB ({first['rss_mb']:.1f} → {last['rss_mb']:.1f})")
+    return problems
+
+
+# ------------------- COMMAND LINE ------------------- #
+def main():
+    parser = argparse.ArgumentParser(
+        description="Let the bot play one endless round at a high ship count and watch for "
+                    "leaks and slowdowns.")
+    parser.add_argument("--hours", type=float, default=1.0, help="how long to run")
+    parser.add_argument("--ships", type=int, default=300, help="ships kept on screen")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--every", type=float, default=60.0, help="seconds between reports")
+    parser.add_argument("--render", action="store_true", help="also draw every tick (no window)")
+    parser.add_argument("--tracemalloc", action="store_true", help="also report Python memory (slower)")
+    parser.add_argument("--csv", help="write every report to this file")
+    parser.add_argument("--max-slowdown", type=float, default=0.2,
+                        help="fail if ticks/s dropped by more than this fraction")
+    parser.add_argument("--max-growth", type=float, default=50.0,
+                        help="fail if memory grew by more than this many MB")
+    args = parser.parse_args()
+
+    if args.tracemalloc:
+        tracemalloc.start()
+    run = SoakRun(ships=args.ships, seed=args.seed, render=args.render)
+
+    def report(sample):
+        print("  ".join(f"{k} {v}" for k, v in sample.items() if v is not None), flush=True)
+
+    samples = run.run(args.hours * 3600, every=args.every, report=report)
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(samples[0]))
+            writer.writeheader()
+            writer.writerows(samples)
+
+    problems = verdict(samples, args.max_slowdown, args.max_growth)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    if problems:
+        sys.exit(1)
+    print("OK", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+# ------------------- IMPORTS ------------------- #
+import argparse              # Command line: throughput check
+import random                # Same spawn RNG as the World (so rounds match it exactly)
+import time                  # Steps per second
+import numpy as np           # Observations, frames, and the batched game state
+from simulation import World, Rules, Controls
+
+# ------------------- ACTIONS ------------------- #
+# Discrete actions, as (up, down, fire). Same meaning as the game's keys.
+ACTIONS = (
+    Controls(False, False, 0),   # 0: nothing
+    Controls(True, False, 0),    # 1: up
+    Controls(False, True, 0),    # 2: down
+    Controls(False, False, 1),   # 3: fire
+    Controls(True, False, 1),    # 4: up + fire
+    Controls(False, True, 1),    # 5: down + fire
+)
+ACTION_UP = np.array([c.up for c in ACTIONS])
+ACTION_DOWN = np.array([c.down for c in ACTIONS])
+ACTION_FIRE = np.array([c.fire for c in ACTIONS], dtype=bool)
+
+NEAREST = 4                  # Ships described in an observation (closest to the left edge first)
+SPEED_SCALE = 20.0           # Speeds are divided by this to keep observations around [-1, 1]
+
+
+# ------------------- OBSERVATIONS ------------------- #
+def observe(rules, player_y, ship_speed, lasers, ship_x, ship_y, ship_v, ship_alive, nearest=NEAREST):
+    """State vectors of N games at once, shape (N, 3 + 3 * nearest), float32.
+
+    Per game: player height, current enemy speed, lasers in flight, then for
+    the `nearest` ships closest to the left edge: x, height relative to the
+    player, speed. Missing ships read as (1, 0, 0): far away, harmless.
+    All arguments have one row per game; ship arrays are (N, ships).
+    """
+    n = len(player_y)
+    obs = np.zeros((n, 3 + 3 * nearest), dtype=np.float32)
+    obs[:, 0] = player_y / rules.height
+    obs[:, 1] = ship_speed / SPEED_SCALE
+    obs[:, 2] = lasers / rules.max_lasers
+
+    ships = obs[:, 3:].reshape(n, nearest, 3)
+    ships[:, :, 0] = 1.0
+    count = min(nearest, ship_x.shape[1])
+    if count:
+        key = np.where(ship_alive, ship_x, np.inf)
+        order = np.lexsort((ship_y, key), axis=1)[:, :count]   # Ties: the higher ship first
+        rows = np.arange(n)[:, None]
+        alive = ship_alive[rows, order]
+        ships[:, :count, 0] = np.where(alive, ship_x[rows, order] / rules.width, 1.0)
+        ships[:, :count, 1] = np.where(alive, (ship_y[rows, order] - player_y[:, None]) / rules.height, 0.0)
+        ships[:, :count, 2] = np.where(alive, -ship_v[rows, order] / SPEED_SCALE, 0.0)
+    return obs
+
+
+def draw_frames(rules, scale, player_y, ship_x, ship_y, ship_alive, laser_x, laser_y, laser_alive):
+    """Tiny grayscale frames of N games, shape (N, height // scale, width // scale).
+
+    No pygame: ships are filled boxes (their hit boxes), lasers single
+    pixels, the player a bar at the left. Good enough for a learning agent.
+    """
+    n = len(player_y)
+    h, w = rules.height // scale, rules.width // scale
+    frames = np.zeros((n, h, w), dtype=np.uint8)
+
+    # Player: a bar from the left edge to where lasers start
+    top = np.clip((player_y - 20) // scale, 0, h)
+    bottom = np.clip((player_y + 20) // scale + 1, 0, h)
+    rows = np.arange(h)
+    player = (rows[None, :] >= top[:, None]) & (rows[None, :] < bottom[:, None])
+    frames[:, :, :max(1, rules.laser_start_x // scale)][player] = 255
+
+    # Ships: every cell of every live ship's hit box
+    reach = rules.hit_half_size // scale
+    d = np.arange(-reach, reach + 1)
+    env, ship = np.nonzero(ship_alive)
+    cy = (ship_y[env, ship] // scale).astype(np.intp)[:, None, None] + d[None, :, None]
+    cx = (ship_x[env, ship] // scale).astype(np.intp)[:, None, None] + d[None, None, :]
+    env = np.broadcast_to(env[:, None, None], np.broadcast_shapes(cy.shape, cx.shape))
+    cy, cx = np.broadcast_arrays(cy, cx)
+    inside = (cy >= 0) & (cy < h) & (cx >= 0) & (cx < w)
+    frames[env[inside], cy[inside], cx[inside]] = 128
+
+    # Lasers: one cell each
+    env, slot = np.nonzero(laser_alive)
+    ly = (laser_y[env, slot] // scale).astype(np.intp)
+    lx = (laser_x[env, slot] // scale).astype(np.intp)
+    inside = (ly >= 0) & (ly < h) & (lx >= 0) & (lx < w)
+    frames[env[inside], ly[inside], lx[inside]] = 64
+    return frames
+
+
+# ------------------- SINGLE GAME ------------------- #
+class SpaceEnv:
+    """The game as a reset/step environment (Gymnasium style, no dependency).
+
+        obs, info = env.reset(seed)
+        obs, reward, terminated, truncated, info = env.step(action)
+
+    Runs the real simulation.World. An action is an index into ACTIONS,
+    the reward is the ships destroyed this tick. With frame_scale set, obs
+    is a dict {"state": vector, "frame": tiny grayscale image}.
+    """
+
+    def __init__(self, rules=None, nearest=NEAREST, frame_scale=None, max_ticks=None):
+        self.rules = rules if rules is not None else Rules()
+        self.nearest = nearest
+        self.frame_scale = frame_scale
+        self.max_ticks = max_ticks
+        self.action_count = len(ACTIONS)
+        self.observation_size = 3 + 3 * nearest
+        self.world = None
+
+    def reset(self, seed=None):
+        self.world = World(self.rules, seed)
+        return self._observation(), {"seed": seed}
+
+    def step(self, action):
+        world = self.world
+        before = world.score
+        world.step(ACTIONS[action])
+        terminated = world.over
+        truncated = not terminated and self.max_ticks is not None and world.tick >= self.max_ticks
+        info = {"score": world.score, "tick": world.tick}
+        return self._observation(), float(world.score - before), terminated, truncated, info
+
+    def render(self, scale=10):
+        """The current tiny frame (see draw_frames)."""
+        return self._frame(scale)
+
+    def _arrays(self):
+        world = self.world
+        ships, lasers = world.ships, world.lasers
+        slots = lasers.live_slots()
+        return (np.array([world.player_y]), ships.x[None], ships.y[None], ships.speed[None],
+                ships.alive[None], lasers.x[slots][None], lasers.y[slots][None],
+                np.ones((1, len(slots)), dtype=bool))
+
+    def _observation(self):
+        world = self.world
+        py, sx, sy, sv, alive, _, _, _ = self._arrays()
+        state = observe(self.rules, py, np.array([world.ship_speed]), np.array([len(world.lasers)]),
+                        sx, sy, sv, alive, self.nearest)[0]
+        if self.frame_scale is None:
+            return state
+        return {"state": state, "frame": self._frame(self.frame_scale)}
+
+    def _frame(self, scale):
+        py, sx, sy, _, alive, lx, ly, lalive = self._arrays()
+        return draw_frames(self.rules, scale, py, sx, sy, alive, lx, ly, lalive)[0]
+
+
+# ------------------- MANY GAMES IN LOCKSTEP ------------------- #
+class VectorSpaceEnv:
+    """N independent games stepped together with array math (no Python loop per game).
+
+    Same rules, same tick order and the same spawn RNG calls as World.step,
+    so game i with seed s plays exactly like World(rules, s) given the same
+    actions (checked against it tick by tick). Games that end are reset on
+    the spot with the next seed; `info["final_score"]` has their last score
+    (-1 for games that did not end).
+
+    Ship count never grows past rules.start_ships (one ship spawns after a
+    kill), so ships fit in an (N, start_ships) array. Lasers use (N, max_lasers)
+    slots handed out in ring order, like LaserPool, so a full pool drops the
+    same shots.
+    """
+
+    def __init__(self, count, rules=None, nearest=NEAREST, frame_scale=None, max_ticks=None):
+        self.count = count
+        self.rules = r = rules if rules is not None else Rules()
+        self.nearest = nearest
+        self.frame_scale = frame_scale
+        self.max_ticks = max_ticks
+        self.action_count = len(ACTIONS)
+        self.observation_size = 3 + 3 * nearest
+        ships, lasers = max(r.start_ships, 1), r.max_lasers
+
+        self.rngs = [random.Random() for _ in range(count)]
+        self.next_seed = 0
+        self.seeds = np.zeros(count, dtype=np.int64)
+        self.tick = np.zeros(count, dtype=np.int64)
+        self.score = np.zeros(count, dtype=np.int64)
+        self.player_y = np.zeros(count, dtype=np.int64)
+        self.player_speed = np.zeros(count, dtype=np.int64)
+        self.ship_speed = np.zeros(count, dtype=np.int64)
+        self.max_ships = np.zeros(count, dtype=np.int64)
+        self.spawn_new_ship = np.zeros(count, dtype=bool)
+        self.last_ups = np.zeros((3, count), dtype=np.int64)   # enemy speed, player speed, enemy count
+
+        self.ship_x = np.zeros((count, ships))
+        self.ship_y = np.zeros((count, ships))
+        self.ship_v = np.zeros((count, ships))
+        self.ship_alive = np.zeros((count, ships), dtype=bool)
+
+        self.laser_x = np.zeros((count, lasers))
+        self.laser_y = np.zeros((count, lasers))
+        self.laser_alive = np.zeros((count, lasers), dtype=bool)
+        self.laser_order = np.zeros((count, lasers), dtype=np.int64)   # Older lasers hit first
+        self.shots = np.zeros(count, dtype=np.int64)
+
+    # ---- Resetting ---- #
+    def reset(self, seed=None):
+        """Start every game: game i gets seed + i (the next ones continue from there)."""
+        base = seed if seed is not None else random.randrange(2 ** 31)
+        self.next_seed = base + self.count
+        self._reset_games(np.arange(self.count), base + np.arange(self.count))
+        return self._observation(), {"seed": self.seeds.copy()}
+
+    def _reset_games(self, games, seeds):
+        r = self.rules
+        self.seeds[games] = seeds
+        for name in ("tick", "score", "shots"):
+            getattr(self, name)[games] = 0
+        self.player_y[games] = r.height // 2
+        self.player_speed[games] = r.player_speed
+        self.ship_speed[games] = r.ship_speed
+        self.max_ships[games] = r.max_ships
+        self.spawn_new_ship[games] = False
+        self.last_ups[:, games] = 0
+        self.ship_alive[games] = False
+        self.laser_alive[games] = False
+        for game, seed in zip(games.tolist(), seeds.tolist()):
+            self.rngs[game].seed(seed)
+            for _ in range(r.start_ships):
+                self._spawn(game)
+
+    def _spawn(self, game):
+        """World.spawn_ship for one game (same RNG calls in the same order)."""
+        r = self.rules
+        rng = self.rngs[game]
+        y = rng.randint(100, r.height - 100)
+        slot = int(np.argmin(self.ship_alive[game]))
+        self.ship_x[game, slot] = r.width + rng.randint(50, 300)
+        self.ship_y[game, slot] = y
+        self.ship_v[game, slot] = -self.ship_speed[game]
+        self.ship_alive[game, slot] = True
+
+    # ---- Stepping ---- #
+    def step(self, actions):
+        """Advance every game one tick. actions: N indices into ACTIONS.
+
+        Returns obs, reward, terminated, truncated, info (all arrays of N).
+        """
+        r = self.rules
+        actions = np.asarray(actions)
+        before = self.score.copy()
+        self.tick += 1
+
+        # --------- Player input: fire from where the player is, then move --------- #
+        fire = np.flatnonzero(ACTION_FIRE[actions])
+        if len(fire):
+            # Like LaserPool: shot k goes into slot k % max_lasers; if that
+            # laser is still flying, the ring is full and the shot is dropped
+            slots = self.shots[fire] % r.max_lasers
+            room = ~self.laser_alive[fire, slots]
+            games, slots = fire[room], slots[room]
+            self.laser_x[games, slots] = r.laser_start_x
+            self.laser_y[games, slots] = self.player_y[games]
+            self.laser_alive[games, slots] = True
+            self.laser_order[games, slots] = self.shots[games]
+            self.shots[games] += 1
+        self.player_y += (ACTION_DOWN[actions].astype(np.int64) - ACTION_UP[actions]) * self.player_speed
+
+        # --------- Spawn a ship where one was destroyed last tick --------- #
+        spawn = self.spawn_new_ship & (self.ship_alive.sum(axis=1) < self.max_ships)
+        for game in np.flatnonzero(spawn).tolist():
+            self._spawn(game)
+        self.spawn_new_ship[spawn] = False
+
+        # --------- Ships --------- #
+        self.ship_x += self.ship_v
+        over = ((self.ship_x < 0) & self.ship_alive).any(axis=1)
+
+        # --------- Lasers + collisions --------- #
+        self.laser_x += r.laser_speed
+        self.laser_alive &= self.laser_x < r.width
+        self._collide()
+
+        # --------- Difficulty scaling --------- #
+        for row, every, value in ((0, r.enemy_speed_up_every, self.ship_speed),
+                                  (1, r.player_speed_up_every, self.player_speed),
+                                  (2, r.enemy_count_up_every, self.max_ships)):
+            up = self.score >= self.last_ups[row] + every
+            value += up
+            self.last_ups[row] = np.where(up, self.score, self.last_ups[row])
+
+        reward = (self.score - before).astype(np.float32)
+        truncated = ~over & (self.tick >= self.max_ticks) if self.max_ticks is not None else np.zeros_like(over)
+        info = {"score": self.score.copy(), "tick": self.tick.copy(),
+                "final_score": np.where(over | truncated, self.score, -1)}
+        done = np.flatnonzero(over | truncated)
+        if len(done):
+            self._reset_games(done, self.next_seed + np.arange(len(done)))
+            self.next_seed += len(done)
+        return self._observation(), reward, over, truncated, info
+
+    def _collide(self):
+        """Every laser destroys all ships in its box (older lasers first), then is used up."""
+        games = np.flatnonzero(self.laser_alive.any(axis=1) & self.ship_alive.any(axis=1))
+        if len(games) == 0:
+            return
+        half = self.rules.hit_half_size
+        lx, ly = self.laser_x[games, :, None], self.laser_y[games, :, None]
+        sx, sy = self.ship_x[games, None, :], self.ship_y[games, None, :]
+        covers = ((np.abs(lx - sx) < half) & (np.abs(ly - sy) < half)
+                  & self.laser_alive[games, :, None] & self.ship_alive[games, None, :])
+        hit = covers.any(axis=1)                                  # (games, ships)
+        if not hit.any():
+            return
+        # A ship goes to the oldest laser that covers it; that laser is used up
+        order = np.where(covers, self.laser_order[games, :, None], np.iinfo(np.int64).max)
+        winner = order.argmin(axis=1)                             # (games, ships)
+        g, s = np.nonzero(hit)
+        self.laser_alive[games[g], winner[g, s]] = False
+        self.ship_alive[games[g], s] = False
+        self.score[games] += hit.sum(axis=1)
+        self.spawn_new_ship[games] |= hit.any(axis=1)
+
+    # ---- Observations ---- #
+    def _observation(self):
+        lasers = self.laser_alive.sum(axis=1)
+        state = observe(self.rules, self.player_y, self.ship_speed, lasers, self.ship_x, self.ship_y,
+                        self.ship_v, self.ship_alive, self.nearest)
+        if self.frame_scale is None:
+            return state
+        return {"state": state, "frame": self.render(self.frame_scale)}
+
+    def render(self, scale=10):
+        """Tiny frames of every game (see draw_frames)."""
+        return draw_frames(self.rules, scale, self.player_y, self.ship_x, self.ship_y, self.ship_alive,
+                           self.laser_x, self.laser_y, self.laser_alive)
+
+
+# ------------------- COMMAND LINE ------------------- #
+def main():
+    parser = argparse.ArgumentParser(description="Measure environment steps per second (random actions).")
+    parser.add_argument("--envs", type=int, default=256, help="games stepped together (1 = SpaceEnv)")
+    parser.add_argument("--steps", type=int, default=200_000, help="total game steps")
+    parser.add_argument("--frames", type=int, default=None, metavar="SCALE",
+                        help="also produce frames, downscaled by SCALE")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    start = time.perf_counter()
+    episodes = 0
+    if args.envs == 1:
+        env = SpaceEnv(frame_scale=args.frames)
+        env.reset(args.seed)
+        for n in range(args.steps):
+            _, _, terminated, truncated, _ = env.step(int(rng.integers(len(ACTIONS))))
+            if terminated or truncated:
+                episodes += 1
+                env.reset(args.seed + episodes)
+        steps = args.steps
+    else:
+        env = VectorSpaceEnv(args.envs, frame_scale=args.frames)
+        env.reset(args.seed)
+        for n in range(args.steps // args.envs):
+            _, _, terminated, truncated, _ = env.step(rng.integers(len(ACTIONS), size=args.envs))
+            episodes += int(np.count_nonzero(terminated | truncated))
+        steps = args.steps // args.envs * args.envs
+    elapsed = time.perf_counter() - start
+    print(f"{steps} steps in {elapsed:.2f}s: {steps / elapsed:.0f} steps/s ({episodes} episodes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,31 @@
 # ------------------- IMPORTS ------------------- #
+from startup import StartupTimer, startup_requested  # First, so the other imports are timed
 import pygame                # Main game library (graphics, sound, input handling)
-import random                # For randomness (ship spawn positions, etc.)
 import sys                   # For exiting the program cleanly
-import numpy as np           # For math functions (sinusoidal flame, collisions)
-import os                    # To check if score file exists / handle file paths
-from game_objects import Ship, Explosion   # Import custom Ship + Explosion classes
+import os                    # Does the run log exist yet?
+import random                # Seed for each round
+import math                  # Sinusoidal flame
+from effects import Explosions             # Live explosions in one EntityStore, batched blits
+from assets import Assets, draw_loading_bar  # Fonts, sprites and stars, made once
+from simulation import World, Rules, Controls  # Game logic without any drawing
+from timestep import FixedTimestep             # Steady ticks, independent of frame rate
+from profiler import NULL_PROFILER, profiler_from_env  # Opt-in frame timing + HUD
+from dirty_render import DirtyRenderer, dirty_rects_enabled, REDRAW_EVENTS  # Partial display updates
+from text_cache import render_text          # Text is rendered once, then reused
+from score_db import ScoreDatabase, score_store, UNKNOWN_INITIALS  # scores.txt index, or SQLite if configured
+from score_log import ScoreLog, percentile, migrate  # Binary per-run log (analytics)
+from score_worker import ScoreWorker        # Score file/database access off the main thread
+from replay import recorder_from_env        # Optional input recording (SPACE_GAME_RECORD)
+from autopilot import pilot_from_env        # Optional bot player (SPACE_GAME_AUTOPILOT)
 
 # ------------------- CONSTANTS ------------------- #
 SCORES_FILE = "scores.txt"   # File where scores will be stored
+RUN_LOG_FILE = "scores.bin"  # Binary log of every run (score, initials, time, seed, length)
 
 WIDTH = 1900                 # Width of the game window
 HEIGHT = 1000                # Height of the game window
-FPS = 60                     # Frames per second limit (game speed)
+FPS = 60                     # Frames per second limit (drawing)
+TICK_RATE = 60               # Simulation ticks per second (game speed)
 
 PLAYER_BASE_SPEED = 10        # Player vertical movement speed (base)
 LASER_SPEED = 50              # Laser horizontal speed
@@ -19,57 +33,107 @@ STAR_LAYERS = [1, 2, 3]       # Different star speeds for parallax
 STARS_PER_LAYER = 70          # Number of stars in each layer
 
 # ---------------- SCORE HANDLING ---------------- #
-def save_score(score, initials):
-    """Save the player's score with initials into a file."""
-    with open(SCORES_FILE, "a") as f:
-        f.write(f"{score},{initials}\n")
+# The top scores are kept in a small index next to the file (scores.txt.top),
+# so the whole file is never re-read and re-sorted after a round.
+# With SPACE_GAME_SCORE_DB=scores.sqlite they go into a SQLite database instead.
+# They are opened by main() (open_scores), so importing this file touches no
+# files and starts no thread.
+LEADERBOARD = None
+RUN_LOG = None
+# All score reads/writes run on this thread, so a slow disk never freezes the window
+SCORE_WORKER = None
+
+def open_scores():
+    """Open the score stores and start the score thread (once).
+
+    The first time the run log is made, the runs already in scores.txt are
+    copied into it (on the score thread, before any new round is saved).
+    """
+    global LEADERBOARD, RUN_LOG, SCORE_WORKER
+    if SCORE_WORKER is None:
+        new_log = not os.path.exists(RUN_LOG_FILE)
+        LEADERBOARD = score_store(SCORES_FILE)
+        RUN_LOG = ScoreLog(RUN_LOG_FILE)
+        SCORE_WORKER = ScoreWorker()
+        if new_log and os.path.exists(SCORES_FILE):
+            report_errors(SCORE_WORKER.submit(migrate, SCORES_FILE, RUN_LOG_FILE),
+                          "copy scores.txt into the run log")
+
+def report_errors(future, what):
+    """Print why a job on the score thread failed, once it has."""
+    def report(done):
+        error = done.exception()
+        if error is not None:
+            print(f"Could not {what}: {error}", file=sys.stderr)
+    future.add_done_callback(report)
+    return future
+
+def save_score(score, initials, seed=None, ticks=0):
+    """Save the player's score with initials into a file (and the run log)."""
+    LEADERBOARD.add(score, initials, seed=seed, ticks=ticks)
+    RUN_LOG.append(score, initials, seed=seed, ticks=ticks)
 
 def load_top_scores(limit=3):
     """Load scores from file and return top N as list of (score, initials)."""
-    if not os.path.exists(SCORES_FILE):
-        return []
-
-    with open(SCORES_FILE, "r") as f:
-        lines = f.readlines()
-
-    scores = []
-    for line in lines:
-        try:
-            s, initials = line.strip().split(",", 1)
-            scores.append((int(s), initials))
-        except:
-            continue
-
-    scores.sort(key=lambda x: x[0], reverse=True)
-    return scores[:limit]
+    return LEADERBOARD.top(limit)
+
+def load_percentile(score):
+    """Percentage of saved runs that scored lower than `score` (None if unknown)."""
+    if isinstance(LEADERBOARD, ScoreDatabase):
+        return LEADERBOARD.percentile(score)
+    return percentile(RUN_LOG.read(), score)
+
+def save_and_rank(score, initials, seed=None, ticks=0):
+    """Save a finished round, then return (top_scores, rank) for the game over screen."""
+    save_score(score, initials, seed=seed, ticks=ticks)
+    top_scores = load_top_scores()
+    try:
+        rank = load_percentile(score)
+    except Exception as e:   # A broken run log must not hide the top scores
+        print(f"Could not rank score: {e}", file=sys.stderr)
+        rank = None
+    return top_scores, rank
+
+def quit_game():
+    """Close the window and exit once every score still being saved is written."""
+    pygame.quit()
+    if SCORE_WORKER is not None:
+        SCORE_WORKER.close()
+    sys.exit()
 
 # ---------------- INITIALS INPUT ---------------- #
-def get_initials(screen):
-    """Ask the player to type 1–3 initials before game starts."""
+def get_initials(screen, startup=None, assets=None):
+    """Ask the player to type 1–3 initials before game starts.
+
+    assets: where the fonts come from (see assets.py).
+    startup: a StartupTimer (SPACE_GAME_STARTUP); the game stops after
+    reporting once this first screen is shown.
+    """
     initials = ""
     entering = True
-    font_big = pygame.font.SysFont(None, 100)
-    font_small = pygame.font.SysFont(None, 50)
+    if assets is None:
+        assets = new_assets()
+    font_big = assets.font(100)
+    font_small = assets.font(50)
+    clock = pygame.time.Clock()
+    redraw = True   # Only draw (and push to the display) when something changed
 
     while entering:
-        screen.fill((0, 0, 0))
-
-        text = font_big.render("Enter Your Initials:", True, (255, 255, 0))
-        screen.blit(text, (WIDTH//2 - 300, HEIGHT//2 - 100))
-
-        text2 = font_big.render(initials, True, (0, 255, 0))
-        screen.blit(text2, (WIDTH//2 - 100, HEIGHT//2 + 20))
-
-        hint = font_small.render("Press ENTER when done (max 3 letters)", True, (200, 200, 200))
-        screen.blit(hint, (WIDTH//2 - 250, HEIGHT//2 + 150))
-
-        pygame.display.flip()
+        if redraw:
+            draw_initials_screen(screen, font_big, font_small, initials)
+            redraw = False
+            if startup is not None:
+                startup.mark("first frame")
+                startup.report()
+                quit_game()
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                quit_game()
+            if event.type in REDRAW_EVENTS:
+                redraw = True
             if event.type == pygame.KEYDOWN:
+                redraw = True
                 if event.key == pygame.K_RETURN and initials:
                     entering = False
                 elif event.key == pygame.K_BACKSPACE:
@@ -77,247 +141,269 @@ def get_initials(screen):
                 elif len(initials) < 3 and event.unicode.isalpha():
                     initials += event.unicode.upper()
 
+        clock.tick(FPS)
+
     return initials
 
+def draw_initials_screen(screen, font_big, font_small, initials):
+    """Draw the initials prompt once and push it to the display."""
+    screen.fill((0, 0, 0))
+
+    text = render_text(font_big, "Enter Your Initials:", (255, 255, 0))
+    screen.blit(text, (WIDTH//2 - 300, HEIGHT//2 - 100))
+
+    text2 = render_text(font_big, initials, (0, 255, 0))
+    screen.blit(text2, (WIDTH//2 - 100, HEIGHT//2 + 20))
+
+    hint = render_text(font_small, "Press ENTER when done (max 3 letters)", (200, 200, 200))
+    screen.blit(hint, (WIDTH//2 - 250, HEIGHT//2 + 150))
+
+    pygame.display.flip()
+
 # ---------------- GAME LOOP ---------------- #
-def run_game(screen):
-    own_ship_pos = HEIGHT // 2
-    ship_speed = 5
-    max_ships = 200
-    spawn_new_ship = False
-    # ---- Create starting enemy ships ---- #
-    ships = []
-    for _ in range(2):
-        ship = Ship(speed=ship_speed, ship_pos=random.randint(100, HEIGHT - 100))
-        ship.ship_pos_x = WIDTH + random.randint(50, 300)
-        ships.append(ship)
-    lasers = []
-    explosions = []
+def new_assets():
+    """Everything the screens draw with (fonts, rockets, explosions, stars)."""
+    return Assets(WIDTH, HEIGHT, speeds=STAR_LAYERS, stars_per_layer=STARS_PER_LAYER)
+
+def game_rules():
+    """Rules for the simulation, built from the constants above."""
+    return Rules(width=WIDTH, height=HEIGHT,
+                 player_speed=PLAYER_BASE_SPEED, laser_speed=LASER_SPEED)
+
+def advance_world(world, controls, stars, explosions, profiler=NULL_PROFILER):
+    """Run one tick: the world, the stars and every explosion."""
+    for x, y in world.step(controls):
+        explosions.spawn(int(x), int(y))
+    stars.update()   # Every star moves by its layer speed (and wraps) at once
+    profiler.mark("stars")
+    explosions.update()   # Ages every explosion and drops the finished ones at once
+    profiler.mark("explosions")
+
+def draw_frame(screen, view, world, stars, rockets, explosions, alpha,
+               font, profile_font, profiler=NULL_PROFILER):
+    """Draw one frame of the round through `view` (does not present it).
+
+    alpha: blend between the previous tick (0.0) and the current one (1.0).
+    """
+    # --------- Background stars (parallax) --------- #
+    view.begin()
+    stars.draw(screen)
+    view.track_many(stars.dirty_rects() if view.enabled else ())
+    profiler.mark("stars")
+
+    # --------- Draw ships --------- #
+    # Enemy flame (sinusoidal "breathing", same for every ship this frame)
+    t = pygame.time.get_ticks() * 0.02
+    flame_length = 20 + int(10 * math.sin(t))
+    rockets.draw_many(view, "enemy", world.ships.positions(alpha), flame_length)
+    profiler.mark("ships")
+
+    # --------- Draw lasers --------- #
+    for x, y in world.lasers.positions(alpha):
+        # Laser beam (red core + yellow glow)
+        view.track(pygame.draw.line(screen, (255, 0, 0), (x, y), (x + 60, y), 10))
+        pygame.draw.line(screen, (255, 255, 0), (x, y), (x + 60, y), 4)
+    profiler.mark("lasers")
+
+    # --------- Draw explosions --------- #
+    explosions.draw(view)   # One blit per explosion, no drawing
+    profiler.mark("explosions")
+
+    # --------- Draw Player Rocket --------- #
+    # Same sinusoidal "breathing" flame as the enemies
+    rockets.draw(view, "player", 50, int(world.player_y_at(alpha)), flame_length)
+    profiler.mark("ships")
+
+    # --------- Draw Score --------- #
+    score_text = render_text(font, f"Score: {world.score}", (255, 255, 0))
+    view.blit(score_text, (WIDTH - 250, 20))
+    # Frame timings (only when SPACE_GAME_PROFILE is set), left of the score
+    profiler.draw_overlay(view, profile_font, (WIDTH - 270, 20))
+    profiler.mark("hud")
+
+def run_game(screen, seed=None, profiler=NULL_PROFILER, dirty_rects=None, world=None,
+             recorder=None, inputs=None, pilot=None, assets=None):
+    # All game logic (ships, lasers, collisions, score) lives in the World.
+    # This loop only reads the keyboard and draws what the World contains.
+    # Pass a World to keep it after the round (seed, ticks played...).
+    # recorder: gets the Controls of every tick (see replay.py).
+    # inputs: Controls to play instead of the keyboard (one per tick, a replay).
+    # pilot: policy(world) -> Controls asked every tick instead of the keyboard
+    #        (see autopilot.py).
+    # assets: fonts, sprites and stars made once (main warms them up before
+    #         the first round); made on first use if not given.
+    if world is None:
+        world = World(game_rules(), seed)
+    world.profiler = profiler
+    if inputs is not None:
+        inputs = iter(inputs)
+    if assets is None:
+        assets = new_assets()
+    explosions = Explosions(assets.explosions)
     # --- Parallax starfield setup --- #
-    stars = []
-    for layer in STAR_LAYERS:
-        for _ in range(STARS_PER_LAYER):
-            stars.append([random.randint(0, WIDTH), random.randint(0, HEIGHT), layer])
-    player_speed = PLAYER_BASE_SPEED
-    score = 0
-    running = True
+    # Seeded like the world, so a replay also looks the same
+    stars = assets.stars(world.seed)
     clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 55)
-
-    # Difficulty scaling flags
-    last_enemy_speed_up = 0
-    last_player_speed_up = 0
-    last_enemy_count_up = 0
+    font = assets.font(55)
+    profile_font = assets.font(26)
+    rockets = assets.rockets   # Rockets are drawn once, then only blitted
+    timestep = FixedTimestep(TICK_RATE)
+    # Optional dirty-rect path: erase + push only the areas drawn on
+    if dirty_rects is None:
+        dirty_rects = dirty_rects_enabled()
+    view = DirtyRenderer(screen, enabled=dirty_rects)
+    shots = 0   # SPACE presses waiting for the next tick
 
     # -------- Main game loop -------- #
-    while running:
-        dt = clock.tick(FPS) / 1000.0
-        screen.fill((0, 0, 0))
+    while not world.over:
+        frame_time = clock.tick(FPS) / 1000.0
+        profiler.begin_frame()
 
         # --------- Handle events --------- #
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                quit_game()
+            if event.type in REDRAW_EVENTS:
+                view.invalidate()   # Areas outside the dirty rects are stale
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                lasers.append([100, own_ship_pos])
+                shots += 1
 
         # Keyboard input (continuous)
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            own_ship_pos -= player_speed
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            own_ship_pos += player_speed
-
-        # --------- Background stars (parallax) --------- #
-        for star in stars:
-            pygame.draw.circle(screen, (255, 255, 255), (star[0], star[1]), star[2])
-            star[0] -= star[2]  # Move by its layer speed
-            if star[0] < 0:
-                star[0] = WIDTH
-                star[1] = random.randint(0, HEIGHT)
-
-        # --------- Spawn new ship if needed --------- #
-        if spawn_new_ship and len(ships) < max_ships:
-            ship = Ship(speed=ship_speed, ship_pos=random.randint(100, HEIGHT - 100))
-            ship.ship_pos_x = WIDTH + random.randint(50, 300)
-            ships.append(ship)
-            spawn_new_ship = False
-
-        # --------- Update ships --------- #
-        for ship in ships[:]:
-            rocket_x = ship.ship_pos_x
-            rocket_y = ship.ship_pos_y
-
-            # Body
-            pygame.draw.rect(screen, (200, 100, 100), (rocket_x - 50, rocket_y - 20, 50, 40))  
-
-            # Nose cone (facing left now)
-            pygame.draw.polygon(screen, (150, 0, 0), [
-                (rocket_x - 50, rocket_y - 20),
-                (rocket_x - 50, rocket_y + 20),
-                (rocket_x - 70, rocket_y)
-            ])
-
-            # Top fin
-            pygame.draw.polygon(screen, (150, 0, 0), [
-                (rocket_x, rocket_y - 20),
-                (rocket_x + 15, rocket_y - 30),
-                (rocket_x, rocket_y - 30)
-            ])
-
-            # Bottom fin
-            pygame.draw.polygon(screen, (150, 0, 0), [
-                (rocket_x, rocket_y + 20),
-                (rocket_x + 15, rocket_y + 30),
-                (rocket_x, rocket_y + 30)
-            ])
-
-            # Window
-            pygame.draw.circle(screen, (0, 200, 255), (rocket_x - 25, rocket_y), 8)
-
-            # Enemy flame (also sinusoidal but pointing right now)
-            t = pygame.time.get_ticks() * 0.02
-            flame_length = 20 + int(10 * np.sin(t))
-            pygame.draw.polygon(screen, (255, 120, 0), [
-                (rocket_x, rocket_y - 20),
-                (rocket_x, rocket_y + 20),
-                (rocket_x + flame_length, rocket_y)
-            ])
-
-            # Move enemy ship
-            ship.ship_pos_x -= ship.speed
-
-            # If they pass the left edge → game over
-            if ship.ship_pos_x < 0:
-                running = False
-
-
-        # --------- Update lasers --------- #
-        for laser in lasers[:]:
-            # Laser beam (red core + yellow glow)
-            pygame.draw.line(screen, (255, 0, 0), (laser[0], laser[1]), (laser[0] + 60, laser[1]), 10)
-            pygame.draw.line(screen, (255, 255, 0), (laser[0], laser[1]), (laser[0] + 60, laser[1]), 4)
-            laser[0] += LASER_SPEED
-
-            if laser[0] >= WIDTH:
-                lasers.remove(laser)
-                continue
-
-            # ---- Collision detection ---- #
-            for ship in ships[:]:
-                if np.abs(laser[0] - ship.ship_pos_x) < 40 and np.abs(laser[1] - ship.ship_pos_y) < 40:
-                    explosions.append(Explosion(laser[0], laser[1]))
-                    ships.remove(ship)
-                    if laser in lasers:
-                        lasers.remove(laser)
-                    spawn_new_ship = True
-                    score += 1
-
-        # --------- Difficulty Scaling --------- #
-        if score >= last_enemy_speed_up + 3:
-            ship_speed += 1
-            last_enemy_speed_up = score
-        if score >= last_player_speed_up + 5:
-            player_speed += 1
-            last_player_speed_up = score
-        if score >= last_enemy_count_up + 10:
-            max_ships += 1
-            last_enemy_count_up = score
-
-        # --------- Update explosions --------- #
-        for exp in explosions[:]:
-            exp.draw_explosion(screen)
-            if exp.circle_radius > 200:
-                explosions.remove(exp)
-
-        # --------- Draw Player Rocket --------- #
-        rocket_x = 50
-        rocket_y = own_ship_pos
-
-        pygame.draw.rect(screen, (200, 200, 255), (rocket_x, rocket_y - 20, 50, 40))  # Body
-        pygame.draw.polygon(screen, (180, 0, 0), [   # Nose cone
-            (rocket_x + 50, rocket_y - 20),
-            (rocket_x + 50, rocket_y + 20),
-            (rocket_x + 70, rocket_y)
-        ])
-        pygame.draw.polygon(screen, (180, 0, 0), [   # Top fin
-            (rocket_x, rocket_y - 20),
-            (rocket_x - 15, rocket_y - 30),
-            (rocket_x, rocket_y - 30)
-        ])
-        pygame.draw.polygon(screen, (180, 0, 0), [   # Bottom fin
-            (rocket_x, rocket_y + 20),
-            (rocket_x - 15, rocket_y + 30),
-            (rocket_x, rocket_y + 30)
-        ])
-        pygame.draw.circle(screen, (0, 150, 255), (rocket_x + 25, rocket_y), 8)  # Window
-
-        # Smooth flame (sinusoidal "breathing")
-        t = pygame.time.get_ticks() * 0.02
-        flame_length = 20 + int(10 * np.sin(t))
-        pygame.draw.polygon(screen, (255, 140, 0), [
-            (rocket_x, rocket_y - 20),
-            (rocket_x, rocket_y + 20),
-            (rocket_x - flame_length, rocket_y)
-        ])
-
-        # --------- Draw Score --------- #
-        score_text = font.render(f"Score: {score}", True, (255, 255, 0))
-        screen.blit(score_text, (WIDTH - 250, 20))
-
-        pygame.display.flip()
-
-    return score
+        up = keys[pygame.K_UP] or keys[pygame.K_w]
+        down = keys[pygame.K_DOWN] or keys[pygame.K_s]
+        profiler.mark("events")
+
+        # --------- Advance the world in fixed ticks --------- #
+        # A slow frame runs several ticks (dropped frames, same game speed);
+        # a fast frame may run none and only redraw.
+        for _ in range(timestep.advance(frame_time)):
+            if inputs is not None:
+                controls = next(inputs, None)
+                if controls is None:   # Recording ran out
+                    return world.score
+            elif pilot is not None:
+                controls = pilot(world)
+            else:
+                controls = Controls(up, down, shots)
+            if recorder is not None:
+                recorder.record(controls)
+            advance_world(world, controls, stars, explosions, profiler)
+            shots = 0
+            if world.over:
+                break
+
+        # --------- Draw (alpha blends the previous tick into the current one) --------- #
+        draw_frame(screen, view, world, stars, rockets, explosions, timestep.alpha,
+                   font, profile_font, profiler)
+
+        view.present()
+        profiler.mark("flip")
+        profiler.end_frame()
+
+    return world.score
+
+# ---------------- GAME OVER SCREEN ---------------- #
+def draw_game_over_screen(screen, font_big, font_small, score, initials, top_scores, rank=None):
+    """Draw the game over screen with the leaderboard and push it to the display."""
+    screen.fill((0, 0, 0))
+
+    text = render_text(font_big, "GAME OVER", (255, 0, 0))
+    screen.blit(text, (WIDTH//2 - 200, HEIGHT//2 - 150))
+
+    score_text = render_text(font_small, f"Your Score: {score} ({initials})", (255, 255, 0))
+    screen.blit(score_text, (WIDTH//2 - 200, HEIGHT//2 - 50))
+
+    if rank is not None:
+        rank_text = render_text(font_small, f"Better than {rank:.0f}% of runs", (200, 200, 200))
+        screen.blit(rank_text, (WIDTH//2 + 250, HEIGHT//2 - 50))
+
+    top_text = render_text(font_small, "Top Scores:", (0, 255, 0))
+    screen.blit(top_text, (WIDTH//2 - 200, HEIGHT//2 + 20))
+
+    if top_scores is None:
+        # Still being saved/loaded in the background
+        waiting = render_text(font_small, "Saving score...", (0, 200, 200))
+        screen.blit(waiting, (WIDTH//2 - 200, HEIGHT//2 + 100))
+    else:
+        for i, (s, ini) in enumerate(top_scores, start=1):
+            entry = render_text(font_small, f"{i}. {s} ({ini or UNKNOWN_INITIALS})", (0, 200, 200))
+            screen.blit(entry, (WIDTH//2 - 200, HEIGHT//2 + 60 + i * 40))
+
+    restart_text = render_text(font_small, "Press ENTER to Play Again or Q to Quit", (200, 200, 200))
+    screen.blit(restart_text, (WIDTH//2 - 300, HEIGHT//2 + 250))
+
+    pygame.display.flip()
 
 # ---------------- MAIN LOOP ---------------- #
 def main():
+    # SPACE_GAME_STARTUP=1: time every step up to the first screen, then quit
+    startup = StartupTimer() if startup_requested() else None
+    mark = startup.mark if startup is not None else lambda step: None
+    mark("imports")
+
     pygame.init()
+    mark("pygame.init")
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Space Game with Initials")
-
-    font_big = pygame.font.SysFont(None, 100)
-    font_small = pygame.font.SysFont(None, 55)
+    mark("window")
+
+    # Fonts, rockets, explosion frames and stars are all made here, behind a
+    # loading bar, so no round has to wait for them
+    assets = new_assets().warm_up(lambda done, total, name: draw_loading_bar(screen, done, total))
+    font_big = assets.font(100)
+    font_small = assets.font(55)
+    mark("assets")
+    profiler = profiler_from_env()   # No-op unless SPACE_GAME_PROFILE is set
+    open_scores()
+    mark("scores")
 
     while True:
-        initials = get_initials(screen)
-        score = run_game(screen)
-        save_score(score, initials)
-        top_scores = load_top_scores()
+        initials = get_initials(screen, startup, assets)
+        seed = random.randrange(2**31)   # Logged with the score, so a round can be re-created
+        world = World(game_rules(), seed)
+        recorder = recorder_from_env(seed, world.rules)   # None unless SPACE_GAME_RECORD is set
+        score = run_game(screen, profiler=profiler, world=world, recorder=recorder,
+                         pilot=pilot_from_env(), assets=assets)
+        if recorder is not None:
+            report_errors(SCORE_WORKER.submit(recorder.save_round, initials, score),
+                          "save the replay")
+        # Saved in the background; the screen shows the results when they arrive
+        pending = SCORE_WORKER.submit(save_and_rank, score, initials, seed=seed, ticks=world.tick)
+        top_scores, rank = None, None
 
         # --------- Game Over Screen --------- #
+        # Nothing changes here, so it is drawn once (again when the scores
+        # arrive or the window was covered); otherwise nothing is pushed.
         showing = True
+        redraw = True
+        clock = pygame.time.Clock()
         while showing:
-            screen.fill((0, 0, 0))
-
-            text = font_big.render("GAME OVER", True, (255, 0, 0))
-            screen.blit(text, (WIDTH//2 - 200, HEIGHT//2 - 150))
-
-            score_text = font_small.render(f"Your Score: {score} ({initials})", True, (255, 255, 0))
-            screen.blit(score_text, (WIDTH//2 - 200, HEIGHT//2 - 50))
-
-            top_text = font_small.render("Top Scores:", True, (0, 255, 0))
-            screen.blit(top_text, (WIDTH//2 - 200, HEIGHT//2 + 20))
-
-            for i, (s, ini) in enumerate(top_scores, start=1):
-                entry = font_small.render(f"{i}. {s} ({ini})", True, (0, 200, 200))
-                screen.blit(entry, (WIDTH//2 - 200, HEIGHT//2 + 60 + i * 40))
-
-            restart_text = font_small.render("Press ENTER to Play Again or Q to Quit", True, (200, 200, 200))
-            screen.blit(restart_text, (WIDTH//2 - 300, HEIGHT//2 + 250))
-
-            pygame.display.flip()
+            if pending is not None and pending.done():
+                try:
+                    top_scores, rank = pending.result()
+                except Exception as e:   # A broken score file must not end the game
+                    print(f"Could not save score: {e}", file=sys.stderr)
+                    top_scores = []
+                pending = None
+                redraw = True
+
+            if redraw:
+                draw_game_over_screen(screen, font_big, font_small, score, initials, top_scores, rank)
+                redraw = False
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    quit_game()
+                if event.type in REDRAW_EVENTS:
+                    redraw = True
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_RETURN:
                         showing = False
                     elif event.key == pygame.K_q:
-                        pygame.quit()
-                        sys.exit()
+                        quit_game()
+
+            clock.tick(FPS)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,131 @@
+# ------------------- IMPORTS ------------------- #
+import pygame                # Surfaces + drawing primitives
+
+# ------------------- ROCKET SHAPES ------------------- #
+# Every rocket is drawn around an anchor point (x, y):
+#   facing = +1 → nose points right (player)
+#   facing = -1 → nose points left  (enemies)
+# The numbers below are the same ones the game loop used to draw each part.
+ROCKET_BACK = 15             # How far the fins stick out behind the anchor
+ROCKET_FRONT = 70            # How far the nose cone reaches in front of it
+ROCKET_HALF_HEIGHT = 30      # Fins reach 30 px above and below the anchor
+FLAME_HALF_HEIGHT = 20       # Flame is as tall as the body (40 px)
+
+PLAYER_COLORS = {"body": (200, 200, 255), "trim": (180, 0, 0),
+                 "window": (0, 150, 255), "flame": (255, 140, 0)}
+ENEMY_COLORS = {"body": (200, 100, 100), "trim": (150, 0, 0),
+                "window": (0, 200, 255), "flame": (255, 120, 0)}
+
+
+def new_alpha_surface(size):
+    """Create a transparent surface, converted for fast blits when possible."""
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    surf.fill((0, 0, 0, 0))
+    return surf
+
+
+def render_rocket(facing, colors):
+    """Draw body, fins and window once. Returns (surface, anchor_x, anchor_y)."""
+    anchor_x = ROCKET_FRONT if facing < 0 else ROCKET_BACK
+    anchor_y = ROCKET_HALF_HEIGHT
+    surf = new_alpha_surface((ROCKET_BACK + ROCKET_FRONT + 1, 2 * ROCKET_HALF_HEIGHT + 1))
+
+    x, y, d = anchor_x, anchor_y, facing
+    # Body (left edge depends on which way we face)
+    body_left = x if d > 0 else x - 50
+    pygame.draw.rect(surf, colors["body"], (body_left, y - 20, 50, 40))
+    # Nose cone
+    pygame.draw.polygon(surf, colors["trim"], [
+        (x + 50 * d, y - 20),
+        (x + 50 * d, y + 20),
+        (x + 70 * d, y)
+    ])
+    # Top + bottom fin
+    pygame.draw.polygon(surf, colors["trim"], [
+        (x, y - 20),
+        (x - 15 * d, y - 30),
+        (x, y - 30)
+    ])
+    pygame.draw.polygon(surf, colors["trim"], [
+        (x, y + 20),
+        (x - 15 * d, y + 30),
+        (x, y + 30)
+    ])
+    # Window
+    pygame.draw.circle(surf, colors["window"], (x + 25 * d, y), 8)
+    return surf, anchor_x, anchor_y
+
+
+def render_flame(facing, length, color):
+    """Draw one flame triangle of the given length. Returns (surface, dx, dy)."""
+    surf = new_alpha_surface((length + 1, 2 * FLAME_HALF_HEIGHT + 1))
+    if facing < 0:
+        # Enemy flame points right, starting at the anchor
+        points = [(0, 0), (0, 2 * FLAME_HALF_HEIGHT), (length, FLAME_HALF_HEIGHT)]
+        dx = 0
+    else:
+        # Player flame points left, ending at the anchor
+        points = [(length, 0), (length, 2 * FLAME_HALF_HEIGHT), (0, FLAME_HALF_HEIGHT)]
+        dx = -length
+    pygame.draw.polygon(surf, color, points)
+    return surf, dx, -FLAME_HALF_HEIGHT
+
+
+# ------------------- SPRITE CACHE ------------------- #
+class RocketSpriteCache:
+    """Renders each rocket variant once, then every ship is a single blit.
+
+    The flame changes length every frame, so it is kept as a separate small
+    overlay that is cached per (variant, length).
+    """
+
+    def __init__(self):
+        self.variants = {
+            "player": (+1, PLAYER_COLORS),
+            "enemy": (-1, ENEMY_COLORS),
+        }
+        self._rockets = {}
+        self._flames = {}
+
+    def rocket(self, variant):
+        """Return (surface, anchor_x, anchor_y) for a rocket variant."""
+        cached = self._rockets.get(variant)
+        if cached is None:
+            facing, colors = self.variants[variant]
+            cached = render_rocket(facing, colors)
+            self._rockets[variant] = cached
+        return cached
+
+    def build(self, flame_lengths=()):
+        """Render every variant, and its flames at these lengths, now (instead of on first use)."""
+        for variant in self.variants:
+            self.rocket(variant)
+            for length in flame_lengths:
+                self.flame(variant, length)
+        return self
+
+    def flame(self, variant, length):
+        """Return (surface, dx, dy) for a flame overlay of a given length."""
+        key = (variant, length)
+        cached = self._flames.get(key)
+        if cached is None:
+            facing, colors = self.variants[variant]
+            cached = render_flame(facing, length, colors["flame"])
+            self._flames[key] = cached
+        return cached
+
+    def draw(self, screen, variant, x, y, flame_length):
+        """Blit one rocket (plus its flame) with its anchor at (x, y)."""
+        surf, ax, ay = self.rocket(variant)
+        flame, fx, fy = self.flame(variant, flame_length)
+        screen.blit(surf, (x - ax, y - ay))
+        screen.blit(flame, (x + fx, y + fy))
+
+    def draw_many(self, screen, variant, positions, flame_length):
+        """Blit many rockets of one variant in two batched `blits` calls."""
+        surf, ax, ay = self.rocket(variant)
+        flame, fx, fy = self.flame(variant, flame_length)
+        screen.blits([(surf, (x - ax, y - ay)) for x, y in positions], doreturn=False)
+        screen.blits([(flame, (x + fx, y + fy)) for x, y in positions], doreturn=False)
@@ -0,0 +1,97 @@
+# ------------------- IMPORTS ------------------- #
+import numpy as np           # Star positions live in arrays, updated all at once
+import pygame                # Surfaces + surfarray for bulk pixel writes
+
+
+def disk_offsets(radius):
+    """Pixel offsets (dx, dy) that make up a filled disk of the given radius."""
+    if radius <= 1:
+        return np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.int32)
+    r = int(radius) - 1
+    dy, dx = np.mgrid[-r:r + 1, -r:r + 1]
+    inside = dx * dx + dy * dy <= r * r + r
+    return dx[inside].astype(np.int32), dy[inside].astype(np.int32)
+
+
+# ------------------- STARFIELD ------------------- #
+class Starfield:
+    """Parallax star layers stored as NumPy arrays.
+
+    Each layer has its own speed (pixels per frame, leftwards) and dot radius.
+    `update` moves and wraps every star in one batched step and `draw` writes
+    all stars of a layer straight into the surface's pixels.
+    """
+
+    def __init__(self, width, height, speeds=(1, 2, 3), stars_per_layer=70,
+                 radii=None, color=(255, 255, 255), seed=None):
+        self.width = width
+        self.height = height
+        self.color = color
+        self.speeds = np.asarray(speeds, dtype=np.float32)
+        self.radii = tuple(radii) if radii is not None else tuple(int(s) for s in speeds)
+
+        count = len(speeds) * stars_per_layer
+        self.x = np.empty(count, dtype=np.float32)
+        self.y = np.empty(count, dtype=np.int32)
+        self.reseed(seed)
+        # Layers are stored back to back, so layer i is a plain slice
+        self.layer = np.repeat(np.arange(len(speeds)), stars_per_layer)
+        self.speed = self.speeds[self.layer]
+        self.slices = [slice(i * stars_per_layer, (i + 1) * stars_per_layer)
+                       for i in range(len(speeds))]
+        self.stamps = [disk_offsets(r) for r in self.radii]
+
+    def reseed(self, seed=None):
+        """Scatter the stars again, exactly like a new Starfield with this seed."""
+        self.rng = np.random.default_rng(seed)
+        self.x[:] = self.rng.uniform(0, self.width, len(self.x))
+        self.y[:] = self.rng.integers(0, self.height, len(self.y))
+        return self
+
+    def __len__(self):
+        return len(self.x)
+
+    def update(self, steps=1):
+        """Move every star left by its layer speed and wrap the ones that left."""
+        self.x -= self.speed * steps
+        wrapped = self.x < 0
+        count = int(np.count_nonzero(wrapped))
+        if count:
+            # Same as before: reappear at the right edge at a random height
+            self.x[wrapped] = self.width
+            self.y[wrapped] = self.rng.integers(0, self.height, count)
+
+    def draw(self, surface):
+        """Draw all stars by writing their pixels in bulk."""
+        try:
+            pixels = pygame.surfarray.pixels2d(surface)
+        except (ValueError, pygame.error):
+            # Surfaces without a 2D pixel view (e.g. 24-bit) get plain circles
+            self._draw_circles(surface)
+            return
+
+        color = surface.map_rgb(self.color)
+        xs = self.x.astype(np.int32)
+        w, h = pixels.shape
+        for part, (dx, dy) in zip(self.slices, self.stamps):
+            px = (xs[part, None] + dx).ravel()
+            py = (self.y[part, None] + dy).ravel()
+            visible = (px >= 0) & (px < w) & (py >= 0) & (py < h)
+            pixels[px[visible], py[visible]] = color
+        del pixels   # Unlock the surface
+
+    def dirty_rects(self):
+        """Rects covering every star as `draw` paints it (for dirty-rect rendering)."""
+        rects = []
+        for part, (dx, dy) in zip(self.slices, self.stamps):
+            reach = int(dx.max())
+            size = 2 * reach + 1
+            xs = (self.x[part].astype(np.int32) - reach).tolist()
+            ys = (self.y[part] - reach).tolist()
+            rects.extend(pygame.Rect(x, y, size, size) for x, y in zip(xs, ys))
+        return rects
+
+    def _draw_circles(self, surface):
+        for part, radius in zip(self.slices, self.radii):
+            for sx, sy in zip(self.x[part].astype(int), self.y[part]):
+                pygame.draw.circle(surface, self.color, (sx, sy), radius)
@@ -0,0 +1,40 @@
+# ------------------- IMPORTS ------------------- #
+import os                    # Reading the opt-in environment variable
+import sys                   # The report goes to stderr
+import time                  # High resolution timer
+
+# Set SPACE_GAME_STARTUP=1 to print how long each step of the start took
+# (imports, pygame, window, fonts, ...) once the first screen is shown, then quit.
+STARTUP_ENV = "SPACE_GAME_STARTUP"
+
+# When this module was first imported: import it before anything heavy, so
+# the time spent importing the game counts too.
+IMPORT_START = time.perf_counter()
+
+
+def startup_requested():
+    """True if the start-up measurement was switched on through the environment."""
+    return os.environ.get(STARTUP_ENV, "") not in ("", "0")
+
+
+# ------------------- STARTUP TIMER ------------------- #
+class StartupTimer:
+    """Named steps of the start, each timed from the end of the previous one."""
+
+    def __init__(self, start=IMPORT_START):
+        self.start = self.last = start
+        self.steps = []
+
+    def mark(self, step):
+        now = time.perf_counter()
+        self.steps.append((step, now - self.last))
+        self.last = now
+
+    def total(self):
+        return self.last - self.start
+
+    def report(self, file=None):
+        file = file or sys.stderr
+        for step, seconds in self.steps:
+            print(f"{step:<14}{seconds * 1000:8.1f} ms", file=file)
+        print(f"{'total':<14}{self.total() * 1000:8.1f} ms", file=file)
@@ -14,27 +14,37 @@ import random
 import sys
 from typing import List, Tuple
 
-import numpy as np
 import pygame
 
 import settings as cfg
 from models import Laser
 from game_objects import Ship, Explosion  # we’ll replace these later with our own
 
-# --- Pygame setup (window + fonts) ---
-pygame.init()
-pygame.font.init()
-screen = pygame.display.set_mode((cfg.WIDTH, cfg.HEIGHT))
-pygame.display.set_caption(cfg.GAME_TITLE)
+StarList = List[Tuple[int, int]]
 
-# We create all star positions once (so they don't "jump" each frame).
-stars: List[Tuple[int, int]] = [
-    (random.randint(0, cfg.WIDTH), random.randint(0, cfg.HEIGHT))
-    for _ in range(cfg.NUM_STARS)
-]
 
+def setup() -> pygame.Surface:
+    """Starts pygame and opens the game window. Returns the screen.
 
-def draw_star_field(surface: pygame.Surface) -> None:
+    This happens in main() (not when the file is imported), so other code
+    can import this file without a window popping up.
+    """
+    pygame.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((cfg.WIDTH, cfg.HEIGHT))
+    pygame.display.set_caption(cfg.GAME_TITLE)
+    return screen
+
+
+def make_stars() -> StarList:
+    """We create all star positions once (so they don't "jump" each frame)."""
+    return [
+        (random.randint(0, cfg.WIDTH), random.randint(0, cfg.HEIGHT))
+        for _ in range(cfg.NUM_STARS)
+    ]
+
+
+def draw_star_field(surface: pygame.Surface, stars: StarList) -> None:
     """Draws small white dots (stars) in the background."""
     for sx, sy in stars:
         pygame.draw.circle(surface, cfg.STAR_COLOR, (sx, sy), cfg.STAR_RADIUS)
@@ -87,7 +97,7 @@ def draw_and_move_lasers(surface: pygame.Surface, lasers: List[Laser]) -> None:
         l.x += cfg.LASER_SPEED_X
 
 
-def run_round() -> int:
+def run_round(screen: pygame.Surface, stars: StarList) -> int:
     """Runs one round of the game. Returns the final score."""
     # --- Round state (variables that reset each round) ---
     lasers: List[Laser] = []
@@ -135,7 +145,7 @@ def run_round() -> int:
 
         # 4) DRAW everything (background → player → enemies → lasers → explosions → score)
         screen.fill((0, 0, 0))
-        draw_star_field(screen)
+        draw_star_field(screen, stars)
         draw_player_rocket(screen, own_y)
 
         # Enemies
@@ -184,7 +194,7 @@ def run_round() -> int:
     return score
 
 
-def show_game_over(score: int) -> None:
+def show_game_over(screen: pygame.Surface, score: int) -> None:
     """Shows GAME OVER and waits for Enter to restart."""
     screen.fill((0, 0, 0))
     big_font = pygame.font.SysFont(None, cfg.GAME_OVER_FONT_SIZE)
@@ -211,9 +221,11 @@ def show_game_over(score: int) -> None:
 
 def main() -> None:
     """Plays forever: run a round → show game over → repeat."""
+    screen = setup()
+    stars = make_stars()
     while True:
-        score = run_round()
-        show_game_over(score)
+        score = run_round(screen, stars)
+        show_game_over(screen, score)
 
 
 if __name__ == "__main__":
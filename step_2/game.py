@@ -7,68 +7,256 @@ game.py
 Main game loop, now delegating drawing/behavior to sprites and UI helpers.
 
 Reading guide for kids:
-- Big blocks: setup → input → update → draw → collide → score → game over.
+- Big blocks: setup → input → update → collide → score → draw → game over.
 - Each block is short and commented.
 - If you don't know a word, search for the variable in this file.
 """
 
 from __future__ import annotations
 
-import random
+import os
 import sys
-from typing import List, Tuple
+from functools import partial
+from typing import Callable, List, Optional, Tuple
 
+import numpy as np
 import pygame
 
-import settings as cfg
-from models import Laser
-from sprites import Player, Enemy, Explosion      # Step 2: our own sprites
-from ui import draw_score, show_game_over_blocking  # Step 2: UI helpers
-
-# --- Pygame setup (window + fonts) ---
-pygame.init()
-pygame.font.init()
-screen = pygame.display.set_mode((cfg.WIDTH, cfg.HEIGHT))
-pygame.display.set_caption(cfg.GAME_TITLE)
-
-# Cache fonts (creating fonts per frame is slower)
-score_font = pygame.font.SysFont(None, cfg.SCORE_FONT_SIZE)
-
-# Pre-create star positions once so they don't "jump" each frame.
-stars: List[Tuple[int, int]] = [
-    (random.randint(0, cfg.WIDTH), random.randint(0, cfg.HEIGHT))
-    for _ in range(cfg.NUM_STARS)
-]
-
-
-def draw_star_field(surface: pygame.Surface) -> None:
-    """Draw small white dots (stars) in the background."""
-    for sx, sy in stars:
-        pygame.draw.circle(surface, cfg.STAR_COLOR, (sx, sy), cfg.STAR_RADIUS)
-
-
-def draw_and_move_lasers(surface: pygame.Surface, lasers: List[Laser]) -> None:
-    """Draw each laser and move it to the right."""
-    for l in lasers:
-        start = (l.x, l.y)
-        end = (l.x + cfg.LASER_WIDTH, l.y)
-        pygame.draw.line(surface, cfg.LASER_COLOR, start, end, cfg.LASER_THICKNESS)
-        l.x += cfg.LASER_SPEED_X
-
+if __name__ == "__main__":
+    # Shared engine helpers (starfield, hit test, ...) live in the repo root.
+    # Only the game itself puts it on the path: importing this module changes
+    # nothing, so whoever imports it (tools, tests) sets up the path first.
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-def _laser_rect(l: Laser) -> pygame.Rect:
-    """A small rectangle approximating the laser beam for collisions."""
+import settings as cfg
+from sprites import Player, Enemy, LaserSprite, Explosion  # Step 2: our own sprites
+from ui import ScoreLabel, ProfilerOverlay, show_game_over_blocking  # Step 2: UI helpers
+from starfield import Starfield                     # NumPy star layers (repo root)
+from assets import Assets, draw_loading_bar         # Fonts etc. made once (repo root)
+from profiler import NULL_PROFILER, profiler_from_env  # Opt-in frame timing (repo root)
+from laser_pool import LaserPool                    # Reused laser slots (repo root)
+from broadphase import box_hits                     # Batched laser/enemy hit test (repo root)
+from dirty_render import REDRAW_EVENTS              # Window uncovered → repaint (repo root)
+
+# Nothing happens when this file is imported: pygame, the window, the fonts
+# and the stars are all set up by main(), so tools and tests can import it
+# without a display.
+
+
+def setup() -> pygame.Surface:
+    """Start pygame and open the game window.
+
+    Returns:
+        pygame.Surface: The screen.
+    """
+    pygame.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((cfg.WIDTH, cfg.HEIGHT))
+    pygame.display.set_caption(cfg.GAME_TITLE)
+    return screen
+
+
+# Drawing layers, back to front. Sprites on a higher layer cover lower ones.
+LAYER_STARS, LAYER_SHIPS, LAYER_LASERS, LAYER_FX, LAYER_HUD = range(5)
+
+
+class StarLayer(pygame.sprite.DirtySprite):
+    """Moving stars as one full-screen sprite (black is see-through).
+
+    Only used when some star layer has a speed; still stars are simply
+    painted into the background once (see `make_background`).
+    """
+
+    def __init__(self, starfield: Starfield, size: Tuple[int, int]) -> None:
+        super().__init__()
+        self.stars = starfield
+        self.image = pygame.Surface(size).convert()
+        self.image.set_colorkey((0, 0, 0))
+        self.rect = self.image.get_rect()
+        self.dirty = 2  # Stars move every frame → always repainted
+
+    def update(self) -> None:
+        """Draw the stars where they are, then drift each layer."""
+        self.image.fill((0, 0, 0))
+        self.stars.draw(self.image)
+        self.stars.update()
+
+
+def make_background(size: Tuple[int, int], stars: Starfield) -> pygame.Surface:
+    """Black space behind all sprites, with the stars in it if they never move."""
+    background = pygame.Surface(size).convert()
+    background.fill((0, 0, 0))
+    if not stars.speeds.any():
+        stars.draw(background)
+    return background
+
+
+def move_lasers(lasers: LaserPool, beams: List[LaserSprite]) -> None:
+    """Move all lasers to the right in one step, then put their sprites there."""
+    lasers.move()
+    slots = lasers.live_slots()
+    for slot, x, y in zip(slots.tolist(), lasers.x[slots].tolist(), lasers.y[slots].tolist()):
+        beams[slot].place(x, y)
+
+
+def find_hits(lasers: LaserPool, enemies: List[Enemy]) -> List[Tuple[int, Enemy]]:
+    """All laser/enemy hits of this frame, tested in one batch.
+
+    Each laser is a small box around the beam (where its sprite is drawn),
+    each enemy its bounding box (same box as `Enemy.bbox`). One laser
+    destroys at most one enemy, and older lasers get the first pick, just
+    like checking them one by one. See `find_group_hits` for the same test
+    done on the sprite groups.
+
+    Returns:
+        List[Tuple[int, Enemy]]: (laser slot, enemy) for every hit.
+    """
+    slots = lasers.live_slots()
+    if len(slots) == 0 or not enemies:
+        return []
     half_thick = max(1, cfg.LASER_THICKNESS // 2)
-    return pygame.Rect(l.x, l.y - half_thick, cfg.LASER_WIDTH, cfg.LASER_THICKNESS)
+    lx = lasers.x[slots]
+    top = lasers.y[slots] - half_thick
+    ex = np.fromiter((e.x for e in enemies), dtype=np.float64, count=len(enemies))
+    ey = np.fromiter((e.y for e in enemies), dtype=np.float64, count=len(enemies))
+    laser_i, enemy_i = box_hits(
+        lx, top, lx + cfg.LASER_WIDTH, top + cfg.LASER_THICKNESS,
+        ex - Enemy.HALF_WIDTH, ey - Enemy.HALF_HEIGHT,
+        ex + Enemy.HALF_WIDTH, ey + Enemy.HALF_HEIGHT,
+        one_per_a=True,
+    )
+    return [(slot, enemies[i]) for slot, i in zip(slots[laser_i].tolist(), enemy_i.tolist())]
+
+
+def beam_hits_saucer(beam: LaserSprite, enemy: Enemy) -> bool:
+    """Group hit test: the beam touches the enemy's bounding box."""
+    return beam.rect.colliderect(enemy.bbox)
+
+
+def find_group_hits(beams: pygame.sprite.Group,
+                    enemies: pygame.sprite.Group) -> List[Tuple[int, Enemy]]:
+    """All laser/enemy hits of this frame, found with one `groupcollide`.
+
+    Used with cfg.SPRITE_GROUP_HITS. The test is the enemy's bounding box
+    (same hits as `find_hits`), or the sprites' pixel masks with
+    cfg.PIXEL_PERFECT_HITS. One laser destroys at most one enemy, and older
+    lasers get the first pick (groups keep the order sprites were added in).
+
+    Returns:
+        List[Tuple[int, Enemy]]: (laser slot, enemy) for every hit.
+    """
+    collided = pygame.sprite.collide_mask if cfg.PIXEL_PERFECT_HITS else beam_hits_saucer
+    hits: List[Tuple[int, Enemy]] = []
+    taken = set()
+    for beam, touched in pygame.sprite.groupcollide(beams, enemies, False, False, collided).items():
+        for e in touched:
+            if e not in taken:
+                taken.add(e)
+                hits.append((beam.slot, e))
+                break
+    return hits
+
+
+class GameAssets(Assets):
+    """Everything a round draws with, made once for the whole game.
+
+    Adds step 2's own sprite images, the background and the star layer to
+    the shared asset manager (repo root). Like there, everything is made on
+    first use, and `warm_up` makes it all up front.
+    """
+
+    font_sizes = (cfg.SCORE_FONT_SIZE, cfg.PROFILE_FONT_SIZE, cfg.GAME_OVER_FONT_SIZE)
+
+    def __init__(self) -> None:
+        # All stars live in NumPy arrays, so even 10k+ stars are cheap to move and draw.
+        super().__init__(
+            cfg.WIDTH,
+            cfg.HEIGHT,
+            speeds=cfg.STAR_LAYER_SPEEDS,
+            stars_per_layer=cfg.NUM_STARS // len(cfg.STAR_LAYER_SPEEDS),
+            radii=[cfg.STAR_RADIUS] * len(cfg.STAR_LAYER_SPEEDS),
+            color=cfg.STAR_COLOR,
+        )
+        self._background = None
+        self._star_layer = None
+
+    def background(self) -> pygame.Surface:
+        """Black space with the still stars in it (see `make_background`)."""
+        if self._background is None:
+            self._background = make_background((self.width, self.height), self.stars())
+        return self._background
+
+    def star_layer(self) -> Optional[StarLayer]:
+        """The sprite with the moving stars, or None if no star layer moves."""
+        stars = self.stars()
+        if self._star_layer is None and stars.speeds.any():
+            self._star_layer = StarLayer(stars, (self.width, self.height))
+        return self._star_layer
+
+    def steps(self) -> List[Tuple[str, Callable[[], object]]]:
+        """What `warm_up` does: fonts, sprite images, stars, background."""
+        steps: List[Tuple[str, Callable[[], object]]] = [
+            (f"font {size}", partial(self.font, size)) for size in self.font_sizes
+        ]
+        steps += [
+            ("player", Player.cached_image),
+            ("enemy", Enemy.cached_image),
+            ("laser", LaserSprite.cached_image),
+        ]
+        # Explosions grow by 10 px per frame until they reach the max radius
+        steps += [
+            (f"explosion {radius}", partial(Explosion.image_for, radius))
+            for radius in range(0, cfg.MAX_BLAST_RADIUS, 10)
+        ]
+        steps += [("stars", self.stars), ("background", self.background), ("star layer", self.star_layer)]
+        return steps
+
+
+def run_round(screen: pygame.Surface, assets: GameAssets, profiler=NULL_PROFILER) -> int:
+    """Run one round of the game and return the final score.
+
+    Args:
+        screen (pygame.Surface): The game window (see `setup`).
+        assets (GameAssets): Fonts, images, stars and background (see `GameAssets`).
+        profiler: Frame timings (see profiler.py); does nothing by default.
+    """
+    # --- Sprite groups ---
+    # `layers` draws everything (only the parts of the screen that changed);
+    # the plain groups are for updating and for group hits (cfg.SPRITE_GROUP_HITS).
+    layers = pygame.sprite.LayeredDirty()
+    enemies = pygame.sprite.Group()
+    beams = pygame.sprite.Group()
+    explosions = pygame.sprite.Group()
+
+    def spawn(enemy: Enemy) -> None:
+        enemies.add(enemy)
+        layers.add(enemy, layer=LAYER_SHIPS)
+
+    def boom(x: float, y: float) -> None:
+        explosion = Explosion(x=int(x), y=int(y))
+        explosions.add(explosion)
+        layers.add(explosion, layer=LAYER_FX)
 
-
-def run_round() -> int:
-    """Run one round of the game and return the final score."""
     # --- Round state (resets every round) ---
     player = Player()
-    enemies: List[Enemy] = [Enemy(speed=cfg.FIRST_SHIP_SPEED)]
-    explosions: List[Explosion] = []
-    lasers: List[Laser] = []
+    layers.add(player, layer=LAYER_SHIPS)
+    spawn(Enemy(speed=cfg.FIRST_SHIP_SPEED))
+    # Fixed pool: shooting reuses slots (and their sprites) instead of creating objects
+    lasers = LaserPool(cfg.MAX_LASERS, speed=cfg.LASER_SPEED_X)
+    beam_sprites = [LaserSprite(slot) for slot in range(cfg.MAX_LASERS)]
+
+    star_layer = assets.star_layer()
+    if star_layer is not None:
+        layers.add(star_layer, layer=LAYER_STARS)
+    score_label = ScoreLabel(assets.font(cfg.SCORE_FONT_SIZE))
+    overlay = ProfilerOverlay(profiler, assets.font(cfg.PROFILE_FONT_SIZE), (cfg.WIDTH - 320, 20))
+    layers.add(score_label, overlay, layer=LAYER_HUD)
+
+    # Paint the whole background once; after that only changed parts are redrawn
+    background = assets.background()
+    layers.clear(screen, background)
+    screen.blit(background, (0, 0))
+    pygame.display.flip()
 
     ship_speed: int = cfg.FIRST_SHIP_SPEED
     score: int = 0
@@ -79,87 +267,113 @@ def run_round() -> int:
 
     # --- Main loop ---
     while running:
+        profiler.begin_frame()
+
         # 1) Events (quit, one-shot keys like SPACE)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
+            if event.type in REDRAW_EVENTS:
+                layers.repaint_rect(screen.get_rect())
+
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
-                    lasers.append(player.shoot())
+                    slot = lasers.fire(*player.muzzle())
+                    if slot is not None:
+                        beam = beam_sprites[slot]
+                        beam.place(lasers.x[slot], lasers.y[slot])
+                        beams.add(beam)
+                        layers.add(beam, layer=LAYER_LASERS)
                 elif event.key == pygame.key.key_code("r"):
                     # Debug: spawn an extra enemy
-                    enemies.append(Enemy(speed=ship_speed))
+                    spawn(Enemy(speed=ship_speed))
 
         # 2) Continuous input (held keys)
         player.handle_input(pygame.key.get_pressed())
+        profiler.mark("events")
 
         # 3) Spawn a new enemy if flagged (after a destroy)
         if spawn_new_enemy:
-            enemies.append(Enemy(speed=ship_speed))
+            spawn(Enemy(speed=ship_speed))
             spawn_new_enemy = False
+        profiler.mark("spawn")
 
         # 4) UPDATE world (move enemies, grow explosions, cull finished)
-        for e in enemies[:]:
+        for e in enemies.sprites():
             e.update()
             if e.reached_end():
                 # An enemy got past us → round ends.
-                enemies.remove(e)
+                e.kill()
                 running = False
+        profiler.mark("ships")
 
-        for ex in explosions[:]:
+        for ex in explosions.sprites():
             ex.update()
             if ex.done():
-                explosions.remove(ex)
-
-        # 5) DRAW everything (background → player → enemies → lasers → explosions → UI)
-        screen.fill((0, 0, 0))
-        draw_star_field(screen)
-        player.draw(screen)
-
-        for e in enemies:
-            e.draw(screen)
-
-        draw_and_move_lasers(screen, lasers)
-
-        for ex in explosions:
-            ex.draw(screen)
-
-        # 6) LASER housekeeping (offscreen → big boom for fun)
-        for l in lasers[:]:
-            if l.x >= cfg.LASER_RIGHT_LIMIT:
-                explosions.append(Explosion(x=l.x, y=l.y))
-                lasers.remove(l)
-
-        # 7) COLLISIONS: laser vs enemy
-        for l in lasers[:]:
-            lrect = _laser_rect(l)
-            for e in enemies[:]:
-                if lrect.colliderect(e.bbox):
-                    explosions.append(Explosion(x=l.x, y=l.y))
-                    enemies.remove(e)
-                    lasers.remove(l)
-                    spawn_new_enemy = True
-                    score += 1
-                    if cfg.SPEED_UP_EVERY > 0 and (score % cfg.SPEED_UP_EVERY == 0):
-                        ship_speed += 1
-                    break  # this laser is consumed
-
-        # 8) UI (score on top-right)
-        draw_score(screen, score, font=score_font)
-
-        pygame.display.flip()
+                ex.kill()
+        profiler.mark("explosions")
+
+        for layer in layers.get_sprites_from_layer(LAYER_STARS):
+            layer.update()
+        profiler.mark("stars")
+
+        # 5) LASERS: move, then remove the ones past the limit (→ big boom for fun)
+        #    All lasers are moved and culled at once.
+        move_lasers(lasers, beam_sprites)
+        for slot in lasers.cull(cfg.LASER_RIGHT_LIMIT).tolist():
+            beam_sprites[slot].kill()
+            boom(lasers.x[slot], lasers.y[slot])
+        profiler.mark("lasers")
+
+        # 6) COLLISIONS: laser vs enemy (all pairs in one batch, or the sprite groups)
+        if cfg.SPRITE_GROUP_HITS:
+            hits = find_group_hits(beams, enemies)
+        else:
+            hits = find_hits(lasers, enemies.sprites())
+        for slot, e in hits:
+            boom(lasers.x[slot], lasers.y[slot])
+            lasers.kill(slot)  # this laser is consumed
+            beam_sprites[slot].kill()
+            e.kill()
+            spawn_new_enemy = True
+            score += 1
+            if cfg.SPEED_UP_EVERY > 0 and (score % cfg.SPEED_UP_EVERY == 0):
+                ship_speed += 1
+        profiler.mark("collisions")
+
+        # 7) UI (score on top-right; re-rendered only when it changes)
+        score_label.set_score(score)
+        overlay.update()
+        profiler.mark("hud")
+
+        # 8) DRAW: the group repaints what moved and tells us which rects changed
+        pygame.display.update(layers.draw(screen))
+        profiler.mark("flip")
+        profiler.end_frame()
         clock.tick(cfg.FPS)
 
+    # The star layer is kept for the next round: let go of this round's group
+    layers.empty()
     return score
 
 
 def main() -> None:
     """Play forever: run a round → show game over → repeat."""
+    screen = setup()
+
+    # Fonts, images, stars and background are all made once, behind a loading
+    # bar, so every round (and its first explosion) starts without a hitch.
+    assets = GameAssets().warm_up(lambda done, total, name: draw_loading_bar(screen, done, total))
+
+    # Frame timings: does nothing unless SPACE_GAME_PROFILE=<file.csv|file.json>
+    # is set, then shows an overlay next to the score and writes the file on exit.
+    profiler = profiler_from_env()
+
     while True:
-        score = run_round()
-        show_game_over_blocking(screen, score)
+        score = run_round(screen, assets, profiler)
+        show_game_over_blocking(screen, score, assets.font(cfg.GAME_OVER_FONT_SIZE))
 
 
 if __name__ == "__main__":
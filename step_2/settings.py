@@ -34,8 +34,8 @@ FPS: int = 60
 
 # ───────────────────────────── Background Stars ─────────────────────────────
 NUM_STARS: int = 1000
-# Number of background stars to render. Higher values look richer but cost more
-# draw calls. Typical: 200–1500 for 2D games.
+# Number of background stars to render. Stars are drawn in bulk with NumPy, so
+# even 10000+ stay cheap. Typical: 200–1500 for 2D games.
 
 STAR_COLOR: Tuple[int, int, int] = (255, 255, 255)
 # RGB color of stars. Keep near white for a space look (e.g., (220, 230, 255)
@@ -44,6 +44,11 @@ STAR_COLOR: Tuple[int, int, int] = (255, 255, 255)
 STAR_RADIUS: int = 2
 # Pixel radius of each star. 1–3 is subtle; >3 starts to look like orbs.
 
+STAR_LAYER_SPEEDS: Tuple[int, ...] = (0,)
+# Leftward drift of each star layer in pixels per frame. NUM_STARS is split
+# evenly across the layers. (0,) keeps a still background; (1, 2, 3) gives
+# a parallax effect where nearer layers move faster.
+
 
 # ───────────────────────────── Player Rocket ────────────────────────────────
 PLAYER_START_Y: int = 250
@@ -99,6 +104,23 @@ LASER_RIGHT_LIMIT: int = 1850
 # slightly less than WIDTH to avoid drawing off-screen. If you change WIDTH,
 # consider updating this to WIDTH - margin.
 
+MAX_LASERS: int = 256
+# How many lasers can fly at once. They live in a fixed pool that is reused,
+# so no memory is allocated while shooting. Shots beyond this are ignored;
+# a laser is on screen for about LASER_RIGHT_LIMIT / LASER_SPEED_X frames.
+
+SPRITE_GROUP_HITS: bool = False
+# False: every laser is tested against every enemy box in one NumPy batch
+# (game.find_hits), the fast choice with many lasers and enemies.
+# True: one pygame.sprite.groupcollide on the laser and enemy groups
+# (game.find_group_hits), the way the pygame docs do it. Same hits, slower.
+
+PIXEL_PERFECT_HITS: bool = False
+# Only with SPRITE_GROUP_HITS. False: a laser hits an enemy when the beam
+# touches the saucer's bounding box (Enemy.bbox). True: only when drawn pixels
+# overlap (sprite masks) — fairer near the saucer's rounded edges, a little
+# slower, and a bit harder to score.
+
 
 # ───────────────────────────── Explosions ───────────────────────────────────
 MAX_BLAST_RADIUS: int = 300
@@ -123,6 +145,9 @@ SCORE_COLOR: Tuple[int, int, int] = (255, 255, 0)
 SCORE_FONT_SIZE: int = 50
 # Font size for the score, in points/pixels depending on font backend.
 
+PROFILE_FONT_SIZE: int = 26
+# Font size for the frame-timing overlay (only shown with SPACE_GAME_PROFILE).
+
 GAME_OVER_FONT_SIZE: int = 150
 # Font size for the "Game Over" banner. Should be large enough for instant read.
 
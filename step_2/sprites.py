@@ -4,17 +4,22 @@
 
 """
 sprites.py
-Sprite-like classes that encapsulate state, drawing, and per-frame updates.
+Sprite classes that encapsulate state, drawing, and per-frame updates.
 
 This module keeps *behavior with the thing that owns it*:
 - Player handles input, movement, rendering, and shooting.
 - Enemy moves left, knows when it exits the screen, and renders itself.
+- LaserSprite shows one laser of the game's laser pool.
 - Explosion grows then disappears, and renders itself each frame.
 
 Design notes
 ------------
-- No global state. All state lives on objects.
-- No pygame init here; callers are responsible for pygame setup.
+- Every class is a `pygame.sprite.DirtySprite`: an `image` plus a `rect`.
+  A `LayeredDirty` group draws them and only repaints what changed.
+- Images are drawn with pygame primitives ONCE (per class, or per explosion
+  size) and shared, so drawing a frame is just blits.
+- The only global state is those image caches. No pygame init here; callers
+  are responsible for pygame setup (images are made on first use).
 - Screen-space coordinates:
   * x grows to the right (pixels)
   * y grows downward (pixels)
@@ -22,8 +27,7 @@ Design notes
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import pygame
 
@@ -31,19 +35,72 @@ import settings as cfg
 from models import Laser
 
 
-class Player:
+def _new_image(size: Tuple[int, int]) -> pygame.Surface:
+    """A transparent surface, in the display's pixel format once a window exists."""
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha()
+    return image
+
+
+def draw_rocket(surface: pygame.Surface, x: int, y: int) -> None:
+    """Draw the player rocket with pygame primitives.
+
+    Args:
+        surface (pygame.Surface): Target drawing surface.
+        x (int): Left edge of the rocket body (the fins and flame reach 15px further).
+        y (int): Vertical center of the rocket.
+    """
+    # Body
+    pygame.draw.rect(surface, cfg.ROCKET_BODY_COLOR, (x, y - 20, 50, 40))
+
+    # Nose cone (triangle)
+    pygame.draw.polygon(surface, cfg.ROCKET_NOSE_COLOR, [
+        (x + 50, y - 20),
+        (x + 50, y + 20),
+        (x + 70, y),
+    ])
+
+    # Fins (triangles)
+    pygame.draw.polygon(surface, cfg.ROCKET_NOSE_COLOR, [
+        (x, y - 20),
+        (x - 15, y - 30),
+        (x, y - 30),
+    ])
+    pygame.draw.polygon(surface, cfg.ROCKET_NOSE_COLOR, [
+        (x, y + 20),
+        (x - 15, y + 30),
+        (x, y + 30),
+    ])
+
+    # Window
+    pygame.draw.circle(surface, cfg.ROCKET_WINDOW_COLOR, (x + 25, y), 8)
+
+    # Flame: a fixed MIN looks clean (and the image is only drawn once anyway)
+    flame_len = cfg.FLAME_MIN
+    pygame.draw.polygon(surface, cfg.FLAME_COLOR, [
+        (x, y - 20),
+        (x, y + 20),
+        (x - flame_len, y),
+    ])
+
+
+class Player(pygame.sprite.DirtySprite):
     """The player rocket: position, input, drawing, and shooting.
 
     The player moves vertically around a fixed x-position (cfg.ROCKET_X).
-    Shooting returns a new `Laser` instance that the caller manages.
+    `muzzle()` tells where a shot starts; `shoot()` returns a new `Laser`.
 
     Attributes:
         x (int): Fixed horizontal position in pixels.
         y (int): Current vertical position in pixels.
-
+        image (pygame.Surface): The rocket, drawn once and shared.
+        rect (pygame.Rect): Where the image goes on screen.
     """
 
-    __slots__ = ("x", "y")
+    # How far the image reaches left of / above (x, y): fins and flame.
+    ANCHOR: Tuple[int, int] = (cfg.FLAME_MIN, 30)
+    _image: Optional[pygame.Surface] = None
 
     def __init__(self, x: int = cfg.ROCKET_X, y: int = cfg.PLAYER_START_Y) -> None:
         """Initialize the player at a given position.
@@ -52,8 +109,31 @@ class Player:
             x (int): Horizontal position in pixels. Defaults to cfg.ROCKET_X.
             y (int): Vertical position in pixels. Defaults to cfg.PLAYER_START_Y.
         """
+        super().__init__()
         self.x = x
         self.y = y
+        self.image = Player.cached_image()
+        self.rect = self.image.get_rect()
+        self._place()
+
+    @classmethod
+    def cached_image(cls) -> pygame.Surface:
+        """The rocket image, drawn the first time it is needed.
+
+        Returns:
+            pygame.Surface: Shared by every Player.
+        """
+        if cls._image is None:
+            ax, ay = cls.ANCHOR
+            cls._image = _new_image((ax + 71, 2 * ay + 1))
+            draw_rocket(cls._image, ax, ay)
+        return cls._image
+
+    def _place(self) -> None:
+        """Move the rect to (x, y) and ask the group to repaint us."""
+        ax, ay = self.ANCHOR
+        self.rect.topleft = (self.x - ax, self.y - ay)
+        self.dirty = 1
 
     def handle_input(self, keys: pygame.key.ScancodeWrapper) -> None:
         """Apply continuous input (held keys) to the player's position.
@@ -64,11 +144,23 @@ class Player:
         Notes:
             - Movement is clamped to stay within the screen.
             - Uses cfg.PLAYER_MOVE_STEP for step size.
+            - The rocket is only repainted when it actually moved.
         """
+        old_y = self.y
         if keys[pygame.K_UP]:
             self.y = max(50, self.y - cfg.PLAYER_MOVE_STEP)
         if keys[pygame.K_DOWN]:
             self.y = min(cfg.HEIGHT - 50, self.y + cfg.PLAYER_MOVE_STEP)
+        if self.y != old_y:
+            self._place()
+
+    def muzzle(self) -> Tuple[int, int]:
+        """Where a new laser starts: the rocket's nose.
+
+        Returns:
+            Tuple[int, int]: (x, y) slightly ahead of the rocket body.
+        """
+        return self.x + 50, self.y
 
     def shoot(self) -> Laser:
         """Create a new laser originating at the rocket's nose.
@@ -76,49 +168,16 @@ class Player:
         Returns:
             Laser: A laser positioned slightly ahead of the rocket body.
         """
-        return Laser(x=self.x + 50, y=self.y)
+        x, y = self.muzzle()
+        return Laser(x=x, y=y)
 
     def draw(self, surface: pygame.Surface) -> None:
-        """Render the player rocket.
+        """Render the player rocket (for drawing without a sprite group).
 
         Args:
             surface (pygame.Surface): Target drawing surface.
         """
-        x, y = self.x, self.y
-
-        # Body
-        pygame.draw.rect(surface, cfg.ROCKET_BODY_COLOR, (x, y - 20, 50, 40))
-
-        # Nose cone (triangle)
-        pygame.draw.polygon(surface, cfg.ROCKET_NOSE_COLOR, [
-            (x + 50, y - 20),
-            (x + 50, y + 20),
-            (x + 70, y),
-        ])
-
-        # Fins (triangles)
-        pygame.draw.polygon(surface, cfg.ROCKET_NOSE_COLOR, [
-            (x, y - 20),
-            (x - 15, y - 30),
-            (x, y - 30),
-        ])
-        pygame.draw.polygon(surface, cfg.ROCKET_NOSE_COLOR, [
-            (x, y + 20),
-            (x - 15, y + 30),
-            (x, y + 30),
-        ])
-
-        # Window
-        pygame.draw.circle(surface, cfg.ROCKET_WINDOW_COLOR, (x + 25, y), 8)
-
-        # Flame (simple flicker)
-        # Keep the random here if you prefer variation; otherwise a fixed MIN looks clean.
-        flame_len = cfg.FLAME_MIN
-        pygame.draw.polygon(surface, cfg.FLAME_COLOR, [
-            (x, y - 20),
-            (x, y + 20),
-            (x - flame_len, y),
-        ])
+        surface.blit(self.image, self.rect)
 
     @property
     def bbox(self) -> pygame.Rect:
@@ -127,11 +186,11 @@ class Player:
         Returns:
             pygame.Rect: Rectangle approximating the rocket body.
         """
-        # Matches draw rect above (x, y - 20, 50, 40), slightly padded.
+        # Matches the body rect (x, y - 20, 50, 40), slightly padded.
         return pygame.Rect(self.x, self.y - 22, 52, 44)
 
 
-class Enemy:
+class Enemy(pygame.sprite.DirtySprite):
     """A basic enemy that moves left at a constant speed.
 
     Attributes:
@@ -140,7 +199,13 @@ class Enemy:
         speed (int): Horizontal speed in pixels per frame (leftwards).
     """
 
-    __slots__ = ("x", "y", "speed")
+    # Half the bounding box size (see `bbox`), for batched collision checks.
+    HALF_WIDTH: int = 30
+    HALF_HEIGHT: int = 20
+    # How far the image reaches left of / above (x, y): the dome is on top.
+    ANCHOR: Tuple[int, int] = (30, 22)
+    _image: Optional[pygame.Surface] = None
+    _mask: Optional[pygame.mask.Mask] = None
 
     def __init__(self, y: Optional[int] = None, speed: int = cfg.FIRST_SHIP_SPEED) -> None:
         """Initialize the enemy.
@@ -149,13 +214,38 @@ class Enemy:
             y (Optional[int]): Vertical spawn position in pixels. If None, mid-screen.
             speed (int): Horizontal speed (px/frame). Defaults to cfg.FIRST_SHIP_SPEED.
         """
+        super().__init__()
         self.x = cfg.WIDTH - 100  # start near the right edge
         self.y = int(y if y is not None else cfg.HEIGHT * 0.5)
         self.speed = speed
 
+        self.image = Enemy.cached_image()
+        self.mask = Enemy._mask  # For pixel-perfect group hits (cfg.PIXEL_PERFECT_HITS)
+        ax, ay = self.ANCHOR
+        self.rect = self.image.get_rect(topleft=(self.x - ax, self.y - ay))
+        self.dirty = 2  # Moves every frame → always repainted
+
+    @classmethod
+    def cached_image(cls) -> pygame.Surface:
+        """The saucer image, drawn the first time it is needed.
+
+        Returns:
+            pygame.Surface: Shared by every Enemy.
+        """
+        if cls._image is None:
+            ax, ay = cls.ANCHOR
+            image = _new_image((2 * ax, ay + 10))
+            # Simple saucer: body + dome
+            pygame.draw.ellipse(image, (180, 180, 180), pygame.Rect(0, ay - 10, 60, 20))
+            pygame.draw.ellipse(image, (120, 170, 220), pygame.Rect(ax - 15, 0, 30, 20))
+            cls._image = image
+            cls._mask = pygame.mask.from_surface(image)
+        return cls._image
+
     def update(self) -> None:
         """Advance the enemy left by its speed."""
         self.x -= self.speed
+        self.rect.x -= self.speed
 
     def reached_end(self) -> bool:
         """Check if the enemy has left the screen at the left edge.
@@ -166,16 +256,12 @@ class Enemy:
         return self.x <= -50
 
     def draw(self, surface: pygame.Surface) -> None:
-        """Render the enemy.
+        """Render the enemy (for drawing without a sprite group).
 
         Args:
             surface (pygame.Surface): Target drawing surface.
         """
-        # Simple saucer: body + dome
-        body_rect = pygame.Rect(self.x - 30, self.y - 10, 60, 20)
-        pygame.draw.ellipse(surface, (180, 180, 180), body_rect)
-        dome_rect = pygame.Rect(self.x - 15, self.y - 22, 30, 20)
-        pygame.draw.ellipse(surface, (120, 170, 220), dome_rect)
+        surface.blit(self.image, self.rect)
 
     @property
     def bbox(self) -> pygame.Rect:
@@ -184,13 +270,67 @@ class Enemy:
         Returns:
             pygame.Rect: Rectangle covering the saucer.
         """
-        return pygame.Rect(self.x - 30, self.y - 20, 60, 40)
+        return pygame.Rect(self.x - self.HALF_WIDTH, self.y - self.HALF_HEIGHT,
+                           2 * self.HALF_WIDTH, 2 * self.HALF_HEIGHT)
+
+
+class LaserSprite(pygame.sprite.DirtySprite):
+    """Shows the laser in one slot of the game's laser pool.
 
+    The round makes one LaserSprite per pool slot up front and reuses it for
+    every shot that lands in that slot, so shooting creates no objects. Hits
+    are tested on the pool's positions (game.find_hits), or on this rect with
+    cfg.SPRITE_GROUP_HITS (game.find_group_hits).
 
-class Explosion:
+    Attributes:
+        slot (int): Index of the laser in the pool.
+    """
+
+    _image: Optional[pygame.Surface] = None
+    _mask: Optional[pygame.mask.Mask] = None
+
+    def __init__(self, slot: int) -> None:
+        """Initialize the sprite of one pool slot (not in any group yet).
+
+        Args:
+            slot (int): Index of the laser in the pool.
+        """
+        super().__init__()
+        self.slot = slot
+        self.image = LaserSprite.cached_image()
+        self.mask = LaserSprite._mask
+        self.rect = self.image.get_rect()
+        self.dirty = 2  # Moves every frame → always repainted
+
+    @classmethod
+    def cached_image(cls) -> pygame.Surface:
+        """The laser beam image, made the first time it is needed.
+
+        Returns:
+            pygame.Surface: Shared by every LaserSprite.
+        """
+        if cls._image is None:
+            cls._image = _new_image((cfg.LASER_WIDTH, cfg.LASER_THICKNESS))
+            cls._image.fill(cfg.LASER_COLOR)
+            cls._mask = pygame.mask.from_surface(cls._image)
+        return cls._image
+
+    def place(self, x: float, y: float) -> None:
+        """Put the beam's tail at (x, y); the beam is centered on y.
+
+        Args:
+            x (float): Laser x-position (from the pool).
+            y (float): Laser y-position (from the pool).
+        """
+        half_thick = max(1, cfg.LASER_THICKNESS // 2)
+        self.rect.topleft = (int(x), int(y) - half_thick)
+
+
+class Explosion(pygame.sprite.DirtySprite):
     """Expanding circle that fades out when it reaches a max radius."""
 
-    __slots__ = ("x", "y", "radius", "max_radius")
+    # radius → image, shared by all explosions (they all grow the same way)
+    _images: Dict[int, pygame.Surface] = {}
 
     def __init__(self, x: int, y: int, max_radius: int = cfg.MAX_BLAST_RADIUS) -> None:
         """Initialize an explosion at a position.
@@ -200,15 +340,48 @@ class Explosion:
             y (int): Vertical center of the explosion.
             max_radius (int): Maximum radius at which the explosion ends.
         """
+        super().__init__()
         self.x = x
         self.y = y
         self.radius = 0
         self.max_radius = max_radius
+        self.image = Explosion.image_for(0)
+        self.rect = self.image.get_rect(center=(x, y))
+        self.visible = 0  # Nothing to show at radius 0
+        self.dirty = 2    # Grows every frame → always repainted
+
+    @classmethod
+    def image_for(cls, radius: int) -> pygame.Surface:
+        """The explosion at one radius, drawn the first time it is needed.
+
+        Args:
+            radius (int): Radius of the outer ring in pixels.
+
+        Returns:
+            pygame.Surface: A (2 * radius + 1) square image.
+        """
+        image = cls._images.get(radius)
+        if image is None:
+            image = _new_image((2 * radius + 1, 2 * radius + 1))
+            if radius > 0:
+                center = (radius, radius)
+                # Outer ring
+                pygame.draw.circle(image, (255, 120, 60), center, radius, width=4)
+                # Inner core
+                inner = max(0, radius // 3)
+                if inner > 0:
+                    pygame.draw.circle(image, (255, 200, 120), center, inner, width=0)
+            cls._images[radius] = image
+        return image
 
     def update(self) -> None:
         """Grow the explosion by a fixed amount per frame."""
         # You can tweak growth speed if desired.
         self.radius += 10
+        if not self.done():
+            self.image = Explosion.image_for(self.radius)
+            self.rect = self.image.get_rect(center=(self.x, self.y))
+            self.visible = 1
 
     def done(self) -> bool:
         """Whether the explosion has reached its maximum size.
@@ -219,16 +392,11 @@ class Explosion:
         return self.radius >= self.max_radius
 
     def draw(self, surface: pygame.Surface) -> None:
-        """Render the explosion as two expanding circles.
+        """Render the explosion (for drawing without a sprite group).
 
         Args:
             surface (pygame.Surface): Target drawing surface.
         """
         if self.radius <= 0:
             return
-        # Outer ring
-        pygame.draw.circle(surface, (255, 120, 60), (self.x, self.y), self.radius, width=4)
-        # Inner core
-        inner = max(0, self.radius // 3)
-        if inner > 0:
-            pygame.draw.circle(surface, (255, 200, 120), (self.x, self.y), inner, width=0)
+        surface.blit(self.image, self.rect)
@@ -4,10 +4,12 @@
 
 """
 ui.py
-Minimal UI helpers for HUD (score) and game-over screen.
+Minimal UI helpers for HUD (score, profiler overlay) and game-over screen.
 
 No pygame initialization occurs here. Callers must ensure pygame.init() and
 pygame.font.init() (or SysFont calls) are made before using functions below.
+The text cache and redraw events come from the repo root, which game.py puts
+on the import path when the game runs.
 """
 
 from __future__ import annotations
@@ -17,6 +19,8 @@ from typing import Optional, Tuple
 import pygame
 
 import settings as cfg
+from text_cache import render_text  # Cached font.render (repo root)
+from dirty_render import REDRAW_EVENTS  # Window uncovered → draw again (repo root)
 
 
 def draw_score(surface: pygame.Surface, score: int, font: Optional[pygame.font.Font] = None) -> None:
@@ -31,6 +35,8 @@ def draw_score(surface: pygame.Surface, score: int, font: Optional[pygame.font.F
     Notes:
         - Creating fonts each frame is more expensive; prefer passing a cached font.
         - Color is taken from cfg.SCORE_COLOR.
+        - The text goes through the shared text cache, so it is only rendered
+          again when the score actually changes.
     """
     if font is None:
         # Lazy-create a font if the caller didn't supply one.
@@ -38,52 +44,131 @@ def draw_score(surface: pygame.Surface, score: int, font: Optional[pygame.font.F
             pygame.font.init()
         font = pygame.font.SysFont(None, cfg.SCORE_FONT_SIZE)
 
-    text = font.render(f"Score: {score}", True, cfg.SCORE_COLOR)
+    text = render_text(font, f"Score: {score}", cfg.SCORE_COLOR)
     rect = text.get_rect()
     rect.top = 20
     rect.right = cfg.WIDTH - 20
     surface.blit(text, rect)
 
 
-def show_game_over_blocking(surface: pygame.Surface, score: int) -> None:
+class ScoreLabel(pygame.sprite.DirtySprite):
+    """HUD sprite with the score in the top-right corner.
+
+    The text is only rendered again (and the sprite only repainted) when the
+    score changes, not every frame.
+    """
+
+    def __init__(self, font: pygame.font.Font, score: int = 0) -> None:
+        """Initialize the label.
+
+        Args:
+            font (pygame.font.Font): Pre-created font (see cfg.SCORE_FONT_SIZE).
+            score (int): Score to show first.
+        """
+        super().__init__()
+        self.font = font
+        self.score = None
+        self.set_score(score)
+
+    def set_score(self, score: int) -> None:
+        """Show a new score (does nothing if it is the one already shown).
+
+        Args:
+            score (int): Current score value to display.
+        """
+        if score == self.score:
+            return
+        self.score = score
+        self.image = render_text(self.font, f"Score: {score}", cfg.SCORE_COLOR)
+        self.rect = self.image.get_rect(top=20, right=cfg.WIDTH - 20)
+        self.dirty = 1
+
+
+class ProfilerOverlay(pygame.sprite.DirtySprite):
+    """HUD sprite with the frame profiler's summary (see profiler.py).
+
+    Only visible when profiling is on; repainted when the profiler refreshes
+    its text (every `every` frames).
+    """
+
+    def __init__(self, profiler, font: pygame.font.Font, topright: Tuple[int, int],
+                 size: Tuple[int, int] = (320, 140), every: int = 30) -> None:
+        """Initialize the overlay.
+
+        Args:
+            profiler: FrameProfiler (or the no-op NullProfiler).
+            font (pygame.font.Font): Font for the summary lines.
+            topright (Tuple[int, int]): Where the overlay's top-right corner goes.
+            size (Tuple[int, int]): Room reserved for the text.
+            every (int): Refresh the text every this many frames.
+        """
+        super().__init__()
+        self.profiler = profiler
+        self.font = font
+        self.every = every
+        self.image = pygame.Surface(size, pygame.SRCALPHA)
+        self.rect = self.image.get_rect(topright=topright)
+        self.visible = int(profiler.enabled)
+
+    def update(self) -> None:
+        """Redraw the summary when the profiler has new numbers."""
+        if not self.visible or self.profiler.frames % self.every:
+            return
+        self.image.fill((0, 0, 0, 0))
+        self.profiler.draw_overlay(self.image, self.font, (self.rect.width, 0), every=self.every)
+        self.dirty = 1
+
+
+def show_game_over_blocking(surface: pygame.Surface, score: int,
+                            font: Optional[pygame.font.Font] = None) -> None:
     """Blocking 'Game Over' screen that waits for Enter to continue.
 
     Args:
         surface (pygame.Surface): Target drawing surface (already created).
         score (int): Final score to display.
+        font (Optional[pygame.font.Font]): Pre-created font. If None, a default
+            font is created using cfg.GAME_OVER_FONT_SIZE.
 
     Behavior:
-        - Renders "GAME OVER" and the score using cfg.GAME_OVER_FONT_SIZE.
+        - Renders "GAME OVER" and the score with `font`.
         - Waits until the user presses Enter (Return) or closes the window.
         - Does not modify global state; caller decides what happens next.
+        - The screen never changes, so it is drawn and pushed to the display
+          once. It is only redrawn if the window was covered or restored.
 
     Raises:
         SystemExit: If the user closes the window (pygame.QUIT).
     """
-    if not pygame.font.get_init():
-        pygame.font.init()
-
-    big_font = pygame.font.SysFont(None, cfg.GAME_OVER_FONT_SIZE)
+    if font is None:
+        # Lazy-create a font if the caller didn't supply one.
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.SysFont(None, cfg.GAME_OVER_FONT_SIZE)
 
-    text1 = big_font.render("GAME OVER", True, (255, 0, 0))
-    text2 = big_font.render(f"--Score: {score}--", True, (255, 0, 0))
+    text1 = render_text(font, "GAME OVER", (255, 0, 0))
+    text2 = render_text(font, f"--Score: {score}--", (255, 0, 0))
 
     rect1 = text1.get_rect(center=(cfg.WIDTH // 2, cfg.HEIGHT // 2 - 100))
     rect2 = text2.get_rect(center=(cfg.WIDTH // 2, cfg.HEIGHT // 2 + 100))
 
     waiting = True
+    redraw = True
     clock = pygame.time.Clock()
 
     while waiting:
-        surface.fill((0, 0, 0))
-        surface.blit(text1, rect1)
-        surface.blit(text2, rect2)
-        pygame.display.flip()
+        if redraw:
+            surface.fill((0, 0, 0))
+            surface.blit(text1, rect1)
+            surface.blit(text2, rect2)
+            pygame.display.flip()
+            redraw = False
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 # Let the caller decide whether to catch this.
                 raise SystemExit
+            if event.type in REDRAW_EVENTS:
+                redraw = True
             if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
                 waiting = False
 
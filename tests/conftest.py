@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The game modules live in the repo root (no package), so tests import them from there.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+import broadphase
+from broadphase import SpatialHash, box_hits
+
+HALF = 40   # The 40 px box around a ship (Rules.hit_half_size)
+
+
+def brute_force(lx, ly, sx, sy, one_per_a):
+    """The old per-laser loop: abs(dx) < 40 and abs(dy) < 40, each ship hit once."""
+    ship_alive = [True] * len(sx)
+    hits = []
+    for a, (x, y) in enumerate(zip(lx, ly)):
+        for b, (ship_x, ship_y) in enumerate(zip(sx, sy)):
+            if ship_alive[b] and abs(x - ship_x) < HALF and abs(y - ship_y) < HALF:
+                ship_alive[b] = False
+                hits.append((a, b))
+                if one_per_a:
+                    break
+    return hits
+
+
+def kernel(lx, ly, sx, sy, one_per_a):
+    ai, bi = box_hits(lx, ly, lx, ly, sx - HALF, sy - HALF, sx + HALF, sy + HALF,
+                      one_per_a=one_per_a)
+    return list(zip(ai.tolist(), bi.tolist()))
+
+
+def layout(rng, lasers, ships):
+    """Random laser tips and ship centers, crowded enough for many overlaps."""
+    lx = rng.integers(0, 600, lasers).astype(np.float64)
+    ly = rng.integers(0, 400, lasers).astype(np.float64)
+    sx = rng.integers(0, 600, ships).astype(np.float64)
+    sy = rng.integers(0, 400, ships).astype(np.float64)
+    return lx, ly, sx, sy
+
+
+@pytest.mark.parametrize("one_per_a", [True, False])
+@pytest.mark.parametrize("lasers, ships", [(5, 8), (20, 40), (80, 120)])
+def test_box_hits_matches_brute_force(one_per_a, lasers, ships):
+    # 5×8 and 20×40 pairs are broadcast, 80×120 goes through the spatial hash
+    rng = np.random.default_rng(lasers * 1000 + ships)
+    for _ in range(50):
+        lx, ly, sx, sy = layout(rng, lasers, ships)
+        assert kernel(lx, ly, sx, sy, one_per_a) == brute_force(lx, ly, sx, sy, one_per_a)
+
+
+@pytest.mark.parametrize("one_per_a", [True, False])
+@pytest.mark.parametrize("max_pairs", [0, 10 ** 9])
+def test_grid_and_broadcast_agree(monkeypatch, one_per_a, max_pairs):
+    # Force every call down one path: 0 → always the grid, huge → always broadcast
+    monkeypatch.setattr(broadphase, "BROADCAST_MAX_PAIRS", max_pairs)
+    rng = np.random.default_rng(7)
+    for _ in range(50):
+        lx, ly, sx, sy = layout(rng, int(rng.integers(1, 60)), int(rng.integers(1, 60)))
+        assert kernel(lx, ly, sx, sy, one_per_a) == brute_force(lx, ly, sx, sy, one_per_a)
+
+
+def test_edges_do_not_count():
+    # Exactly 40 px away is a miss, like abs(dx) < 40
+    sx, sy = np.array([100.0, 100.0]), np.array([100.0, 100.0])
+    lx, ly = np.array([140.0, 139.0]), np.array([100.0, 139.0])
+    assert kernel(lx, ly, sx, sy, True) == [(1, 0)]
+
+
+def test_empty_groups():
+    none = np.zeros(0)
+    one = np.ones(1)
+    for a, b in ((none, one), (one, none)):
+        ai, bi = box_hits(a, a, a, a, b, b, b, b)
+        assert len(ai) == len(bi) == 0
+
+
+@pytest.mark.parametrize("band_height", [None, 7, 40, 500])
+def test_spatial_hash_finds_every_ship_in_reach(band_height):
+    # The grid may return extra ships, but never misses one inside the 40 px box
+    rng = np.random.default_rng(11)
+    for _ in range(50):
+        lx, ly, sx, sy = layout(rng, 30, 60)
+        grid = SpatialHash(sy - HALF, sy + HALF, band_height)
+        for x, y in zip(lx, ly):
+            found = grid.query(y, y)
+            near = [b for b in range(len(sx)) if abs(x - sx[b]) < HALF and abs(y - sy[b]) < HALF]
+            assert set(near) <= set(found.tolist())
+            assert found.tolist() == sorted(found.tolist())   # Insertion order
+
+
+def test_spatial_hash_pairs_match_query():
+    rng = np.random.default_rng(5)
+    lx, ly, sx, sy = layout(rng, 40, 70)
+    grid = SpatialHash(sy - HALF, sy + HALF)
+    ai, bi = grid.pairs(ly, ly)
+    expected = [(a, b) for a, y in enumerate(ly) for b in grid.query(y, y).tolist()]
+    assert ai.tolist() == sorted(ai.tolist())   # Grouped by laser
+    assert sorted(zip(ai.tolist(), bi.tolist())) == expected
+
+
+def test_spatial_hash_skips_far_bands():
+    grid = SpatialHash([0.0, 400.0, 800.0], [80.0, 480.0, 880.0], band_height=80)
+    assert grid.query(420.0, 420.0).tolist() == [1]
+    assert len(grid.query(1500.0, 1500.0)) == 0
@@ -0,0 +1,65 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from dirty_render import DirtyRenderer
+
+
+@pytest.fixture
+def screen():
+    pygame.display.init()
+    yield pygame.display.set_mode((200, 100))
+    pygame.display.quit()
+
+
+def test_partial_updates_erase_last_frame(screen):
+    view = DirtyRenderer(screen, max_rects=10)
+    view.begin()
+    view.present()                               # First frame: full flip
+    view.begin()
+    view.track(screen.fill((255, 0, 0), (10, 10, 5, 5)))
+    assert view.present() == 1                   # Just this rect
+    view.begin()
+    assert screen.get_at((12, 12))[:3] == (0, 0, 0)
+    assert view.present() == 1                   # Just last frame's rect
+
+
+def test_overflow_flips_and_clears_in_one_fill(screen):
+    view = DirtyRenderer(screen, max_rects=10)
+    view.begin()
+    view.present()
+    view.begin()
+    view.track_many(screen.fill((255, 0, 0), (x, 0, 1, 1)) for x in range(20))
+    assert view.overflow and view.current == []  # Stopped collecting
+    assert view.present() == 1                   # Full flip
+    assert view.full_redraw                      # Next frame clears everything
+    view.begin()
+    assert screen.get_at((15, 0))[:3] == (0, 0, 0)
+    assert view.present() == 1
+    assert not view.full_redraw and not view.overflow
+
+
+def test_invalidate_clears_and_flips_the_next_frame(screen):
+    view = DirtyRenderer(screen, max_rects=10)
+    view.begin()
+    view.present()
+    screen.fill((0, 255, 0), (50, 50, 5, 5))     # Drawn behind the renderer's back
+    view.invalidate()
+    view.begin()
+    assert screen.get_at((52, 52))[:3] == (0, 0, 0)
+    assert view.present() == 1
+
+
+def test_round_redraws_after_the_window_is_exposed(screen, monkeypatch):
+    import space_game
+    from simulation import IDLE
+
+    calls = []
+    monkeypatch.setattr(DirtyRenderer, "invalidate", lambda self: calls.append(self))
+    pygame.font.init()
+    pygame.event.post(pygame.event.Event(pygame.WINDOWEXPOSED))
+    space_game.run_game(screen, seed=0, dirty_rects=True, inputs=[IDLE] * 3)
+    assert len(calls) == 1
@@ -0,0 +1,78 @@
+import numpy as np
+
+from effects import Explosions
+from entity_store import EntityStore
+
+
+def store_of(xs):
+    store = EntityStore(capacity=2)   # Small, so adding also has to grow
+    for n, x in enumerate(xs):
+        store.add(x, 10 * n, -1, kind=n)
+    return store
+
+
+def rows(store):
+    return sorted(zip(store.x.tolist(), store.y.tolist(), store.kind.tolist()))
+
+
+def test_remove_swaps_in_the_last_entity():
+    store = store_of([0, 1, 2, 3])
+    store.remove(1)
+    assert store.x.tolist() == [0, 3, 2]
+    assert store.kind.tolist() == [0, 3, 2]
+    store.remove(2)   # The last one: nothing to swap
+    assert store.x.tolist() == [0, 3]
+
+
+def test_sweep_drops_the_same_entities_as_compact():
+    rng = np.random.default_rng(3)
+    for _ in range(50):
+        xs = rng.integers(0, 100, int(rng.integers(1, 40))).tolist()
+        dead = rng.random(len(xs)) < 0.4
+        swept, compacted = store_of(xs), store_of(xs)
+        for store in (swept, compacted):
+            store.alive[dead] = False
+        assert swept.sweep() == compacted.compact() == int(dead.sum())
+        assert rows(swept) == rows(compacted)
+        assert swept.alive.all()
+
+
+def test_move_ages_and_kill_outside_marks():
+    store = store_of([5, 50, 500])
+    store.move(steps=2)
+    assert store.x.tolist() == [3, 48, 498]
+    assert store.age.tolist() == [2, 2, 2]
+    outside = store.kill_outside(left=10, right=400)
+    assert outside.tolist() == [True, False, True]
+    store.sweep()
+    assert store.x.tolist() == [48]
+
+
+class StubAtlas:
+    variant_count = 4
+    frame_count = 3
+
+    def frames(self, variant):
+        return [((variant, k), 0, 0) for k in range(self.frame_count)]
+
+
+class Screen:
+    def __init__(self):
+        self.drawn = []
+
+    def blits(self, batch, doreturn=True):
+        self.drawn.append(batch)
+
+
+def test_explosions_play_every_frame_then_go():
+    explosions = Explosions(StubAtlas())
+    explosions.spawn(10, 20)
+    explosions.update()
+    explosions.spawn(30, 40)
+    screen = Screen()
+    for _ in range(3):
+        explosions.draw(screen)
+        explosions.update()
+    assert len(explosions) == 0
+    frames = [sorted(k for (_, k), _ in batch) for batch in screen.drawn]
+    assert frames == [[0, 1], [1, 2], [2]]
@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imports a module in a fresh interpreter and prints what importing it changed
+CHECK = """
+import sys
+path = list(sys.path)
+import pygame
+import {module}
+print(pygame.display.get_init(), pygame.display.get_surface() is None, sys.path == path)
+"""
+
+
+@pytest.mark.parametrize("folder, module", [
+    (ROOT, "space_game"),
+    (os.path.join(ROOT, "step_1"), "game"),
+    (os.path.join(ROOT, "step_2"), "game"),
+    (os.path.join(ROOT, "step_2"), "ui"),
+])
+def test_import_has_no_side_effects(tmp_path, folder, module):
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy",
+               PYTHONPATH=os.pathsep.join([folder, ROOT]), PYGAME_HIDE_SUPPORT_PROMPT="1")
+    out = subprocess.run([sys.executable, "-c", CHECK.format(module=module)], cwd=tmp_path,
+                         env=env, capture_output=True, text=True, check=True).stdout
+    # No display started, no window, sys.path untouched
+    assert out.split() == ["False", "True", "True"]
+    # Nothing was written next to the game (score files etc.)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,36 @@
+import pytest
+
+from replay import InputRecorder, Replay
+from simulation import Rules, play_round, random_pilot
+
+
+def recorded_round(seed, recorder, fire_chance=0.5, max_ticks=4000):
+    """A seeded headless round with every tick's input going into `recorder`."""
+    pilot = random_pilot(seed, fire_chance)
+
+    def recording_pilot(world):
+        controls = pilot(world)
+        recorder.record(controls)
+        return controls
+    return play_round(seed, recording_pilot, recorder.rules, max_ticks)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 7, 42])
+def test_replay_matches_recording(tmp_path, seed):
+    recorder = InputRecorder(seed, Rules())
+    world = recorded_round(seed, recorder)
+    path = recorder.save(str(tmp_path / "round.rpl"), world.score)
+
+    replay = Replay.load(path)
+    assert (replay.seed, replay.ticks, replay.score) == (seed, world.tick, world.score)
+    replayed = replay.play()
+    assert (replayed.score, replayed.tick) == (world.score, world.tick)
+    assert replay.matches(replayed)
+
+
+def test_replay_notices_a_different_result(tmp_path):
+    recorder = InputRecorder(3, Rules())
+    world = recorded_round(3, recorder)
+    path = recorder.save(str(tmp_path / "round.rpl"), world.score + 1)
+    replay = Replay.load(path)
+    assert not replay.matches(replay.play())
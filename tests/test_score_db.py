@@ -0,0 +1,16 @@
+from score_db import ScoreDatabase, import_text, UNKNOWN_INITIALS
+
+
+def test_import_keeps_unknown_times_off_daily_boards(tmp_path):
+    text = tmp_path / "scores.txt"
+    text.write_text("9,JPH\n13,2025-08-30 21:03\n")
+    db = ScoreDatabase(str(tmp_path / "scores.sqlite"))
+    assert import_text(db, str(text)) == (2, 0)
+    db.add(5, "NEW")
+
+    assert db.top(10) == [(13, UNKNOWN_INITIALS), (9, "JPH"), (5, "NEW")]
+    assert db.top_of_day(None, 10) == [(5, "NEW")]
+    assert db.top_of_day("2025-08-30", 10) == [(13, UNKNOWN_INITIALS)]
+    assert db.connect().execute("SELECT played_at, day FROM scores WHERE initials = 'JPH'").fetchone() == (None, None)
+    db.close()
+
@@ -0,0 +1,40 @@
+from score_log import ScoreLog, migrate, percentile
+
+
+def test_migrate_skips_runs_the_game_already_logged(tmp_path):
+    text = tmp_path / "scores.txt"
+    log = ScoreLog(str(tmp_path / "scores.bin"))
+    # The game logged one round (it is in both files) before the migration ran
+    text.write_text("9,JPH\n13,2025-08-30 21:03\n9,JPH\nnot a row\n20,ABC\n")
+    log.append(20, "ABC")
+
+    assert migrate(str(text), log.path) == (3, 1, 1)
+    assert sorted(log.read()["score"].tolist()) == [9, 9, 13, 20]
+
+    # Running it again adds nothing, so no run is counted twice
+    assert migrate(str(text), log.path) == (0, 4, 1)
+    assert len(log) == 4
+    assert percentile(log.read(), 13) == 50.0
+
+
+def test_migrate_creates_the_log(tmp_path):
+    text = tmp_path / "scores.txt"
+    text.write_text("5,AB\n")
+    path = str(tmp_path / "scores.bin")
+    assert migrate(str(text), path) == (1, 0, 0)
+    assert ScoreLog(path).read()["initials"].tolist() == [b"AB"]
+
+
+def test_bad_run_log_still_shows_top_scores(tmp_path, monkeypatch, capsys):
+    import space_game
+    from leaderboard import Leaderboard
+
+    bad = tmp_path / "scores.bin"
+    bad.write_bytes(b"not a score log at all")
+    monkeypatch.setattr(space_game, "LEADERBOARD", Leaderboard(str(tmp_path / "scores.txt")))
+    monkeypatch.setattr(space_game, "RUN_LOG", ScoreLog(str(bad)))
+
+    top_scores, rank = space_game.save_and_rank(12, "ABC")
+    assert top_scores == [(12, "ABC")]
+    assert rank is None
+    assert "Could not rank score" in capsys.readouterr().err
@@ -0,0 +1,21 @@
+import pytest
+
+import score_stats
+
+
+@pytest.mark.parametrize("chunk_size", ["0", "-4096"])
+def test_chunk_size_below_one_is_rejected(tmp_path, monkeypatch, capsys, chunk_size):
+    log = tmp_path / "scores.txt"
+    log.write_text("9,JPH\n")
+    monkeypatch.setattr("sys.argv", ["score_stats.py", str(log), "--chunk-size", chunk_size])
+    with pytest.raises(SystemExit) as exit_info:
+        score_stats.main()
+    assert exit_info.value.code == 2
+    assert "--chunk-size must be at least 1" in capsys.readouterr().err
+
+
+def test_small_chunks_read_every_run(tmp_path):
+    log = tmp_path / "scores.txt"
+    log.write_text("9,JPH\n13,ABC\n20,XYZ\n")
+    runs = list(score_stats.iter_runs(str(log), chunk_size=1))
+    assert [score for score, _, _ in runs] == [9, 13, 20]
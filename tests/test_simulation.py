@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from simulation import Rules, play_round, random_pilot
+
+
+def baseline_round(seed, pilot, max_ticks, rules=Rules()):
+    """The round as space_game played it before World: plain lists and loops.
+
+    Ships are [x, y, speed] and lasers [x, y]; every laser clears all ships
+    in its 40 px box, then is used up. Same seeded RNG calls in the same order.
+    """
+    r = rules
+    rng = random.Random(seed)
+    ships, lasers = [], []
+
+    def spawn():
+        y = rng.randint(100, r.height - 100)
+        ships.append([r.width + rng.randint(50, 300), y, -ship_speed])
+
+    tick = score = 0
+    player_y = r.height // 2
+    player_speed, ship_speed, max_ships = r.player_speed, r.ship_speed, r.max_ships
+    last_enemy, last_player, last_count = 0, 0, 0
+    spawn_new = False
+    for _ in range(r.start_ships):
+        spawn()
+
+    while tick < max_ticks:
+        tick += 1
+        controls = pilot(None)
+        for _ in range(controls.fire):
+            assert len(lasers) < r.max_lasers   # The ring pool never drops a shot here
+            lasers.append([r.laser_start_x, player_y])
+        if controls.up:
+            player_y -= player_speed
+        if controls.down:
+            player_y += player_speed
+
+        if spawn_new and len(ships) < max_ships:
+            spawn()
+            spawn_new = False
+
+        for ship in ships:
+            ship[0] += ship[2]
+        over = any(ship[0] < 0 for ship in ships)   # Lasers still hit on this last tick
+
+        if lasers:
+            for laser in lasers:
+                laser[0] += r.laser_speed
+            lasers = [laser for laser in lasers if laser[0] < r.width]
+            kills = 0
+            for laser in lasers[:]:
+                hit = [ship for ship in ships
+                       if abs(laser[0] - ship[0]) < r.hit_half_size
+                       and abs(laser[1] - ship[1]) < r.hit_half_size]
+                if hit:
+                    ships = [ship for ship in ships if ship not in hit]
+                    lasers.remove(laser)
+                    kills += len(hit)
+            if kills:
+                score += kills
+                spawn_new = True
+
+        if score >= last_enemy + r.enemy_speed_up_every:
+            ship_speed += 1
+            last_enemy = score
+        if score >= last_player + r.player_speed_up_every:
+            player_speed += 1
+            last_player = score
+        if score >= last_count + r.enemy_count_up_every:
+            max_ships += 1
+            last_count = score
+        if over:
+            break
+    return score, tick
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_seeded_round_matches_baseline(seed):
+    fire_chance = 0.3 if seed % 2 else 0.9
+    world = play_round(seed, random_pilot(seed, fire_chance), max_ticks=5000)
+    expected = baseline_round(seed, random_pilot(seed, fire_chance), max_ticks=5000)
+    assert (world.score, world.tick) == expected
+
+
+def test_same_seed_same_round():
+    a = play_round(3, random_pilot(3), max_ticks=3000)
+    b = play_round(3, random_pilot(3), max_ticks=3000)
+    assert (a.score, a.tick, a.player_y) == (b.score, b.tick, b.player_y)
+
+
+@pytest.mark.parametrize("seed", range(0, 300, 7))
+def test_crowded_round_matches_baseline(seed):
+    # 20 ships and a shot every tick: kills on the game-over tick do happen
+    rules = Rules(start_ships=20)
+    world = play_round(seed, random_pilot(seed, 1.0), rules=rules, max_ticks=5000)
+    expected = baseline_round(seed, random_pilot(seed, 1.0), 5000, rules)
+    assert (world.score, world.tick) == expected
@@ -0,0 +1,46 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from simulation import World, Rules
+from space_env import ACTIONS, SpaceEnv, VectorSpaceEnv
+
+
+def step_both(rules, count=12, ticks=2000, fire_chance=0.5, seed=100):
+    """Step one VectorSpaceEnv and `count` Worlds with the same actions; check every tick."""
+    env = VectorSpaceEnv(count, rules)
+    obs, info = env.reset(seed)
+    worlds = [World(rules, s) for s in info["seed"].tolist()]
+    rng = np.random.default_rng(seed)
+    ended = 0
+    for _ in range(ticks):
+        fire = rng.random(count) < fire_chance
+        actions = np.where(fire, rng.integers(3, 6, count), rng.integers(0, 3, count))
+        obs, reward, terminated, truncated, info = env.step(actions)
+        for i, world in enumerate(worlds):
+            before = world.score
+            world.step(ACTIONS[actions[i]])
+            assert reward[i] == world.score - before
+            assert terminated[i] == world.over
+            assert info["tick"][i] == world.tick
+            assert info["score"][i] == world.score
+            if world.over:
+                ended += 1
+                assert info["final_score"][i] == world.score
+                worlds[i] = World(rules, int(env.seeds[i]))   # Reset with the seed the env picked
+            else:
+                single = SpaceEnv(rules)
+                single.world = world
+                assert np.allclose(single._observation(), obs[i])
+    return ended
+
+
+@pytest.mark.parametrize("fire_chance", [0.3, 0.9])
+def test_vector_env_plays_like_world(fire_chance):
+    assert step_both(Rules(), fire_chance=fire_chance) > 0
+
+
+def test_vector_env_drops_shots_like_a_full_laser_pool():
+    # A tiny pool fills up all the time, so shots get dropped the way LaserPool drops them
+    assert step_both(replace(Rules(), max_lasers=3), fire_chance=0.9) > 0
@@ -0,0 +1,123 @@
+import os
+import random
+import sys
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from laser_pool import LaserPool
+
+STEP_2 = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "step_2")
+
+
+@pytest.fixture
+def step2(monkeypatch):
+    """step_2's settings, game and sprites, imported by name like the tutorial does.
+
+    step_2 is a tutorial folder, not a package, so its modules are only on
+    the path (and in sys.modules) while a test uses them; afterwards
+    names like `settings` and `game` no longer point into step_2.
+    """
+    before = set(sys.modules)
+    monkeypatch.syspath_prepend(STEP_2)   # Taken off again after the test
+    import settings
+    import game
+    import sprites
+    yield SimpleNamespace(cfg=settings, find_hits=game.find_hits,
+                          find_group_hits=game.find_group_hits,
+                          Enemy=sprites.Enemy, LaserSprite=sprites.LaserSprite)
+    for name in set(sys.modules) - before:
+        path = getattr(sys.modules[name], "__file__", None) or ""
+        if os.path.dirname(os.path.abspath(path)) == STEP_2:
+            del sys.modules[name]
+
+
+def rect_loop(cfg, lasers, enemies):
+    """The old step_2 loop: each laser's rect against each enemy's bbox, one hit per laser."""
+    half_thick = max(1, cfg.LASER_THICKNESS // 2)
+    left = list(enemies)
+    hits = []
+    for slot in lasers.live_slots().tolist():
+        beam = pygame.Rect(int(lasers.x[slot]), int(lasers.y[slot]) - half_thick,
+                           cfg.LASER_WIDTH, cfg.LASER_THICKNESS)
+        for e in left:
+            if beam.colliderect(e.bbox):
+                hits.append((slot, e))
+                left.remove(e)
+                break
+    return hits
+
+
+def layout(step2, rng, lasers, enemies):
+    cfg = step2.cfg
+    pool = LaserPool(cfg.MAX_LASERS, speed=cfg.LASER_SPEED_X)
+    for _ in range(lasers):
+        pool.fire(rng.randrange(0, 800), rng.randrange(0, 500))
+    for slot in rng.sample(range(lasers), lasers // 5):   # Some slots already used up
+        pool.kill(slot)
+    ships = []
+    for _ in range(enemies):
+        e = step2.Enemy(y=rng.randrange(0, 500))
+        e.x = rng.randrange(0, 800)
+        ships.append(e)
+    return pool, ships
+
+
+@pytest.mark.parametrize("lasers, enemies", [(3, 4), (30, 60), (120, 200)])
+def test_find_hits_matches_rect_loop(step2, lasers, enemies):
+    # The biggest layout has enough pairs for the kernel's spatial hash
+    rng = random.Random(lasers * 1000 + enemies)
+    for _ in range(30):
+        pool, ships = layout(step2, rng, lasers, enemies)
+        assert step2.find_hits(pool, ships) == rect_loop(step2.cfg, pool, ships)
+
+
+def groups(step2, lasers, enemies):
+    """The sprite groups the round keeps: live beams in firing order, and the enemies."""
+    beams = pygame.sprite.Group()
+    for slot in lasers.live_slots().tolist():
+        beam = step2.LaserSprite(slot)
+        beam.place(lasers.x[slot], lasers.y[slot])
+        beams.add(beam)
+    return beams, pygame.sprite.Group(enemies)
+
+
+@pytest.mark.parametrize("lasers, enemies", [(3, 4), (30, 60)])
+def test_group_hits_match_find_hits(step2, lasers, enemies):
+    rng = random.Random(lasers * 1000 + enemies)
+    for _ in range(30):
+        pool, ships = layout(step2, rng, lasers, enemies)
+        beams, group = groups(step2, pool, ships)
+        assert step2.find_group_hits(beams, group) == step2.find_hits(pool, ships)
+
+
+def test_pixel_perfect_hits_skip_the_empty_corners(step2, monkeypatch):
+    monkeypatch.setattr(step2.cfg, "PIXEL_PERFECT_HITS", True)
+    enemy = step2.Enemy(y=200)
+    enemy.x = 400
+    enemy.rect.topleft = (400 - enemy.ANCHOR[0], 200 - enemy.ANCHOR[1])
+    pool = LaserPool(4)
+    pool.fire(380, 200)   # Through the middle of the saucer
+    pool.fire(360, 184)   # Inside the bounding box, left of the dome and above the body
+    beams, group = groups(step2, pool, [enemy])
+    assert [slot for slot, _ in step2.find_group_hits(beams, group)] == [0]
+    pool.kill(0)
+    beams, group = groups(step2, pool, [enemy])
+    assert step2.find_group_hits(beams, group) == []
+    assert [slot for slot, _ in step2.find_hits(pool, [enemy])] == [1]   # Box test hits it
+
+
+def test_no_lasers_or_no_enemies(step2):
+    rng = random.Random(1)
+    pool, ships = layout(step2, rng, 5, 5)
+    assert step2.find_hits(LaserPool(8), ships) == []
+    assert step2.find_hits(pool, []) == []
+
+
+def test_step2_names_do_not_leak():
+    # Runs after the tests above, once their step_2 imports were cleaned up
+    assert STEP_2 not in sys.path
+    for name in ("settings", "game", "sprites", "ui"):
+        module = sys.modules.get(name)
+        assert module is None or os.path.dirname(os.path.abspath(module.__file__)) != STEP_2
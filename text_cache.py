@@ -0,0 +1,52 @@
+# ------------------- IMPORTS ------------------- #
+from collections import OrderedDict   # Keeps entries in least → most recently used order
+
+
+# ------------------- TEXT CACHE ------------------- #
+class TextCache:
+    """Rendered text surfaces, keyed by (font, text, color, antialias).
+
+    `render` only calls font.render the first time a piece of text is seen;
+    after that the same Surface is returned until it falls out of the cache.
+    When more than `max_entries` surfaces are stored, the least recently used
+    one is dropped (e.g. old score values).
+
+    Returned surfaces are shared: blit them, but don't draw on them.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def render(self, font, text, color, antialias=True):
+        """Same as font.render(text, antialias, color), but cached."""
+        key = (font, text, tuple(color), antialias)
+        surf = self.entries.get(key)
+        if surf is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self.entries[key] = surf
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self.entries.clear()
+
+
+# One cache shared by every screen of the game (HUD, initials, leaderboard).
+TEXT_CACHE = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    """Render text through the shared cache."""
+    return TEXT_CACHE.render(font, text, color, antialias)
@@ -0,0 +1,34 @@
+# ------------------- FIXED TIMESTEP ------------------- #
+class FixedTimestep:
+    """Turns uneven frame times into a steady number of simulation ticks.
+
+    Real time is collected in an accumulator and paid out in fixed `dt`
+    slices, so the game runs at the same speed no matter how fast frames are
+    drawn. A slow frame just means more ticks before the next draw (frames are
+    dropped, the game does not slow down). `alpha` is the leftover time as a
+    fraction of a tick, used to blend the previous tick into the current one
+    for smooth drawing.
+    """
+
+    def __init__(self, tick_rate=60, max_frame_time=0.25):
+        self.dt = 1.0 / tick_rate
+        # Cap on one frame's time so a very long stall (window drag,
+        # breakpoint) does not trigger hundreds of catch-up ticks.
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+
+    def advance(self, frame_time):
+        """Add one frame's time (seconds). Returns how many ticks to run now."""
+        self.accumulator += min(frame_time, self.max_frame_time)
+        ticks = int(self.accumulator / self.dt)
+        self.accumulator -= ticks * self.dt
+        return ticks
+
+    @property
+    def alpha(self):
+        """Blend factor for drawing: 0.0 = the previous tick, 1.0 = the current tick.
+
+        The positions(alpha) / player_y_at(alpha) helpers interpolate between
+        those two ticks, so the picture trails the simulation by under a tick.
+        """
+        return self.accumulator / self.dt